@@ -3,6 +3,8 @@ UN WebTV Analysis Platform - Main Application
 Streamlit multi-page application for processing and analyzing UN WebTV sessions.
 """
 
+import importlib
+
 import streamlit as st
 from loguru import logger
 
@@ -23,7 +25,7 @@ st.set_page_config(
 )
 
 # Custom CSS
-st.markdown("""
+CUSTOM_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -54,15 +56,73 @@ st.markdown("""
         border-left: 4px solid #1E88E5;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Home page cards
+HOME_CARD_1 = """
+<div class="metric-card">
+    <h3>🎯 What We Do</h3>
+    <p>Automatically transcribe and analyze UN WebTV sessions with:</p>
+    <ul>
+        <li>Speaker identification</li>
+        <li>Entity extraction</li>
+        <li>SDG mapping</li>
+        <li>AI-powered chat</li>
+    </ul>
+</div>
+"""
+
+HOME_CARD_2 = """
+<div class="metric-card">
+    <h3>⚡ Features</h3>
+    <ul>
+        <li>Automatic transcription</li>
+        <li>Speaker diarization</li>
+        <li>Country & topic extraction</li>
+        <li>Semantic search</li>
+        <li>Export capabilities</li>
+    </ul>
+</div>
+"""
+
+HOME_CARD_3 = """
+<div class="metric-card">
+    <h3>🚀 Get Started</h3>
+    <p>1. Paste a UN WebTV URL<br>
+    2. Let AI process it<br>
+    3. Chat with the data<br>
+    4. Export results</p>
+</div>
+"""
+
+# Home page statistics: (label, value, delta)
+HOME_STATS = (
+    ("Sessions Processed", "0", "Ready to start"),
+    ("Total Speakers Identified", "0", None),
+    ("Countries Tracked", "0", None),
+    ("Chat Interactions", "0", None),
+)
+
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
+
+@st.cache_resource
+def _load_page(name: str):
+    """Import a page module once per process and reuse it across reruns."""
+    return importlib.import_module(f"pages.{name}")
+
 
 # Sidebar navigation
 st.sidebar.title("🇺🇳 UN WebTV Analysis")
 st.sidebar.markdown("---")
 
-page = st.sidebar.radio(
+if "page" not in st.session_state:
+    st.session_state.page = "🏠 Home"
+
+st.sidebar.radio(
     "Navigation",
-    ["🏠 Home", "➕ New Analysis", "📚 Catalog", "📊 Visualizations", "ℹ️ About"]
+    ["🏠 Home", "➕ New Analysis", "📚 Catalog", "📊 Visualizations", "ℹ️ About"],
+    key="page"
 )
 
 st.sidebar.markdown("---")
@@ -71,85 +131,23 @@ st.sidebar.success("✅ Azure OpenAI: Connected")
 st.sidebar.success("✅ Cosmos DB: Connected")
 st.sidebar.success("✅ Blob Storage: Connected")
 
-# Main content based on selected page
-if page == "🏠 Home":
+
+def _show_home():
+    """Render the Home page."""
     st.markdown('<div class="main-header">🇺🇳 UN WebTV Analysis Platform</div>', unsafe_allow_html=True)
     st.markdown('<div class="sub-header">AI-powered analysis of United Nations proceedings</div>', unsafe_allow_html=True)
 
     col1, col2, col3 = st.columns(3)
-
-    with col1:
-        st.markdown("""
-        <div class="metric-card">
-            <h3>🎯 What We Do</h3>
-            <p>Automatically transcribe and analyze UN WebTV sessions with:</p>
-            <ul>
-                <li>Speaker identification</li>
-                <li>Entity extraction</li>
-                <li>SDG mapping</li>
-                <li>AI-powered chat</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
-
-    with col2:
-        st.markdown("""
-        <div class="metric-card">
-            <h3>⚡ Features</h3>
-            <ul>
-                <li>Automatic transcription</li>
-                <li>Speaker diarization</li>
-                <li>Country & topic extraction</li>
-                <li>Semantic search</li>
-                <li>Export capabilities</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
-
-    with col3:
-        st.markdown("""
-        <div class="metric-card">
-            <h3>🚀 Get Started</h3>
-            <p>1. Paste a UN WebTV URL<br>
-            2. Let AI process it<br>
-            3. Chat with the data<br>
-            4. Export results</p>
-        </div>
-        """, unsafe_allow_html=True)
+    col1.markdown(HOME_CARD_1, unsafe_allow_html=True)
+    col2.markdown(HOME_CARD_2, unsafe_allow_html=True)
+    col3.markdown(HOME_CARD_3, unsafe_allow_html=True)
 
     st.markdown("---")
 
     st.subheader("📊 Platform Statistics")
 
-    col1, col2, col3, col4 = st.columns(4)
-
-    with col1:
-        st.metric(
-            label="Sessions Processed",
-            value="0",
-            delta="Ready to start"
-        )
-
-    with col2:
-        st.metric(
-            label="Total Speakers Identified",
-            value="0",
-            delta=None
-        )
-
-    with col3:
-        st.metric(
-            label="Countries Tracked",
-            value="0",
-            delta=None
-        )
-
-    with col4:
-        st.metric(
-            label="Chat Interactions",
-            value="0",
-            delta=None
-        )
+    for col, (label, value, delta) in zip(st.columns(len(HOME_STATS)), HOME_STATS):
+        col.metric(label=label, value=value, delta=delta)
 
     st.markdown("---")
 
@@ -157,19 +155,9 @@ if page == "🏠 Home":
     👉 **Ready to start?** Click on **"➕ New Analysis"** in the sidebar to process your first UN WebTV session!
     """)
 
-elif page == "➕ New Analysis":
-    from pages import new_analysis
-    new_analysis.show()
-
-elif page == "📚 Catalog":
-    from pages import catalog
-    catalog.show()
-
-elif page == "📊 Visualizations":
-    from pages import visualizations
-    visualizations.show()
 
-elif page == "ℹ️ About":
+def _show_about():
+    """Render the About page."""
     st.markdown('<div class="main-header">About This Platform</div>', unsafe_allow_html=True)
 
     st.markdown("""
@@ -237,6 +225,18 @@ elif page == "ℹ️ About":
         - Press conferences
         """)
 
+
+# Main content based on selected page
+PAGES = {
+    "🏠 Home": _show_home,
+    "➕ New Analysis": lambda: _load_page("new_analysis").show(),
+    "📚 Catalog": lambda: _load_page("catalog").show(),
+    "📊 Visualizations": lambda: _load_page("visualizations").show(),
+    "ℹ️ About": _show_about,
+}
+
+PAGES[st.session_state.page]()
+
 # Footer
 st.sidebar.markdown("---")
 st.sidebar.caption("© 2025 UN OSAA - UN WebTV Analysis Platform")
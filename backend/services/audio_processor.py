@@ -5,13 +5,56 @@ Downloads video from UN WebTV and extracts audio for transcription.
 
 import os
 import asyncio
+import copy
+import json
+import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import (
+    Optional, Dict, Any, AsyncIterable, AsyncIterator, Awaitable, Callable,
+    Iterable, List, TypeVar, Union
+)
+import aiofiles.os as aos
 import yt_dlp
 from loguru import logger
+from backend.utils.ttl_cache import TTLCache
 from config import settings
 
+__all__ = ["AudioProcessor", "audio_processor"]
+
+T = TypeVar("T")
+
+BYTES_PER_MB = 1048576
+
+# Files at or above this size are split before transcription
+SPLIT_THRESHOLD_MB = 20
+SPLIT_THRESHOLD_BYTES = SPLIT_THRESHOLD_MB * BYTES_PER_MB
+
+# Transcription models work on 16 kHz mono speech, so chunks are encoded to
+# low-bitrate Opus (in an Ogg container, which the API accepts) before upload
+WHISPER_CODEC_ARGS = (
+    '-ac', '1',
+    '-ar', '16000',
+    '-c:a', 'libopus',
+    '-b:a', '24k',
+    '-application', 'voip',
+    '-threads', '1',  # Opus encode is single-threaded; avoid idle workers
+    # Without bitexact the Ogg muxer picks a random stream serial per run, so
+    # re-segmenting the same audio would never hit the transcription cache
+    '-fflags', '+bitexact',
+    '-flags:a', '+bitexact',
+)
+
+# Containers the transcription API accepts for upload
+API_AUDIO_EXTENSIONS = frozenset({
+    '.flac', '.m4a', '.mp3', '.mp4', '.mpeg', '.mpga', '.oga', '.ogg', '.wav', '.webm'
+})
+
+# Codec-native files yt-dlp may write, and an accepted container their audio
+# stream can be copied into unchanged
+_REMUX_CONTAINERS = {'.opus': '.ogg', '.aac': '.m4a', '.alac': '.m4a'}
+
 
 class AudioProcessor:
     """Service for downloading and processing audio from UN WebTV."""
@@ -19,8 +62,30 @@ class AudioProcessor:
     def __init__(self):
         """Initialize audio processor."""
         self.temp_dir = Path(settings.TEMP_AUDIO_DIR)
+
+        # Downloads and chunks are throwaway, so keep them in RAM when allowed
+        shm_dir = Path('/dev/shm')
+        if settings.USE_TMPFS and shm_dir.is_dir() and os.access(shm_dir, os.W_OK):
+            self.temp_dir = shm_dir / self.temp_dir.name
+
         self.temp_dir.mkdir(parents=True, exist_ok=True)
 
+        # Dedicated pool so downloads/probes don't contend with the loop's
+        # shared default executor (ffmpeg runs as a native async subprocess)
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=settings.AUDIO_IO_WORKERS,
+            thread_name_prefix='audio-io'
+        )
+
+        # URL -> yt-dlp info dict; info dicts are large, so only a few are kept
+        self._info_cache = TTLCache(
+            maxsize=settings.YTDLP_INFO_CACHE_MAX,
+            ttl=settings.YTDLP_INFO_CACHE_TTL_SECONDS
+        )
+
+        # Audio path -> size in bytes, recorded when the download is verified
+        self._sizes: Dict[str, int] = {}
+
     async def download_and_extract_audio(
         self,
         video_url: str,
@@ -39,38 +104,46 @@ class AudioProcessor:
         try:
             logger.info(f"Starting audio download for session: {session_id}")
 
-            # Output path for audio
-            audio_path = self.temp_dir / f"{session_id}.mp3"
-
             # Configure yt-dlp options
             ydl_opts = {
-                'format': 'bestaudio/best',
+                # Audio-only formats; m4a and webm upload as they are
+                'format': 'bestaudio[ext=m4a]/bestaudio[ext=webm]/bestaudio',
                 'outtmpl': str(self.temp_dir / f"{session_id}.%(ext)s"),
                 'quiet': True,
                 'no_warnings': True,
                 'extract_audio': True,
+                'concurrent_fragment_downloads': settings.YTDLP_CONCURRENT_FRAGMENTS,
+                'http_chunk_size': settings.YTDLP_HTTP_CHUNK_SIZE_MB << 20,
+                'cachedir': settings.YTDLP_CACHE_DIR,
                 'postprocessors': [{
                     'key': 'FFmpegExtractAudio',
-                    'preferredcodec': 'mp3',
-                    'preferredquality': '128',  # 128 kbps - good quality, smaller size
+                    'preferredcodec': 'best',  # Keep source codec, no re-encode
                 }],
             }
 
+            if settings.YTDLP_USE_ARIA2C and shutil.which('aria2c'):
+                ydl_opts['external_downloader'] = 'aria2c'
+                ydl_opts['external_downloader_args'] = ['-x', '8', '-s', '8', '-k', '1M']
+
             # Download in executor to avoid blocking
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             await loop.run_in_executor(
-                None,
+                self._io_pool,
                 self._download_with_ytdlp,
                 video_url,
                 ydl_opts
             )
 
-            # Verify file exists
-            if audio_path.exists():
-                file_size_mb = audio_path.stat().st_size / (1024 * 1024)
-                logger.info(
-                    f"Audio downloaded successfully: {session_id} "
-                    f"({file_size_mb:.2f} MB)"
+            # Verify file exists (extension depends on the source codec)
+            audio_path = self._find_audio_file(session_id)
+            if audio_path:
+                audio_path = await self._to_api_container(audio_path)
+                file_size = audio_path.stat().st_size
+                self._sizes[str(audio_path)] = file_size
+                logger.opt(lazy=True).info(
+                    "Audio downloaded successfully: {} ({:.2f} MB)",
+                    lambda: session_id,
+                    lambda: file_size / BYTES_PER_MB
                 )
                 return str(audio_path)
             else:
@@ -81,6 +154,166 @@ class AudioProcessor:
             logger.error(f"Failed to download audio for {session_id}: {str(e)}")
             return None
 
+    async def download_and_segment_audio(
+        self,
+        video_url: str,
+        session_id: str,
+        chunk_duration_minutes: int = 10
+    ) -> Optional[list[str]]:
+        """
+        Stream audio from yt-dlp straight into the ffmpeg segmenter.
+
+        The downloaded bytes are piped between the two processes, so the full
+        audio file never lands on disk; only the transcription chunks do.
+
+        Args:
+            video_url: UN WebTV video URL
+            session_id: Session identifier
+            chunk_duration_minutes: Duration of each chunk in minutes
+
+        Returns:
+            List of chunk paths or None if streaming failed (callers should
+            fall back to download_and_extract_audio)
+        """
+        chunks_dir = self.temp_dir / f"{session_id}_chunks"
+        chunks_dir.mkdir(parents=True, exist_ok=True)
+
+        ytdlp_cmd = [
+            'yt-dlp',
+            '--quiet',
+            '--no-warnings',
+            '-f', 'bestaudio/best',
+            '--concurrent-fragments', str(settings.YTDLP_CONCURRENT_FRAGMENTS),
+            '-o', '-',
+            video_url
+        ]
+        ffmpeg_cmd = [
+            'ffmpeg',
+            '-i', 'pipe:0',
+            '-vn',
+            *WHISPER_CODEC_ARGS,
+            '-f', 'segment',
+            '-segment_time', str(chunk_duration_minutes * 60),
+            '-reset_timestamps', '1',
+            '-y',
+            str(chunks_dir / "chunk_%03d.ogg")
+        ]
+
+        downloader = segmenter = None
+        try:
+            logger.info(f"Streaming audio into segmenter for session: {session_id}")
+
+            read_fd, write_fd = os.pipe()
+            try:
+                downloader = await asyncio.create_subprocess_exec(
+                    *ytdlp_cmd,
+                    stdout=write_fd,
+                    stderr=asyncio.subprocess.PIPE
+                )
+                segmenter = await asyncio.create_subprocess_exec(
+                    *ffmpeg_cmd,
+                    stdin=read_fd,
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.PIPE
+                )
+            finally:
+                # The children hold their own copies of the pipe ends
+                os.close(read_fd)
+                os.close(write_fd)
+
+            (_, download_err), (_, segment_err) = await asyncio.gather(
+                downloader.communicate(),
+                segmenter.communicate()
+            )
+
+        except BaseException as e:
+            # A failed spawn or a cancelled call (e.g. an abandoned session)
+            # would otherwise leave the children streaming into chunks_dir
+            for process in (downloader, segmenter):
+                if process is not None:
+                    await self._kill_process(process)
+            await self._discard_chunks_dir(chunks_dir)
+            if not isinstance(e, Exception):
+                raise
+            logger.warning(f"Streaming segmentation unavailable for {session_id}: {str(e)}")
+            return None
+
+        if downloader.returncode != 0 or segmenter.returncode != 0:
+            # A failed download also fails ffmpeg's input, so it is the cause
+            failed_err = download_err if downloader.returncode != 0 else segment_err
+            logger.warning(
+                f"Streaming segmentation failed for {session_id} "
+                f"(yt-dlp: {downloader.returncode}, ffmpeg: {segmenter.returncode}): "
+                f"{failed_err.decode(errors='ignore')[-500:]}"
+            )
+            await self._discard_chunks_dir(chunks_dir)
+            return None
+
+        chunk_paths = [str(p) for p in sorted(chunks_dir.glob("chunk_*.ogg"))]
+        if not chunk_paths:
+            logger.warning(f"Streaming segmentation produced no chunks: {session_id}")
+            await self._discard_chunks_dir(chunks_dir)
+            return None
+
+        logger.info(f"Streamed {len(chunk_paths)} audio chunks for session: {session_id}")
+        return chunk_paths
+
+    async def _to_api_container(self, audio_path: Path) -> Path:
+        """
+        Make sure a downloaded file is in a container the transcription API accepts.
+
+        Codec-native files such as .opus are remuxed without re-encoding; any
+        other container is re-encoded to the Opus format used for chunks.
+
+        Args:
+            audio_path: Downloaded audio file
+
+        Returns:
+            Path of the file to upload, which replaces the original
+
+        Raises:
+            RuntimeError: If ffmpeg fails
+        """
+        if audio_path.suffix in API_AUDIO_EXTENSIONS:
+            return audio_path
+
+        remux_suffix = _REMUX_CONTAINERS.get(audio_path.suffix)
+        codec_args = ('-c:a', 'copy') if remux_suffix else WHISPER_CODEC_ARGS
+        target = audio_path.with_suffix(remux_suffix or '.ogg')
+
+        proc = await asyncio.create_subprocess_exec(
+            'ffmpeg', '-v', 'error', '-y',
+            '-i', str(audio_path),
+            '-vn',
+            *codec_args,
+            str(target),
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+        _, stderr = await proc.communicate()
+        if proc.returncode != 0:
+            raise RuntimeError(
+                f"ffmpeg could not convert {audio_path.name}: {stderr.decode(errors='ignore')[-500:]}"
+            )
+
+        await aos.remove(str(audio_path))
+        logger.info(f"Converted {audio_path.name} to {target.name} for upload")
+        return target
+
+    @staticmethod
+    async def _kill_process(process: asyncio.subprocess.Process) -> None:
+        """Kill a child process if it is still running and reap it."""
+        if process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+        await process.wait()
+
+    async def _discard_chunks_dir(self, chunks_dir: Path) -> None:
+        """Delete a chunks directory and everything written into it."""
+        await asyncio.to_thread(shutil.rmtree, chunks_dir, ignore_errors=True)
+
     def _download_with_ytdlp(self, url: str, options: Dict[str, Any]) -> None:
         """
         Download video using yt-dlp (synchronous).
@@ -90,15 +323,34 @@ class AudioProcessor:
             options: yt-dlp options
         """
         with yt_dlp.YoutubeDL(options) as ydl:
-            ydl.download([url])
+            info = self._get_cached_info(url)
+            if info is None:
+                info = ydl.extract_info(url, download=False)
+                self._info_cache.put(url, copy.deepcopy(info))
+            else:
+                logger.debug(f"Reusing cached stream info for: {url}")
+
+            ydl.process_ie_result(info, download=True)
 
-    def _get_duration_sync(self, audio_path: str) -> float:
-        """Synchronous helper to get audio duration using ffprobe."""
+    def _get_cached_info(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached yt-dlp info for a URL if still fresh."""
+        info = self._info_cache.get(url)
+        return None if info is None else copy.deepcopy(info)
+
+    def _find_audio_file(self, session_id: str) -> Optional[Path]:
+        """Locate the downloaded audio file for a session, whatever its extension."""
+        for candidate in sorted(self.temp_dir.glob(f"{session_id}.*")):
+            if candidate.is_file() and candidate.suffix not in ('.part', '.ytdl'):
+                return candidate
+        return None
+
+    def _probe_sync(self, audio_path: str) -> tuple[int, float]:
+        """Synchronous helper to get audio size and duration in one ffprobe call."""
         cmd = [
             'ffprobe',
             '-v', 'error',
-            '-show_entries', 'format=duration',
-            '-of', 'default=noprint_wrappers=1:nokey=1',
+            '-show_entries', 'format=duration,size',
+            '-of', 'json',
             audio_path
         ]
         result = subprocess.run(
@@ -107,7 +359,11 @@ class AudioProcessor:
             stderr=subprocess.PIPE,
             text=True
         )
-        return float(result.stdout.strip())
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip() or f"ffprobe exited with {result.returncode}")
+
+        probe_format = json.loads(result.stdout).get('format', {})
+        return int(probe_format.get('size', 0)), float(probe_format.get('duration', 0))
 
     async def get_audio_duration(self, audio_path: str) -> int:
         """
@@ -120,14 +376,17 @@ class AudioProcessor:
             Duration in seconds
         """
         try:
-            loop = asyncio.get_event_loop()
-            duration_seconds = await loop.run_in_executor(
-                None,
-                self._get_duration_sync,
+            loop = asyncio.get_running_loop()
+            _, duration_seconds = await loop.run_in_executor(
+                self._io_pool,
+                self._probe_sync,
                 audio_path
             )
 
-            logger.info(f"Audio duration: {duration_seconds:.2f} seconds")
+            logger.opt(lazy=True).info(
+                "Audio duration: {:.2f} seconds",
+                lambda: duration_seconds
+            )
             return int(duration_seconds)
 
         except Exception as e:
@@ -145,8 +404,9 @@ class AudioProcessor:
             True if deleted successfully
         """
         try:
-            if os.path.exists(audio_path):
-                os.remove(audio_path)
+            self._sizes.pop(audio_path, None)
+            if await aos.path.exists(audio_path):
+                await aos.remove(audio_path)
                 logger.info(f"Cleaned up audio file: {audio_path}")
                 return True
             return False
@@ -166,19 +426,23 @@ class AudioProcessor:
             True if valid
         """
         try:
-            if not os.path.exists(audio_path):
-                logger.error(f"Audio file does not exist: {audio_path}")
+            # Read size and duration with a single ffprobe call
+            loop = asyncio.get_running_loop()
+            try:
+                file_size, duration_seconds = await loop.run_in_executor(
+                    self._io_pool,
+                    self._probe_sync,
+                    audio_path
+                )
+            except Exception as e:
+                logger.error(f"Audio file could not be probed: {audio_path} ({str(e)})")
                 return False
 
-            # Check file size
-            file_size = os.path.getsize(audio_path)
             if file_size == 0:
                 logger.error(f"Audio file is empty: {audio_path}")
                 return False
 
-            # Validate using ffprobe
-            duration = await self.get_audio_duration(audio_path)
-
+            duration = int(duration_seconds)
             if duration == 0:
                 logger.error(f"Audio file has no content: {audio_path}")
                 return False
@@ -190,7 +454,7 @@ class AudioProcessor:
             logger.error(f"Audio validation failed: {str(e)}")
             return False
 
-    def get_audio_path(self, session_id: str) -> str:
+    def get_audio_path(self, session_id: str) -> Optional[str]:
         """
         Get path for audio file.
 
@@ -198,9 +462,118 @@ class AudioProcessor:
             session_id: Session identifier
 
         Returns:
-            Full path to audio file
+            Full path to the downloaded audio file or None if not present
+        """
+        audio_path = self._find_audio_file(session_id)
+        return str(audio_path) if audio_path else None
+
+    async def needs_splitting(self, audio_path: str) -> bool:
+        """
+        Check whether an audio file is too large to transcribe in one request.
+
+        Args:
+            audio_path: Path to the audio file
+
+        Returns:
+            True if the file should be split into chunks
+        """
+        file_size = self._sizes.get(audio_path)
+        if file_size is None:
+            file_size = await aos.path.getsize(audio_path)
+        # If file is small enough (<20MB), don't split it
+        if file_size < SPLIT_THRESHOLD_BYTES:
+            logger.opt(lazy=True).info(
+                "Audio file is small enough ({:.2f}MB), no splitting needed",
+                lambda: file_size / BYTES_PER_MB
+            )
+            return False
+
+        logger.opt(lazy=True).info(
+            "Splitting large audio file ({:.2f}MB) into chunks",
+            lambda: file_size / BYTES_PER_MB
+        )
+        return True
+
+    async def iter_chunks(
+        self,
+        audio_path: str,
+        chunk_duration_minutes: int = 10
+    ) -> AsyncIterator[str]:
+        """
+        Split audio into chunks, yielding each chunk as soon as ffmpeg closes it.
+
+        This lets callers start transcribing early chunks while later ones
+        are still being cut.
+
+        Args:
+            audio_path: Path to the audio file to split
+            chunk_duration_minutes: Duration of each chunk in minutes
+
+        Yields:
+            Paths to audio chunk files, in order
+
+        Raises:
+            subprocess.CalledProcessError: If ffmpeg fails
         """
-        return str(self.temp_dir / f"{session_id}.mp3")
+        # Create chunks directory
+        audio_file = Path(audio_path)
+        chunks_dir = audio_file.parent / f"{audio_file.stem}_chunks"
+        chunks_dir.mkdir(parents=True, exist_ok=True)
+
+        chunk_duration_seconds = chunk_duration_minutes * 60
+
+        logger.info(f"Splitting audio into chunks of {chunk_duration_minutes}min each")
+
+        # Split in a single pass with the segment muxer, encoding straight to
+        # the transcription codec so each chunk upload is as small as possible.
+        # The segment list on stdout announces each chunk once it is complete.
+        cmd = [
+            'ffmpeg',
+            '-v', 'error',
+            '-i', audio_path,
+            '-vn',
+            *WHISPER_CODEC_ARGS,
+            '-f', 'segment',
+            '-segment_time', str(chunk_duration_seconds),
+            '-segment_list', 'pipe:1',
+            '-segment_list_type', 'flat',
+            '-reset_timestamps', '1',
+            '-y',  # Overwrite output files
+            str(chunks_dir / "chunk_%03d.ogg")
+        ]
+
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+
+        try:
+            chunk_count = 0
+            async for line in proc.stdout:
+                chunk_name = Path(line.decode().strip()).name
+                if not chunk_name:
+                    continue
+
+                chunk_path = chunks_dir / chunk_name
+                chunk_count += 1
+                logger.opt(lazy=True).info(
+                    "Created chunk {}: {} ({:.2f}MB)",
+                    lambda: chunk_count,
+                    lambda: chunk_path.name,
+                    lambda: chunk_path.stat().st_size / BYTES_PER_MB
+                )
+                yield str(chunk_path)
+
+            stderr = await proc.stderr.read()
+            await proc.wait()
+            if proc.returncode != 0:
+                raise subprocess.CalledProcessError(proc.returncode, cmd, stderr=stderr)
+
+        finally:
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
 
     async def split_audio_file(
         self,
@@ -218,64 +591,17 @@ class AudioProcessor:
             List of paths to audio chunk files
         """
         try:
-            file_size_mb = os.path.getsize(audio_path) / (1024 * 1024)
-
-            # If file is small enough (<20MB), don't split it
-            if file_size_mb < 20:
-                logger.info(f"Audio file is small enough ({file_size_mb:.2f}MB), no splitting needed")
+            if not await self.needs_splitting(audio_path):
                 return [audio_path]
 
-            logger.info(f"Splitting large audio file ({file_size_mb:.2f}MB) into chunks")
-
-            # Create chunks directory
-            audio_file = Path(audio_path)
-            chunks_dir = audio_file.parent / f"{audio_file.stem}_chunks"
-            chunks_dir.mkdir(parents=True, exist_ok=True)
-
-            # Get total duration
-            duration_seconds = await self.get_audio_duration(audio_path)
-            chunk_duration_seconds = chunk_duration_minutes * 60
-
-            # Calculate number of chunks needed
-            num_chunks = (duration_seconds + chunk_duration_seconds - 1) // chunk_duration_seconds
-
-            logger.info(f"Splitting {duration_seconds}s audio into {num_chunks} chunks of {chunk_duration_minutes}min each")
-
-            chunk_paths = []
-
-            # Split using ffmpeg
-            for i in range(num_chunks):
-                start_time = i * chunk_duration_seconds
-                chunk_path = chunks_dir / f"chunk_{i:03d}.mp3"
-
-                cmd = [
-                    'ffmpeg',
-                    '-i', audio_path,
-                    '-ss', str(start_time),
-                    '-t', str(chunk_duration_seconds),
-                    '-acodec', 'libmp3lame',
-                    '-ab', '128k',
-                    '-y',  # Overwrite output file
-                    str(chunk_path)
-                ]
-
-                loop = asyncio.get_event_loop()
-                await loop.run_in_executor(
-                    None,
-                    lambda: subprocess.run(
-                        cmd,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        check=True
-                    )
-                )
+            chunk_paths = [
+                chunk_path
+                async for chunk_path in self.iter_chunks(audio_path, chunk_duration_minutes)
+            ]
 
-                if chunk_path.exists():
-                    chunk_size_mb = chunk_path.stat().st_size / (1024 * 1024)
-                    logger.info(f"Created chunk {i+1}/{num_chunks}: {chunk_path.name} ({chunk_size_mb:.2f}MB)")
-                    chunk_paths.append(str(chunk_path))
-                else:
-                    logger.error(f"Failed to create chunk {i+1}/{num_chunks}")
+            if not chunk_paths:
+                logger.error("Segmenting produced no chunks")
+                return [audio_path]
 
             return chunk_paths
 
@@ -299,16 +625,15 @@ class AudioProcessor:
             first_chunk = Path(chunk_paths[0])
             chunks_dir = first_chunk.parent
 
-            # Delete all chunk files
-            for chunk_path in chunk_paths:
-                if os.path.exists(chunk_path):
-                    os.remove(chunk_path)
-                    logger.debug(f"Deleted chunk: {chunk_path}")
+            # Delete all chunk files in parallel
+            await asyncio.gather(*(
+                self._remove_chunk(chunk_path) for chunk_path in chunk_paths
+            ))
 
             # Remove chunks directory if empty
-            if chunks_dir.exists() and chunks_dir.name.endswith('_chunks'):
+            if chunks_dir.name.endswith('_chunks') and await aos.path.exists(str(chunks_dir)):
                 try:
-                    chunks_dir.rmdir()
+                    await aos.rmdir(str(chunks_dir))
                     logger.info(f"Removed chunks directory: {chunks_dir}")
                 except OSError:
                     logger.warning(f"Chunks directory not empty: {chunks_dir}")
@@ -316,6 +641,61 @@ class AudioProcessor:
         except Exception as e:
             logger.error(f"Failed to cleanup chunks: {str(e)}")
 
+    async def transcribe_chunks(
+        self,
+        chunk_paths: Union[Iterable[str], AsyncIterable[str]],
+        transcriber: Callable[[int, str], Awaitable[T]],
+        concurrency: Optional[int] = None
+    ) -> List[T]:
+        """
+        Transcribe audio chunks concurrently with bounded parallelism.
+
+        When chunk_paths is an async iterable (e.g. iter_chunks), each chunk
+        is submitted as soon as it is produced.
+
+        Args:
+            chunk_paths: Ordered chunk file paths, sync or async
+            transcriber: Coroutine function taking (chunk_index, chunk_path)
+            concurrency: Maximum in-flight transcriptions (default from settings)
+
+        Returns:
+            Transcriber results in chunk order
+        """
+        semaphore = asyncio.Semaphore(concurrency or settings.WHISPER_CONCURRENCY)
+
+        async def transcribe_one(index: int, chunk_path: str) -> T:
+            async with semaphore:
+                return await transcriber(index, chunk_path)
+
+        tasks: List[asyncio.Task] = []
+        try:
+            if isinstance(chunk_paths, AsyncIterable):
+                async for chunk_path in chunk_paths:
+                    tasks.append(asyncio.create_task(transcribe_one(len(tasks), chunk_path)))
+            else:
+                for chunk_path in chunk_paths:
+                    tasks.append(asyncio.create_task(transcribe_one(len(tasks), chunk_path)))
+
+            return await asyncio.gather(*tasks)
+
+        except BaseException:
+            # Stop the remaining transcriptions and wait for them to unwind,
+            # so the caller can delete the chunk files once this returns
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def _remove_chunk(self, chunk_path: str) -> None:
+        """Delete a single chunk file if it exists."""
+        if await aos.path.exists(chunk_path):
+            await aos.remove(chunk_path)
+            logger.debug(f"Deleted chunk: {chunk_path}")
+
+    async def aclose(self) -> None:
+        """Shut down the worker thread pool."""
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+
 
 # Singleton instance
 audio_processor = AudioProcessor()
@@ -4,25 +4,211 @@ Handles all interactions with Azure OpenAI services including transcription,
 entity extraction, embeddings, and chat.
 """
 
-from typing import List, Dict, Any, Optional
-from openai import AzureOpenAI
+from typing import List, Dict, Any, Optional, AsyncIterable, AsyncIterator, Awaitable, Callable, TypeVar, Union
+import httpx
+from openai import (
+    AsyncAzureOpenAI,
+    APIConnectionError,
+    APIStatusError,
+    APITimeoutError,
+    InternalServerError,
+    RateLimitError
+)
 from loguru import logger
 from config import settings
+from backend.services.embedding_cache import EmbeddingCache
+from backend.services.llm_cache import LLMResultCache
+from backend.services.semantic_cache import SemanticCache
+from backend.utils.event_loops import LoopLocal
+from backend.utils.rate_limit import AsyncRateLimiter
+from backend.utils.tokens import pack_embedding_batches
+import numpy as np
+import orjson
 import time
+import random
 import asyncio
 
+T = TypeVar("T")
+
+# Transient failures worth retrying (timeouts, connection drops, 429s and 5xx)
+RETRYABLE_ERRORS = (APIConnectionError, APITimeoutError, InternalServerError, RateLimitError)
+RETRY_BASE_DELAY_SECONDS = 1.0
+RETRY_MAX_DELAY_SECONDS = 60.0
+
+
+def _format_times(seconds: np.ndarray) -> List[str]:
+    """
+    Convert an array of second offsets to HH:MM:SS strings.
+
+    Args:
+        seconds: Offsets in seconds
+
+    Returns:
+        Formatted timestamps, in the same order
+    """
+    total = seconds.astype(np.int64)
+    hours, remainder = np.divmod(total, 3600)
+    minutes, secs = np.divmod(remainder, 60)
+    return [
+        f"{h:02d}:{m:02d}:{s:02d}"
+        for h, m, s in zip(hours.tolist(), minutes.tolist(), secs.tolist())
+    ]
+
+
+# Transcript characters sent to entity extraction and summarization
+TRANSCRIPT_PROMPT_CHARS = 15000
+
+_ENTITY_TASK_PROMPT = """<task>
+You are an expert analyst of United Nations proceedings.
+Extract the following information from the UN session transcript above.
+
+Session Title: {session_title}
+
+1. Speakers: Name, country, role, organization
+2. Countries mentioned or represented
+3. SDGs (Sustainable Development Goals 1-17) mentioned with context
+4. Main topics and themes discussed
+5. Organizations and institutions mentioned
+6. Treaties, conventions, or legal instruments referenced
+7. Key decisions or outcomes
+8. Number of interventions by each country
+
+Provide structured JSON output with high accuracy.
+</task>"""
+
+_SUMMARY_TASK_PROMPT = """<task>
+Provide a concise executive summary (200-300 words) of the UN session transcribed above.
+
+Title: {session_title}
+
+Key Participants: {participants}
+Main Topics: {topics}
+
+Summary should cover:
+1. Main discussion points
+2. Key positions/statements
+3. Outcomes or decisions
+4. Notable interventions
+</task>"""
+
+# Part of the persistent result cache keys; bump when a prompt or the
+# parsed result format changes so stale entries stop matching
+_TRANSCRIPTION_CACHE_VERSION = "1"
+_ENTITY_PROMPT_VERSION = "2"
+_SUMMARY_PROMPT_VERSION = "2"
+
+# Kept byte-identical across requests so Azure's prompt cache can reuse it;
+# the per-request context goes in a separate, later message
+_CHAT_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": """You are an AI assistant helping analyze UN session transcripts.
+Use the context from the session provided below to answer questions accurately.
+Always cite specific segments when making claims."""
+}
+
+_CHAT_CONTEXT_PROMPT = """Context:
+{context}
+"""
+
+
+def _transcript_message(transcript_text: str) -> Dict[str, str]:
+    """
+    Build the transcript block that opens entity extraction and summary requests.
+
+    Both requests run back-to-back on the same transcript; keeping this
+    message first and byte-identical lets the second reuse the first's
+    cached prompt prefix, with the per-task instructions following it.
+    """
+    return {
+        "role": "user",
+        "content": f"<transcript>\n{transcript_text[:TRANSCRIPT_PROMPT_CHARS]}\n</transcript>"
+    }
+
+
+def _is_transcription_result(value: Any) -> bool:
+    """Check that a cached transcription has the shape the pipeline expects."""
+    return (
+        isinstance(value, dict)
+        and isinstance(value.get("full_text"), str)
+        and isinstance(value.get("segments"), list)
+    )
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """Read the Retry-After header from an API error response, if present."""
+    if not isinstance(error, APIStatusError):
+        return None
+    try:
+        return float(error.response.headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
 
 class AzureOpenAIClient:
     """Client for Azure OpenAI services."""
 
     def __init__(self):
         """Initialize Azure OpenAI client."""
-        self.client = AzureOpenAI(
+        # The async client and its connection pool are bound to the event loop
+        # they were created on; Streamlit sessions each run their own loops,
+        # so one is built lazily per loop
+        self._clients: LoopLocal[AsyncAzureOpenAI] = LoopLocal(self._build_client)
+
+        self.embedding_cache = EmbeddingCache(
+            settings.EMBEDDING_CACHE_PATH,
+            max_memory_items=settings.EMBEDDING_CACHE_MAX
+        )
+        self.response_cache = SemanticCache(
+            threshold=settings.SEMANTIC_CACHE_THRESHOLD,
+            max_buckets=settings.SEMANTIC_CACHE_MAX_BUCKETS
+        )
+        self.result_cache = LLMResultCache(settings.LLM_CACHE_PATH)
+
+        # Transcription, embedding and chat deployments have independent
+        # quotas, so each gets its own request budget
+        self.transcribe_limiter = AsyncRateLimiter(settings.TRANSCRIBE_RATE_LIMIT_PER_MINUTE, period=60.0)
+        self.embedding_limiter = AsyncRateLimiter(settings.EMBEDDING_RATE_LIMIT_PER_MINUTE, period=60.0)
+        self.chat_limiter = AsyncRateLimiter(settings.CHAT_RATE_LIMIT_PER_MINUTE, period=60.0)
+
+        # Bounds in-flight transcription requests across all sessions on a loop
+        self._transcription_semaphores: LoopLocal[asyncio.Semaphore] = LoopLocal(
+            lambda: asyncio.Semaphore(settings.WHISPER_CONCURRENCY)
+        )
+
+    @staticmethod
+    def _build_client() -> AsyncAzureOpenAI:
+        """Create an Azure OpenAI client with its own HTTP/2 connection pool."""
+        return AsyncAzureOpenAI(
             api_key=settings.AZURE_OPENAI_API_KEY,
             api_version=settings.AZURE_OPENAI_API_VERSION,
-            azure_endpoint=settings.AZURE_OPENAI_ENDPOINT
+            azure_endpoint=settings.AZURE_OPENAI_ENDPOINT,
+            # Tuned pool shared by every API call on this loop; the SDK
+            # default is sized for light, sequential use
+            http_client=httpx.AsyncClient(
+                http2=True,
+                timeout=httpx.Timeout(connect=10.0, read=120.0, write=60.0, pool=5.0),
+                limits=httpx.Limits(
+                    max_connections=128,
+                    max_keepalive_connections=64,
+                    keepalive_expiry=30
+                )
+            )
         )
 
+    @property
+    def client(self) -> AsyncAzureOpenAI:
+        """
+        Get the Azure OpenAI client for the running event loop.
+
+        Every service calling Azure OpenAI on this loop shares the client and
+        its HTTP/2 connection pool.
+        """
+        return self._clients.get()
+
+    def _transcription_slots(self) -> asyncio.Semaphore:
+        """Get the transcription semaphore for the running event loop."""
+        return self._transcription_semaphores.get()
+
     async def transcribe_audio_with_diarization(
         self,
         audio_file_path: str,
@@ -42,56 +228,158 @@ class AzureOpenAIClient:
         from backend.services.audio_processor import audio_processor
 
         try:
-            # Split large audio files into chunks
-            chunk_paths = await audio_processor.split_audio_file(audio_file_path)
-
-            if len(chunk_paths) == 1:
+            cache_key = await self._transcription_cache_key([audio_file_path], language)
+            if cache_key is not None:
+                cached = self.result_cache.get(cache_key, validate=_is_transcription_result)
+                if cached is not None:
+                    logger.info("Transcription served from result cache")
+                    return cached
+
+            if not await audio_processor.needs_splitting(audio_file_path):
                 # Single file, transcribe normally
-                return await self._transcribe_single_file(chunk_paths[0], language)
+                result = await self._transcribe_single_file(audio_file_path, language)
             else:
-                # Multiple chunks, transcribe each and merge
-                logger.info(f"Transcribing {len(chunk_paths)} audio chunks")
-                all_segments = []
-                cumulative_time_offset = 0.0
+                # Large file: transcribe chunks as the splitter produces them
+                result = await self.transcribe_audio_chunks(
+                    audio_processor.iter_chunks(audio_file_path),
+                    language
+                )
+
+            if cache_key is not None:
+                self.result_cache.set(cache_key, result)
+            return result
+
+        except Exception as e:
+            logger.error(f"Transcription failed: {str(e)}")
+            raise
 
-                for idx, chunk_path in enumerate(chunk_paths):
-                    logger.info(f"Transcribing chunk {idx + 1}/{len(chunk_paths)}")
+    async def transcribe_audio_chunks(
+        self,
+        chunk_paths: Union[List[str], AsyncIterable[str]],
+        language: str = "en"
+    ) -> Dict[str, Any]:
+        """
+        Transcribe audio chunks and merge them into one transcript.
 
-                    chunk_result = await self._transcribe_single_file(chunk_path, language)
+        Chunks are assumed to be 10 minutes long; they are deleted afterwards.
 
-                    # Adjust timestamps for chunks after the first one
-                    if 'segments' in chunk_result:
-                        for segment in chunk_result['segments']:
-                            segment['start'] += cumulative_time_offset
-                            segment['end'] += cumulative_time_offset
-                        all_segments.extend(chunk_result['segments'])
+        Args:
+            chunk_paths: Ordered audio chunk paths, or an async iterator
+                yielding them as they are produced
+            language: Audio language code
 
-                    # Update time offset for next chunk (10 minutes per chunk)
-                    cumulative_time_offset += 600.0
+        Returns:
+            Dictionary with transcript segments and speaker information
+        """
+        from backend.services.audio_processor import audio_processor
 
-                # Clean up chunks
-                await audio_processor.cleanup_chunks(chunk_paths)
+        # Chunks streamed from the splitter are hashed by the caller, which
+        # sees the whole file; a ready-made list can be keyed here
+        cache_key = None
+        if isinstance(chunk_paths, list):
+            cache_key = await self._transcription_cache_key(chunk_paths, language)
+            if cache_key is not None:
+                cached = self.result_cache.get(cache_key, validate=_is_transcription_result)
+                if cached is not None:
+                    logger.info("Chunked transcription served from result cache")
+                    await audio_processor.cleanup_chunks(chunk_paths)
+                    return cached
+
+        # Multiple chunks, transcribe concurrently and merge in order
+        logger.info("Transcribing audio chunks")
+
+        # Every chunk handed over, transcribed or not, is deleted afterwards,
+        # whether transcription succeeds or fails
+        produced_paths: List[str] = []
+
+        async def track_chunks(paths: AsyncIterable[str]) -> AsyncIterator[str]:
+            async for chunk_path in paths:
+                produced_paths.append(chunk_path)
+                yield chunk_path
+
+        if isinstance(chunk_paths, list):
+            produced_paths.extend(chunk_paths)
+        else:
+            chunk_paths = track_chunks(chunk_paths)
+
+        async def transcribe_chunk(index: int, chunk_path: str) -> Dict[str, Any]:
+            # Each chunk is 10 minutes long, so its timestamps are offset by its position
+            return await self._transcribe_single_file(
+                chunk_path,
+                language,
+                time_offset=index * 600.0
+            )
 
-                # Merge results
-                merged_result = {
-                    'full_text': ' '.join([s.get('text', '') for s in all_segments]),
-                    'segments': all_segments,
-                    'language': 'en',
-                    'duration': cumulative_time_offset
-                }
+        try:
+            chunk_results = await audio_processor.transcribe_chunks(chunk_paths, transcribe_chunk)
+        finally:
+            if not isinstance(chunk_paths, list):
+                # Stops the splitter if transcription failed part-way through
+                await chunk_paths.aclose()
+            await audio_processor.cleanup_chunks(produced_paths)
+
+        # Flatten in one pass now that every chunk has been gathered
+        all_segments = [
+            segment
+            for chunk_result in chunk_results
+            for segment in chunk_result.get('segments', [])
+        ]
+
+        # Renumber segments across chunks
+        for idx, segment in enumerate(all_segments):
+            segment['segment_index'] = idx
+
+        cumulative_time_offset = len(chunk_results) * 600.0
+
+        # Merge results
+        merged_result = {
+            # Each chunk already carries its own full text; join those rather
+            # than re-walking every segment
+            'full_text': ' '.join(r['full_text'] for r in chunk_results if r.get('full_text')),
+            'segments': all_segments,
+            'language': 'en',
+            'duration': cumulative_time_offset
+        }
 
-                logger.info(f"Merged transcription from {len(chunk_paths)} chunks, total segments: {len(all_segments)}")
-                return merged_result
+        if cache_key is not None:
+            self.result_cache.set(cache_key, merged_result)
 
-        except Exception as e:
-            logger.error(f"Transcription failed: {str(e)}")
-            raise
+        logger.info(f"Merged transcription from {len(chunk_results)} chunks, total segments: {len(all_segments)}")
+        return merged_result
+
+    async def _transcription_cache_key(self, audio_paths: List[str], language: str) -> Optional[bytes]:
+        """
+        Build the result cache key for transcribing the given audio.
+
+        Args:
+            audio_paths: Audio file paths, in playback order
+            language: Audio language code
+
+        Returns:
+            Cache key, or None when caching is disabled or the audio is unreadable
+        """
+        if not settings.LLM_CACHE_ENABLED:
+            return None
+        try:
+            # Hashing hours of audio is disk-bound; keep it off the event loop
+            audio_digest = await asyncio.to_thread(LLMResultCache.digest_files, audio_paths)
+        except OSError as e:
+            logger.warning(f"Could not hash audio for result cache: {str(e)}")
+            return None
+        return LLMResultCache.make_key(
+            "transcription",
+            _TRANSCRIPTION_CACHE_VERSION,
+            settings.AZURE_TRANSCRIBE_DIARIZE_DEPLOYMENT_NAME,
+            language,
+            audio_digest
+        )
 
     async def _transcribe_single_file(
         self,
         audio_file_path: str,
         language: str = "en",
-        max_retries: int = 3
+        max_retries: int = 5,
+        time_offset: float = 0.0
     ) -> Dict[str, Any]:
         """
         Transcribe a single audio file with retry logic.
@@ -100,22 +388,16 @@ class AzureOpenAIClient:
             audio_file_path: Path to audio file
             language: Language code
             max_retries: Maximum number of retry attempts
+            time_offset: Seconds added to segment timestamps (for chunked audio)
 
         Returns:
             Dictionary with transcript segments
         """
-        retry_delays = [10, 30, 60]  # Seconds to wait between retries
-
-        for attempt in range(max_retries):
-            try:
-                with open(audio_file_path, "rb") as audio_file:
-                    if attempt > 0:
-                        logger.info(f"Retry attempt {attempt + 1}/{max_retries} for: {audio_file_path}")
-                    else:
-                        logger.info(f"Starting transcription for: {audio_file_path}")
-
+        async def transcribe() -> Any:
+            with open(audio_file_path, "rb") as audio_file:
+                async with self._transcription_slots():
                     # Using the gpt-4o-transcribe-diarize deployment
-                    result = self.client.audio.transcriptions.create(
+                    return await self.client.audio.transcriptions.create(
                         model=settings.AZURE_TRANSCRIBE_DIARIZE_DEPLOYMENT_NAME,
                         file=audio_file,
                         language=language,
@@ -123,43 +405,86 @@ class AzureOpenAIClient:
                         chunking_strategy="auto"
                     )
 
-                    logger.info("Transcription completed successfully")
-                    return self._parse_transcription_result(result)
+        logger.info(f"Starting transcription for: {audio_file_path}")
+        result = await self._call_with_retries(
+            transcribe,
+            f"Transcription of {audio_file_path}",
+            self.transcribe_limiter,
+            max_attempts=max_retries
+        )
 
-            except Exception as e:
-                error_msg = str(e)
-                logger.error(f"Transcription attempt {attempt + 1} failed: {error_msg}")
+        logger.info("Transcription completed successfully")
+        return self._parse_transcription_result(result, time_offset)
 
-                # Check if this is a server error (500) or rate limit that we should retry
-                should_retry = (
-                    "500" in error_msg or
-                    "server_error" in error_msg or
-                    "429" in error_msg or
-                    "rate_limit" in error_msg.lower()
-                )
+    async def _call_with_retries(
+        self,
+        request: Callable[[], Awaitable[T]],
+        description: str,
+        limiter: AsyncRateLimiter,
+        max_attempts: int = 5
+    ) -> T:
+        """
+        Run an API request under its deployment's rate limit, retrying transient failures.
 
-                if should_retry and attempt < max_retries - 1:
-                    delay = retry_delays[attempt]
-                    logger.warning(f"Retrying in {delay} seconds...")
-                    await asyncio.sleep(delay)
-                else:
-                    logger.error(f"All {max_retries} attempts failed for: {audio_file_path}")
+        Retries use exponential backoff with decorrelated jitter, unless the
+        service sends a Retry-After header.
+
+        Args:
+            request: Zero-argument coroutine function issuing the request
+            description: Label used in log messages
+            limiter: Rate limiter for the deployment being called
+            max_attempts: Maximum number of attempts
+
+        Returns:
+            The request's result
+        """
+        delay = RETRY_BASE_DELAY_SECONDS
+
+        for attempt in range(1, max_attempts + 1):
+            await limiter.acquire()
+            try:
+                return await request()
+
+            except RETRYABLE_ERRORS as e:
+                if attempt == max_attempts:
+                    logger.error(f"All {max_attempts} attempts failed for: {description}")
                     raise
 
-    def _parse_transcription_result(self, result: Any) -> Dict[str, Any]:
+                retry_after = _retry_after_seconds(e)
+                if retry_after is not None:
+                    delay = retry_after
+                else:
+                    delay = min(
+                        RETRY_MAX_DELAY_SECONDS,
+                        random.uniform(RETRY_BASE_DELAY_SECONDS, delay * 3)
+                    )
+
+                logger.warning(
+                    f"{description} attempt {attempt}/{max_attempts} failed: {str(e)}. "
+                    f"Retrying in {delay:.1f} seconds..."
+                )
+                await asyncio.sleep(delay)
+
+    def _parse_transcription_result(self, result: Any, time_offset: float = 0.0) -> Dict[str, Any]:
         """Parse transcription result from diarized_json format into structured format."""
         segments = []
+        raw_segments = getattr(result, 'segments', None) or []
 
-        if hasattr(result, 'segments'):
-            for idx, segment in enumerate(result.segments):
+        if raw_segments:
+            # Format every start/end timestamp in one vectorized pass
+            bounds = np.array([(s.start, s.end) for s in raw_segments], dtype=np.float64) + time_offset
+            starts = _format_times(bounds[:, 0])
+            ends = _format_times(bounds[:, 1])
+
+            for idx, segment in enumerate(raw_segments):
                 # diarized_json format has 'speaker' attribute with values like "A", "B", etc.
                 speaker_label = getattr(segment, 'speaker', f"SPEAKER_{idx % 5 + 1}")
 
                 segments.append({
                     "segment_index": idx,
                     "speaker_id": f"SPEAKER_{speaker_label}",  # Convert "A" to "SPEAKER_A"
-                    "start_time": self._format_time(segment.start),
-                    "end_time": self._format_time(segment.end),
+                    "start_time": starts[idx],
+                    "end_time": ends[idx],
                     "text": segment.text.strip(),
                     "confidence": getattr(segment, 'confidence', 1.0)
                 })
@@ -171,13 +496,6 @@ class AzureOpenAIClient:
             "duration": getattr(result, 'duration', 0) if hasattr(result, 'duration') and result.duration else 0
         }
 
-    def _format_time(self, seconds: float) -> str:
-        """Convert seconds to HH:MM:SS format."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
-
     async def extract_entities(
         self,
         transcript_text: str,
@@ -196,40 +514,38 @@ class AzureOpenAIClient:
         try:
             logger.info("Starting entity extraction")
 
-            system_prompt = """You are an expert analyst of United Nations proceedings.
-Extract the following information from the provided UN session transcript:
-
-1. Speakers: Name, country, role, organization
-2. Countries mentioned or represented
-3. SDGs (Sustainable Development Goals 1-17) mentioned with context
-4. Main topics and themes discussed
-5. Organizations and institutions mentioned
-6. Treaties, conventions, or legal instruments referenced
-7. Key decisions or outcomes
-8. Number of interventions by each country
-
-Provide structured JSON output with high accuracy."""
-
-            user_prompt = f"""Session Title: {session_title}
-
-Transcript:
-{transcript_text[:15000]}  # Limit to avoid token limits
+            transcript_message = _transcript_message(transcript_text)
+            task_prompt = _ENTITY_TASK_PROMPT.format(session_title=session_title)
 
-Extract all relevant entities and provide detailed analysis."""
-
-            response = self.client.chat.completions.create(
-                model=settings.ENTITY_MODEL,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.1,  # Low temperature for consistency
-                max_tokens=4000
+            cache_key = None
+            if settings.LLM_CACHE_ENABLED:
+                cache_key = LLMResultCache.make_key(
+                    "entities", _ENTITY_PROMPT_VERSION, settings.ENTITY_MODEL,
+                    transcript_message["content"], task_prompt
+                )
+                cached_entities = self.result_cache.get(cache_key, validate=lambda v: isinstance(v, dict))
+                if cached_entities is not None:
+                    logger.info("Entities served from result cache")
+                    return cached_entities
+
+            response = await self._call_with_retries(
+                lambda: self.client.chat.completions.create(
+                    model=settings.ENTITY_MODEL,
+                    messages=[
+                        transcript_message,
+                        {"role": "user", "content": task_prompt}
+                    ],
+                    response_format={"type": "json_object"},
+                    temperature=0.1,  # Low temperature for consistency
+                    max_tokens=4000
+                ),
+                "Entity extraction",
+                self.chat_limiter
             )
 
-            import json
-            entities = json.loads(response.choices[0].message.content)
+            entities = orjson.loads(response.choices[0].message.content)
+            if cache_key is not None and isinstance(entities, dict):
+                self.result_cache.set(cache_key, entities)
 
             logger.info("Entity extraction completed")
             return entities
@@ -258,31 +574,42 @@ Extract all relevant entities and provide detailed analysis."""
         try:
             logger.info("Generating session summary")
 
-            prompt = f"""Provide a concise executive summary (200-300 words) of this UN session:
-
-Title: {session_title}
-
-Key Participants: {', '.join(entities.get('countries', [])[:10])}
-Main Topics: {', '.join(entities.get('topics', [])[:5])}
-
-Transcript Preview:
-{transcript_text[:5000]}
-
-Summary should cover:
-1. Main discussion points
-2. Key positions/statements
-3. Outcomes or decisions
-4. Notable interventions
-"""
+            transcript_message = _transcript_message(transcript_text)
+            task_prompt = _SUMMARY_TASK_PROMPT.format(
+                session_title=session_title,
+                participants=', '.join(entities.get('countries', [])[:10]),
+                topics=', '.join(entities.get('topics', [])[:5])
+            )
 
-            response = self.client.chat.completions.create(
-                model=settings.GPT4O_DEPLOYMENT_NAME,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.5,
-                max_tokens=500
+            result_key = None
+            if settings.LLM_CACHE_ENABLED:
+                result_key = LLMResultCache.make_key(
+                    "summary", _SUMMARY_PROMPT_VERSION, settings.GPT4O_DEPLOYMENT_NAME,
+                    transcript_message["content"], task_prompt
+                )
+                cached_summary = self.result_cache.get(result_key, validate=lambda v: isinstance(v, str))
+                if cached_summary is not None:
+                    logger.info("Summary served from result cache")
+                    return cached_summary
+
+            response = await self._call_with_retries(
+                lambda: self.client.chat.completions.create(
+                    model=settings.GPT4O_DEPLOYMENT_NAME,
+                    messages=[
+                        transcript_message,
+                        {"role": "user", "content": task_prompt}
+                    ],
+                    temperature=0.5,
+                    max_tokens=500
+                ),
+                "Summary generation",
+                self.chat_limiter
             )
 
             summary = response.choices[0].message.content.strip()
+            if result_key is not None:
+                self.result_cache.set(result_key, summary)
+
             logger.info("Summary generated successfully")
             return summary
 
@@ -292,36 +619,67 @@ Summary should cover:
 
     async def generate_embeddings(
         self,
-        texts: List[str]
-    ) -> List[List[float]]:
+        texts: List[str],
+        batch_size: Optional[int] = None
+    ) -> np.ndarray:
         """
         Generate embeddings for text segments.
 
         Args:
             texts: List of text segments to embed
+            batch_size: Maximum inputs per request (default from settings);
+                lower it for deployments with a smaller per-request input cap
 
         Returns:
-            List of embedding vectors
+            float32 array of shape (len(texts), dimensions), one row per text
         """
         try:
             logger.info(f"Generating embeddings for {len(texts)} segments")
 
-            # Process in batches to avoid rate limits
-            batch_size = settings.EMBEDDING_BATCH_SIZE
-            all_embeddings = []
-
-            for i in range(0, len(texts), batch_size):
-                batch = texts[i:i + batch_size]
-
-                response = self.client.embeddings.create(
-                    model=settings.EMBEDDING_MODEL,
-                    input=batch
-                )
-
-                batch_embeddings = [item.embedding for item in response.data]
-                all_embeddings.extend(batch_embeddings)
-
-            logger.info(f"Generated {len(all_embeddings)} embeddings")
+            # Only send texts that aren't already cached, each distinct text once
+            keys = [EmbeddingCache.make_key(settings.EMBEDDING_MODEL, t) for t in texts]
+            cached = self.embedding_cache.get_many(keys)
+            missing: Dict[bytes, str] = {}
+            for key, text in zip(keys, texts):
+                if key not in cached:
+                    missing.setdefault(key, text)
+            missing_texts = list(missing.values())
+
+            # Pack batches by token count to stay under the per-request limit
+            # without wasting round-trips on short texts; bounded concurrency
+            batches = pack_embedding_batches(missing_texts, max_items=batch_size)
+            semaphore = asyncio.Semaphore(settings.EMBEDDING_CONCURRENCY)
+
+            async def embed_batch(batch: List[str]) -> np.ndarray:
+                async with semaphore:
+                    response = await self._call_with_retries(
+                        lambda: self.client.embeddings.create(
+                            model=settings.EMBEDDING_MODEL,
+                            input=batch
+                        ),
+                        "Embedding batch",
+                        self.embedding_limiter
+                    )
+                return np.asarray([item.embedding for item in response.data], dtype=np.float32)
+
+            # gather preserves batch order
+            batch_results = await asyncio.gather(*(embed_batch(b) for b in batches))
+            new_embeddings = list(np.concatenate(batch_results)) if batch_results else []
+            if new_embeddings:
+                self.embedding_cache.put_many(list(missing), new_embeddings)
+
+            # Fan embeddings back out to every input position in one array
+            cached.update(zip(missing, new_embeddings))
+            if not keys:
+                return np.empty((0, 0), dtype=np.float32)
+            all_embeddings = np.empty((len(keys), len(cached[keys[0]])), dtype=np.float32)
+            for row, key in enumerate(keys):
+                all_embeddings[row] = cached[key]
+
+            logger.info(
+                f"Generated {len(new_embeddings)} embeddings for {len(texts)} segments "
+                f"({len(texts) - len(missing_texts)} cached or duplicate)"
+            )
             return all_embeddings
 
         except Exception as e:
@@ -339,7 +697,8 @@ Summary should cover:
         Generate chat completion with optional RAG context.
 
         Args:
-            messages: Chat messages history
+            messages: Chat messages history; treated as read-only and passed
+                through without copying, so callers must not mutate it mid-request
             context_segments: Retrieved context segments for RAG
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
@@ -348,40 +707,76 @@ Summary should cover:
             Response with message and metadata
         """
         try:
-            # Add context to system message if provided
-            enhanced_messages = messages.copy()
-
-            if context_segments:
-                context_text = "\n\n---\n\n".join(context_segments)
-                system_msg = {
-                    "role": "system",
-                    "content": f"""You are an AI assistant helping analyze UN session transcripts.
-Use the following context from the session to answer questions accurately.
-Always cite specific segments when making claims.
-
-Context:
-{context_text}
-"""
-                }
-                enhanced_messages.insert(0, system_msg)
-
-            response = self.client.chat.completions.create(
-                model=settings.CHAT_MODEL,
-                messages=enhanced_messages,
-                temperature=temperature,
-                max_tokens=max_tokens
+            enhanced_messages = self._with_context(messages, context_segments)
+
+            # Match the latest user question semantically, but only against
+            # requests with the same model settings, context and prior turns
+            cache_bucket = cache_embedding = None
+            if settings.SEMANTIC_CACHE_ENABLED and messages and messages[-1].get("role") == "user":
+                cache_bucket = SemanticCache.make_bucket(
+                    "chat", settings.CHAT_MODEL, temperature, max_tokens,
+                    context_segments or [], messages[:-1]
+                )
+                cache_embedding = (await self.generate_embeddings([messages[-1]["content"]]))[0]
+                cached_response = self.response_cache.lookup(cache_bucket, cache_embedding)
+                if cached_response is not None:
+                    logger.info("Chat completion served from semantic cache")
+                    return {**cached_response, "tokens_used": 0, "cached": True}
+
+            response = await self._call_with_retries(
+                lambda: self.client.chat.completions.create(
+                    model=settings.CHAT_MODEL,
+                    messages=enhanced_messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens
+                ),
+                "Chat completion",
+                self.chat_limiter
             )
 
-            return {
+            result = {
                 "message": response.choices[0].message.content,
                 "tokens_used": response.usage.total_tokens,
                 "finish_reason": response.choices[0].finish_reason
             }
+            if cache_bucket is not None:
+                self.response_cache.store(cache_bucket, cache_embedding, result)
+
+            return result
 
         except Exception as e:
             logger.error(f"Chat completion failed: {str(e)}")
             raise
 
+    @staticmethod
+    def _with_context(
+        messages: List[Dict[str, str]],
+        context_segments: Optional[List[str]]
+    ) -> List[Dict[str, str]]:
+        """
+        Add RAG context to a conversation; messages are only copied when context is added.
+
+        The fixed instructions come first and the conversation history next, so
+        consecutive turns share a growing identical prefix for prompt caching.
+        The variable context sits just before the latest question.
+        """
+        if not context_segments:
+            return messages
+
+        context_msg = {
+            "role": "system",
+            "content": _CHAT_CONTEXT_PROMPT.format(context="\n\n---\n\n".join(context_segments))
+        }
+        if messages and messages[-1].get("role") == "user":
+            return [_CHAT_SYSTEM_MESSAGE, *messages[:-1], context_msg, messages[-1]]
+        return [_CHAT_SYSTEM_MESSAGE, *messages, context_msg]
+
+    async def aclose(self) -> None:
+        """Close the running loop's client and its connection pool."""
+        client = self._clients.pop()
+        if client is not None:
+            await client.close()
+
 
 # Singleton instance
 azure_openai_client = AzureOpenAIClient()
@@ -9,18 +9,15 @@ from .database import db_service
 
 
 class BatchProcessor:
-    """Process multiple sessions in parallel with rate limiting and progress tracking."""
+    """
+    Process multiple sessions in parallel with progress tracking.
 
-    def __init__(self, max_concurrent: int = 3):
-        """
-        Initialize batch processor.
-
-        Args:
-            max_concurrent: Maximum number of sessions to process concurrently
-                           (default: 3 to respect Azure OpenAI rate limits)
-        """
-        self.max_concurrent = max_concurrent
-        self.semaphore = asyncio.Semaphore(max_concurrent)
+    Sessions are not capped here as a whole: each Azure OpenAI deployment is
+    rate limited separately in the client, so one session can embed while
+    another is waiting on transcription quota. The download and audio
+    extraction stage, which has no such limit, is bounded by
+    MAX_CONCURRENT_PROCESSING in the session processor.
+    """
 
     async def process_batch(
         self,
@@ -39,7 +36,6 @@ class BatchProcessor:
             Dictionary with results for each URL
         """
         logger.info(f"Starting batch processing of {len(urls)} sessions")
-        logger.info(f"Max concurrent sessions: {self.max_concurrent}")
 
         # Initialize database once for all sessions
         await db_service.initialize()
@@ -51,14 +47,13 @@ class BatchProcessor:
             "sessions": {}
         }
 
-        # Create tasks for all URLs
-        tasks = [
-            self._process_with_semaphore(url, results, progress_callback)
-            for url in urls
-        ]
-
-        # Process all tasks concurrently (with semaphore limiting concurrency)
-        await asyncio.gather(*tasks, return_exceptions=True)
+        # Process all URLs concurrently (API rate limits and the download
+        # semaphore throttle each stage).
+        # Per-URL failures are recorded by _process_one; anything escaping it
+        # cancels the remaining sessions instead of leaving them running.
+        async with asyncio.TaskGroup() as tg:
+            for url in urls:
+                tg.create_task(self._process_one(url, results, progress_callback))
 
         logger.info(
             f"Batch processing complete: "
@@ -67,53 +62,52 @@ class BatchProcessor:
 
         return results
 
-    async def _process_with_semaphore(
+    async def _process_one(
         self,
         url: str,
         results: Dict[str, Any],
         progress_callback: callable = None
     ):
-        """Process a single session with semaphore to limit concurrency."""
-        async with self.semaphore:
-            try:
-                logger.info(f"🚀 Starting processing: {url}")
-
-                # Process the session
-                result = await session_processor.process_session(url)
-
-                if result and result.get('status') == 'completed':
-                    results['completed'] += 1
-                    results['sessions'][url] = {
-                        "status": "success",
-                        "session_id": result.get('session_id'),
-                        "data": result
-                    }
-                    logger.info(f"✅ Successfully processed: {url}")
-                else:
-                    results['failed'] += 1
-                    results['sessions'][url] = {
-                        "status": "failed",
-                        "error": "Processing did not complete",
-                        "data": result
-                    }
-                    logger.error(f"❌ Failed to process: {url}")
+        """Process a single session and record its outcome."""
+        try:
+            logger.info(f"🚀 Starting processing: {url}")
 
-                # Call progress callback if provided
-                if progress_callback:
-                    total_processed = results['completed'] + results['failed']
-                    await progress_callback(total_processed, results['total'], url)
+            # Process the session
+            result = await session_processor.process_session(url)
 
-            except Exception as e:
+            if result and result.get('status') == 'completed':
+                results['completed'] += 1
+                results['sessions'][url] = {
+                    "status": "success",
+                    "session_id": result.get('session_id'),
+                    "data": result
+                }
+                logger.info(f"✅ Successfully processed: {url}")
+            else:
                 results['failed'] += 1
                 results['sessions'][url] = {
-                    "status": "error",
-                    "error": str(e)
+                    "status": "failed",
+                    "error": "Processing did not complete",
+                    "data": result
                 }
-                logger.error(f"❌ Error processing {url}: {e}")
+                logger.error(f"❌ Failed to process: {url}")
+
+            # Call progress callback if provided
+            if progress_callback:
+                total_processed = results['completed'] + results['failed']
+                await progress_callback(total_processed, results['total'], url)
+
+        except Exception as e:
+            results['failed'] += 1
+            results['sessions'][url] = {
+                "status": "error",
+                "error": str(e)
+            }
+            logger.error(f"❌ Error processing {url}: {e}")
 
-                if progress_callback:
-                    total_processed = results['completed'] + results['failed']
-                    await progress_callback(total_processed, results['total'], url)
+            if progress_callback:
+                total_processed = results['completed'] + results['failed']
+                await progress_callback(total_processed, results['total'], url)
 
     async def get_batch_status(self, session_ids: List[str]) -> Dict[str, Any]:
         """
@@ -148,4 +142,4 @@ class BatchProcessor:
 
 
 # Global batch processor instance
-batch_processor = BatchProcessor(max_concurrent=3)
+batch_processor = BatchProcessor()
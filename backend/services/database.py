@@ -3,19 +3,43 @@ Database Service
 Handles all database operations with Azure Cosmos DB.
 """
 
-from typing import List, Optional, Dict, Any
-from azure.cosmos import CosmosClient, PartitionKey
+import asyncio
+from collections import defaultdict
+from typing import AsyncIterator, List, Optional, Dict, Any
+from azure.cosmos import PartitionKey
+from azure.cosmos.aio import CosmosClient
 from azure.cosmos.exceptions import CosmosResourceNotFoundError, CosmosHttpResponseError
 from loguru import logger
 from config import settings
 from backend.models.session import SessionMetadata, Transcript, Chat
+from backend.utils.event_loops import LoopLocal
+from backend.utils.ttl_cache import TTLCache
 
 
-class DatabaseService:
-    """Service for Azure Cosmos DB operations."""
+# Cosmos DB limit on operations per transactional batch
+MAX_BATCH_OPERATIONS = 100
+
+# Query text is fixed; values are always bound as parameters
+_Q_LIST_SESSIONS = "SELECT * FROM c{where} ORDER BY c.date DESC OFFSET @offset LIMIT @limit"
+_Q_LIST_SESSIONS_ALL = _Q_LIST_SESSIONS.format(where="")
+_Q_GET_TRANSCRIPT = "SELECT * FROM c WHERE c.session_id = @session_id"
+_Q_LIST_CHATS = "SELECT * FROM c WHERE c.session_id = @session_id ORDER BY c.created_date DESC"
+
+# Point-read cache; short TTL bounds staleness from writes by other processes
+READ_CACHE_SIZE = 1024
+READ_CACHE_TTL_SECONDS = 30.0
+
+# Bound once: calling the compiled core serializers directly skips the
+# per-call argument handling of model_dump(mode='json')
+_dump_session = SessionMetadata.__pydantic_serializer__.to_python
+_dump_transcript = Transcript.__pydantic_serializer__.to_python
+_dump_chat = Chat.__pydantic_serializer__.to_python
+
+
+class _CosmosConnection:
+    """Cosmos DB client and container proxies belonging to one event loop."""
 
     def __init__(self):
-        """Initialize database service."""
         self.client: Optional[CosmosClient] = None
         self.database = None
         self.sessions_container = None
@@ -23,10 +47,59 @@ class DatabaseService:
         self.speakers_container = None
         self.chats_container = None
 
+
+class DatabaseService:
+    """Service for Azure Cosmos DB operations."""
+
+    def __init__(self):
+        """Initialize database service."""
+        # The async client is bound to the event loop it was created on, and
+        # each Streamlit session runs its own loops, so every loop gets its
+        # own client and container proxies
+        self._connections: LoopLocal[_CosmosConnection] = LoopLocal(_CosmosConnection)
+        self._provisioned = False
+        # Cached documents are kept as dicts so callers always get a fresh model
+        self._session_cache = TTLCache(READ_CACHE_SIZE, READ_CACHE_TTL_SECONDS)
+        self._chat_cache = TTLCache(READ_CACHE_SIZE, READ_CACHE_TTL_SECONDS)
+
+    @property
+    def client(self) -> Optional[CosmosClient]:
+        """Cosmos DB client of the running event loop, once initialized."""
+        return self._connections.get().client
+
+    @property
+    def database(self):
+        """Database proxy of the running event loop."""
+        return self._connections.get().database
+
+    @property
+    def sessions_container(self):
+        """Sessions container proxy of the running event loop."""
+        return self._connections.get().sessions_container
+
+    @property
+    def transcripts_container(self):
+        """Transcripts container proxy of the running event loop."""
+        return self._connections.get().transcripts_container
+
+    @property
+    def speakers_container(self):
+        """Speakers container proxy of the running event loop."""
+        return self._connections.get().speakers_container
+
+    @property
+    def chats_container(self):
+        """Chats container proxy of the running event loop."""
+        return self._connections.get().chats_container
+
     async def initialize(self) -> bool:
         """
         Initialize database connection and containers.
 
+        Safe to call repeatedly: a client is only created when the running
+        event loop has none yet, and containers are only provisioned on the
+        first call.
+
         Returns:
             True if successful
         """
@@ -35,51 +108,87 @@ class DatabaseService:
                 logger.warning("Cosmos DB credentials not configured")
                 return False
 
+            conn = self._connections.get()
+            if conn.client is not None:
+                return True
+
             logger.info("Initializing Cosmos DB connection...")
 
-            # Create client
-            self.client = CosmosClient(
+            conn.client = CosmosClient(
                 settings.COSMOS_ENDPOINT,
                 settings.COSMOS_KEY
             )
 
+            if self._provisioned:
+                # Containers exist; proxies are built locally without a round-trip
+                conn.database = conn.client.get_database_client(settings.COSMOS_DATABASE_NAME)
+                (
+                    conn.sessions_container,
+                    conn.transcripts_container,
+                    conn.speakers_container,
+                    conn.chats_container
+                ) = (
+                    conn.database.get_container_client(container_id)
+                    for container_id in (
+                        settings.COSMOS_SESSIONS_CONTAINER,
+                        settings.COSMOS_TRANSCRIPTS_CONTAINER,
+                        settings.COSMOS_SPEAKERS_CONTAINER,
+                        settings.COSMOS_CHATS_CONTAINER
+                    )
+                )
+                return True
+
             # Create database if not exists
-            self.database = self.client.create_database_if_not_exists(
+            conn.database = await conn.client.create_database_if_not_exists(
                 id=settings.COSMOS_DATABASE_NAME
             )
 
-            # Create containers if not exist
-            self.sessions_container = self.database.create_container_if_not_exists(
-                id=settings.COSMOS_SESSIONS_CONTAINER,
-                partition_key=PartitionKey(path="/id"),
-                offer_throughput=400  # Minimum RU/s
-            )
-
-            self.transcripts_container = self.database.create_container_if_not_exists(
-                id=settings.COSMOS_TRANSCRIPTS_CONTAINER,
-                partition_key=PartitionKey(path="/session_id"),
-                offer_throughput=400
-            )
-
-            self.speakers_container = self.database.create_container_if_not_exists(
-                id=settings.COSMOS_SPEAKERS_CONTAINER,
-                partition_key=PartitionKey(path="/id"),
-                offer_throughput=400
-            )
-
-            self.chats_container = self.database.create_container_if_not_exists(
-                id=settings.COSMOS_CHATS_CONTAINER,
-                partition_key=PartitionKey(path="/session_id"),
-                offer_throughput=400
+            # Create containers if not exist, concurrently
+            (
+                conn.sessions_container,
+                conn.transcripts_container,
+                conn.speakers_container,
+                conn.chats_container
+            ) = await asyncio.gather(
+                conn.database.create_container_if_not_exists(
+                    id=settings.COSMOS_SESSIONS_CONTAINER,
+                    partition_key=PartitionKey(path="/id"),
+                    offer_throughput=400  # Minimum RU/s
+                ),
+                conn.database.create_container_if_not_exists(
+                    id=settings.COSMOS_TRANSCRIPTS_CONTAINER,
+                    partition_key=PartitionKey(path="/session_id"),
+                    offer_throughput=400
+                ),
+                conn.database.create_container_if_not_exists(
+                    id=settings.COSMOS_SPEAKERS_CONTAINER,
+                    partition_key=PartitionKey(path="/id"),
+                    offer_throughput=400
+                ),
+                conn.database.create_container_if_not_exists(
+                    id=settings.COSMOS_CHATS_CONTAINER,
+                    partition_key=PartitionKey(path="/session_id"),
+                    offer_throughput=400
+                )
             )
 
+            self._provisioned = True
             logger.info("Cosmos DB initialized successfully")
             return True
 
         except Exception as e:
             logger.error(f"Failed to initialize Cosmos DB: {str(e)}")
+            client = self._connections.pop().client
+            if client is not None:
+                await client.close()
             return False
 
+    async def close(self) -> None:
+        """Close the running loop's Cosmos DB client."""
+        conn = self._connections.pop()
+        if conn is not None and conn.client is not None:
+            await conn.client.close()
+
     # Session Operations
 
     async def create_session(self, session: SessionMetadata) -> bool:
@@ -93,8 +202,10 @@ class DatabaseService:
             True if successful
         """
         try:
-            session_dict = session.model_dump(mode='json')
-            self.sessions_container.create_item(body=session_dict)
+            await self.initialize()
+            session_dict = _dump_session(session, mode='json')
+            await self.sessions_container.create_item(body=session_dict)
+            self._session_cache.put(session.id, session_dict)
             logger.info(f"Created session: {session.id}")
             return True
 
@@ -112,12 +223,18 @@ class DatabaseService:
         Returns:
             Session metadata or None
         """
+        item = self._session_cache.get(session_id)
+        if item is not None:
+            return SessionMetadata.model_validate(item)
+
         try:
-            item = self.sessions_container.read_item(
+            await self.initialize()
+            item = await self.sessions_container.read_item(
                 item=session_id,
                 partition_key=session_id
             )
-            return SessionMetadata(**item)
+            self._session_cache.put(session_id, item)
+            return SessionMetadata.model_validate(item)
 
         except CosmosResourceNotFoundError:
             logger.warning(f"Session not found: {session_id}")
@@ -138,8 +255,10 @@ class DatabaseService:
             True if successful
         """
         try:
-            session_dict = session.model_dump(mode='json')
-            self.sessions_container.upsert_item(body=session_dict)
+            await self.initialize()
+            session_dict = _dump_session(session, mode='json')
+            await self.sessions_container.upsert_item(body=session_dict)
+            self._session_cache.put(session.id, session_dict)
             logger.info(f"Updated session: {session.id}")
             return True
 
@@ -147,6 +266,52 @@ class DatabaseService:
             logger.error(f"Failed to update session: {str(e)}")
             return False
 
+    async def iter_sessions(
+        self,
+        limit: int = 50,
+        offset: int = 0,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[SessionMetadata]:
+        """
+        Stream sessions with optional filtering, newest first.
+
+        Documents are converted as each result page arrives instead of being
+        buffered first.
+
+        Args:
+            limit: Maximum number of results
+            offset: Number of results to skip
+            filters: Optional field -> value equality filters
+
+        Yields:
+            Sessions
+        """
+        await self.initialize()
+        # Build query; filtering and paging run server-side so the cost
+        # scales with the page size, not the container size
+        conditions = []
+        parameters = [
+            {"name": "@offset", "value": offset},
+            {"name": "@limit", "value": limit}
+        ]
+        for i, (field, value) in enumerate((filters or {}).items()):
+            if not field.isidentifier():
+                raise ValueError(f"Invalid filter field: {field}")
+            conditions.append(f"c.{field} = @f{i}")
+            parameters.append({"name": f"@f{i}", "value": value})
+
+        query = (
+            _Q_LIST_SESSIONS.format(where=f" WHERE {' AND '.join(conditions)}")
+            if conditions else _Q_LIST_SESSIONS_ALL
+        )
+
+        async for item in self.sessions_container.query_items(
+            query=query,
+            parameters=parameters,
+            max_item_count=limit
+        ):
+            yield SessionMetadata.model_validate(item)
+
     async def list_sessions(
         self,
         limit: int = 50,
@@ -159,24 +324,13 @@ class DatabaseService:
         Args:
             limit: Maximum number of results
             offset: Number of results to skip
-            filters: Optional filters
+            filters: Optional field -> value equality filters
 
         Returns:
             List of sessions
         """
         try:
-            # Build query
-            query = "SELECT * FROM c ORDER BY c.date DESC"
-
-            # Execute query
-            items = list(self.sessions_container.query_items(
-                query=query,
-                enable_cross_partition_query=True,
-                max_item_count=limit
-            ))
-
-            # Convert to models
-            sessions = [SessionMetadata(**item) for item in items[offset:offset + limit]]
+            sessions = [session async for session in self.iter_sessions(limit, offset, filters)]
             logger.info(f"Retrieved {len(sessions)} sessions")
             return sessions
 
@@ -210,8 +364,9 @@ class DatabaseService:
             True if successful
         """
         try:
-            transcript_dict = transcript.model_dump(mode='json')
-            self.transcripts_container.create_item(body=transcript_dict)
+            await self.initialize()
+            transcript_dict = _dump_transcript(transcript, mode='json')
+            await self.transcripts_container.create_item(body=transcript_dict)
             logger.info(f"Created transcript for session: {transcript.session_id}")
             return True
 
@@ -230,15 +385,18 @@ class DatabaseService:
             Transcript or None
         """
         try:
-            query = f"SELECT * FROM c WHERE c.session_id = '{session_id}'"
-            items = list(self.transcripts_container.query_items(
-                query=query,
-                partition_key=session_id,
-                max_item_count=1
-            ))
+            await self.initialize()
+            items = [
+                item async for item in self.transcripts_container.query_items(
+                    query=_Q_GET_TRANSCRIPT,
+                    parameters=[{"name": "@session_id", "value": session_id}],
+                    partition_key=session_id,
+                    max_item_count=1
+                )
+            ]
 
             if items:
-                return Transcript(**items[0])
+                return Transcript.model_validate(items[0])
             return None
 
         except Exception as e:
@@ -258,8 +416,10 @@ class DatabaseService:
             True if successful
         """
         try:
-            chat_dict = chat.model_dump(mode='json')
-            self.chats_container.create_item(body=chat_dict)
+            await self.initialize()
+            chat_dict = _dump_chat(chat, mode='json')
+            await self.chats_container.create_item(body=chat_dict)
+            self._chat_cache.put((chat.id, chat.session_id), chat_dict)
             logger.info(f"Created chat: {chat.id}")
             return True
 
@@ -267,6 +427,45 @@ class DatabaseService:
             logger.error(f"Failed to create chat: {str(e)}")
             return False
 
+    async def create_chats(self, chats: List[Chat]) -> bool:
+        """
+        Create several chat sessions with as few requests as possible.
+
+        Chats sharing a session (the container's partition key) are written in
+        transactional batches; different sessions are written concurrently.
+
+        Args:
+            chats: Chat data
+
+        Returns:
+            True if every chat was created
+        """
+        try:
+            await self.initialize()
+
+            by_session: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+            for chat in chats:
+                by_session[chat.session_id].append(_dump_chat(chat, mode='json'))
+
+            await asyncio.gather(*(
+                self.chats_container.execute_item_batch(
+                    batch_operations=[
+                        ("create", (body,))
+                        for body in bodies[i:i + MAX_BATCH_OPERATIONS]
+                    ],
+                    partition_key=session_id
+                )
+                for session_id, bodies in by_session.items()
+                for i in range(0, len(bodies), MAX_BATCH_OPERATIONS)
+            ))
+
+            logger.info(f"Created {len(chats)} chats across {len(by_session)} sessions")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to create chats: {str(e)}")
+            return False
+
     async def update_chat(self, chat: Chat) -> bool:
         """
         Update chat session.
@@ -278,8 +477,10 @@ class DatabaseService:
             True if successful
         """
         try:
-            chat_dict = chat.model_dump(mode='json')
-            self.chats_container.upsert_item(body=chat_dict)
+            await self.initialize()
+            chat_dict = _dump_chat(chat, mode='json')
+            await self.chats_container.upsert_item(body=chat_dict)
+            self._chat_cache.put((chat.id, chat.session_id), chat_dict)
             logger.info(f"Updated chat: {chat.id}")
             return True
 
@@ -298,12 +499,18 @@ class DatabaseService:
         Returns:
             Chat or None
         """
+        item = self._chat_cache.get((chat_id, session_id))
+        if item is not None:
+            return Chat.model_validate(item)
+
         try:
-            item = self.chats_container.read_item(
+            await self.initialize()
+            item = await self.chats_container.read_item(
                 item=chat_id,
                 partition_key=session_id
             )
-            return Chat(**item)
+            self._chat_cache.put((chat_id, session_id), item)
+            return Chat.model_validate(item)
 
         except CosmosResourceNotFoundError:
             return None
@@ -312,6 +519,24 @@ class DatabaseService:
             logger.error(f"Failed to get chat: {str(e)}")
             return None
 
+    async def iter_chats_for_session(self, session_id: str) -> AsyncIterator[Chat]:
+        """
+        Stream all chats for a session, newest first.
+
+        Args:
+            session_id: Session identifier
+
+        Yields:
+            Chats
+        """
+        await self.initialize()
+        async for item in self.chats_container.query_items(
+            query=_Q_LIST_CHATS,
+            parameters=[{"name": "@session_id", "value": session_id}],
+            partition_key=session_id
+        ):
+            yield Chat.model_validate(item)
+
     async def list_chats_for_session(self, session_id: str) -> List[Chat]:
         """
         List all chats for a session.
@@ -323,13 +548,7 @@ class DatabaseService:
             List of chats
         """
         try:
-            query = f"SELECT * FROM c WHERE c.session_id = '{session_id}' ORDER BY c.created_date DESC"
-            items = list(self.chats_container.query_items(
-                query=query,
-                partition_key=session_id
-            ))
-
-            chats = [Chat(**item) for item in items]
+            chats = [chat async for chat in self.iter_chats_for_session(session_id)]
             logger.info(f"Retrieved {len(chats)} chats for session {session_id}")
             return chats
 
@@ -0,0 +1,153 @@
+"""
+Persistent Embedding Cache
+Two-tier cache (in-process LRU + SQLite) for embedding vectors, keyed by
+a 16-byte BLAKE2b digest of the model name and text. Vectors are held as float16 arrays,
+which is ample precision for cosine similarity at half the float32 size.
+"""
+
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+from loguru import logger
+
+
+# Storage dtype for cached vectors
+EMBEDDING_DTYPE = np.float16
+
+
+class EmbeddingCache:
+    """Embedding cache backed by an in-memory LRU and an on-disk SQLite table."""
+
+    # Stay well below SQLite's bound-parameter limit
+    _QUERY_CHUNK = 500
+
+    def __init__(self, db_path: str, max_memory_items: int = 10_000):
+        """
+        Initialize the cache.
+
+        Args:
+            db_path: Path to the SQLite database file
+            max_memory_items: Maximum number of vectors kept in memory
+        """
+        self.db_path = Path(db_path)
+        self.max_memory_items = max_memory_items
+        self._memory: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of vectors held in memory."""
+        return len(self._memory)
+
+    @staticmethod
+    def make_key(model: str, text: str) -> bytes:
+        """Build the cache key for a (model, text) pair."""
+        digest = hashlib.blake2b(model.encode('utf-8'), digest_size=16)
+        digest.update(b"\0")
+        digest.update(text.encode('utf-8'))
+        return digest.digest()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the SQLite database on first use."""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            # The file is the cross-process tier: every worker on the host
+            # reads the others' vectors. WAL lets readers proceed while one
+            # worker writes, and the timeout waits out brief write locks.
+            self._conn = sqlite3.connect(str(self.db_path), timeout=5.0, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings_f16 (key BLOB PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def _remember(self, key: bytes, vector: np.ndarray) -> None:
+        """Insert into the in-memory LRU, evicting the oldest entry if full."""
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.max_memory_items:
+            self._memory.popitem(last=False)
+
+    def get_many(self, keys: Iterable[bytes]) -> Dict[bytes, np.ndarray]:
+        """
+        Look up cached vectors.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Mapping of found keys to their (read-only, float16) vectors
+        """
+        found: Dict[bytes, np.ndarray] = {}
+        missing: List[bytes] = []
+
+        with self._lock:
+            # Bound locally to keep attribute lookups out of the hot loop
+            memory_get = self._memory.get
+            move_to_end = self._memory.move_to_end
+            for key in keys:
+                vector = memory_get(key)
+                if vector is not None:
+                    move_to_end(key)
+                    found[key] = vector
+                else:
+                    missing.append(key)
+
+            if not missing:
+                return found
+
+            try:
+                conn = self._connect()
+                for i in range(0, len(missing), self._QUERY_CHUNK):
+                    chunk = missing[i:i + self._QUERY_CHUNK]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = conn.execute(
+                        f"SELECT key, vector FROM embeddings_f16 WHERE key IN ({placeholders})",
+                        chunk
+                    ).fetchall()
+                    for key, blob in rows:
+                        vector = np.frombuffer(blob, dtype=EMBEDDING_DTYPE)
+                        self._remember(key, vector)
+                        found[key] = vector
+
+            except sqlite3.Error as e:
+                logger.warning(f"Embedding cache read failed: {str(e)}")
+
+        return found
+
+    def put_many(self, keys: Sequence[bytes], vectors: Sequence[Sequence[float]]) -> None:
+        """
+        Store vectors in both cache tiers.
+
+        Args:
+            keys: Cache keys
+            vectors: Embedding vectors, aligned with keys
+        """
+        arrays = [np.asarray(vector, dtype=EMBEDDING_DTYPE) for vector in vectors]
+
+        with self._lock:
+            for key, vector in zip(keys, arrays):
+                self._remember(key, vector)
+
+            try:
+                conn = self._connect()
+                conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings_f16 (key, vector) VALUES (?, ?)",
+                    [(key, vector.tobytes()) for key, vector in zip(keys, arrays)]
+                )
+                conn.commit()
+
+            except sqlite3.Error as e:
+                logger.warning(f"Embedding cache write failed: {str(e)}")
+
+    def clear(self) -> None:
+        """Drop the in-memory tier; the on-disk table is kept."""
+        with self._lock:
+            self._memory.clear()
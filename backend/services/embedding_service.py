@@ -2,45 +2,160 @@
 Embedding Service for generating and caching text embeddings.
 
 Features:
-- Batch embedding generation
-- In-memory caching to reduce API calls
+- Concurrent batch embedding generation
+- Bounded in-memory + SQLite caching to reduce API calls, including
+  near-duplicate texts that differ only in spacing or end punctuation
 - Support for multiple embedding models
 - Cost tracking
 """
 
-import hashlib
-from typing import List, Dict, Optional
+import asyncio
+import re
+from typing import List, Dict, Optional, Sequence
+import numpy as np
 from loguru import logger
-from openai import AzureOpenAI
+from openai import AsyncAzureOpenAI
 from config.settings import settings
+from backend.services.azure_openai_client import azure_openai_client
+from backend.services.embedding_cache import EMBEDDING_DTYPE, EmbeddingCache
+from backend.utils.event_loops import LoopLocal
+from backend.utils.tokens import pack_embedding_batches
 import time
 
+_WHITESPACE = re.compile(r"\s+")
+
+# Bumped whenever _normalize_text changes, so vectors cached under an older
+# normalization are never matched (v1 also case-folded, merging "US" and "us")
+_NEAR_DUPLICATE_KEY_VERSION = "2"
+
+
+def _normalize_text(text: str) -> str:
+    """
+    Canonical form used to match near-duplicate texts.
+
+    Only spacing and trailing punctuation are normalized; case is kept, since
+    it carries meaning in UN transcripts ("US"/"us", "WHO"/"who").
+    """
+    return _WHITESPACE.sub(" ", text).strip().rstrip(".!?;:")
+
 
 class EmbeddingService:
     """Service for generating and managing text embeddings."""
 
     def __init__(self):
         """Initialize the embedding service with Azure OpenAI client."""
-        self.client = AzureOpenAI(
-            api_key=settings.AZURE_OPENAI_API_KEY,
-            api_version=settings.AZURE_OPENAI_API_VERSION,
-            azure_endpoint=settings.AZURE_OPENAI_ENDPOINT
-        )
         self.model = settings.EMBEDDING_MODEL
-        self.embedding_cache: Dict[str, List[float]] = {}  # In-memory cache
+        self.embedding_cache = EmbeddingCache(
+            settings.EMBEDDING_CACHE_PATH,
+            max_memory_items=settings.EMBEDDING_CACHE_MAX
+        )
         self.cache_hits = 0
+        self.near_duplicate_hits = 0
         self.cache_misses = 0
         self.total_tokens_used = 0
+        # Embeddings currently being fetched, so concurrent callers asking for
+        # the same text share one request instead of racing. Futures belong to
+        # the loop that created them, so each loop tracks its own.
+        self._inflight_by_loop: LoopLocal[Dict[bytes, asyncio.Future]] = LoopLocal(dict)
+
+    @property
+    def client(self) -> AsyncAzureOpenAI:
+        """The shared Azure OpenAI client for the running event loop."""
+        return azure_openai_client.client
 
-    def _get_cache_key(self, text: str) -> str:
+    def _get_cache_key(self, text: str) -> bytes:
         """Generate a cache key for the text."""
-        return hashlib.md5(text.encode('utf-8')).hexdigest()
+        return EmbeddingCache.make_key(self.model, text)
+
+    def _get_near_duplicate_key(self, text: str) -> bytes:
+        """Generate a cache key shared by texts with the same normalized form."""
+        return EmbeddingCache.make_key(
+            f"{self.model}:normalized:v{_NEAR_DUPLICATE_KEY_VERSION}",
+            _normalize_text(text)
+        )
+
+    def _lookup_cached(self, texts: Sequence[str]) -> Dict[int, np.ndarray]:
+        """
+        Find cached embeddings by exact text, then by normalized text.
+
+        Args:
+            texts: Texts to look up
+
+        Returns:
+            Mapping of input index to cached embedding
+        """
+        exact_keys = list(map(self._get_cache_key, texts))
+        exact = self.embedding_cache.get_many(exact_keys)
+        found: Dict[int, np.ndarray] = {}
+        missing: List[int] = []
+        for idx, vector in enumerate(map(exact.get, exact_keys)):
+            if vector is None:
+                missing.append(idx)
+            else:
+                found[idx] = vector
+        self.cache_hits += len(found)
+
+        if missing and settings.EMBEDDING_NEAR_DUPLICATE_CACHE:
+            near_keys = {idx: self._get_near_duplicate_key(texts[idx]) for idx in missing}
+            near = self.embedding_cache.get_many(near_keys.values())
+            exact_found = len(found)
+            for idx, key in near_keys.items():
+                if key in near:
+                    found[idx] = near[key]
+            self.near_duplicate_hits += len(found) - exact_found
+
+        self.cache_misses += len(texts) - len(found)
+        return found
+
+    def _inflight(self) -> Dict[bytes, asyncio.Future]:
+        """Get the in-flight requests of the running event loop."""
+        return self._inflight_by_loop.get()
+
+    def _claim_inflight(self, keys: Sequence[bytes]) -> Dict[bytes, asyncio.Future]:
+        """
+        Register futures for keys this caller is about to fetch.
+
+        Args:
+            keys: Cache keys of the texts being requested
+
+        Returns:
+            Mapping of key to the future the caller must resolve
+        """
+        loop = asyncio.get_running_loop()
+        inflight = self._inflight()
+        futures = {}
+        for key in keys:
+            future = loop.create_future()
+            future.add_done_callback(lambda f, key=key: self._release_inflight(inflight, key, f))
+            inflight[key] = futures[key] = future
+        return futures
+
+    @staticmethod
+    def _release_inflight(
+        inflight: Dict[bytes, asyncio.Future],
+        key: bytes,
+        future: asyncio.Future
+    ) -> None:
+        """Unregister a resolved in-flight future."""
+        inflight.pop(key, None)
+        # Reading the exception keeps asyncio quiet when nobody else was waiting
+        if not future.cancelled():
+            future.exception()
+
+    def _store_cached(self, texts: Sequence[str], embeddings: Sequence[np.ndarray]) -> None:
+        """Cache embeddings under their exact and normalized text keys."""
+        keys = [self._get_cache_key(text) for text in texts]
+        vectors = list(embeddings)
+        if settings.EMBEDDING_NEAR_DUPLICATE_CACHE:
+            keys += [self._get_near_duplicate_key(text) for text in texts]
+            vectors += vectors
+        self.embedding_cache.put_many(keys, vectors)
 
     async def generate_embedding(
         self,
         text: str,
         use_cache: bool = True
-    ) -> List[float]:
+    ) -> np.ndarray:
         """
         Generate embedding for a single text.
 
@@ -49,155 +164,195 @@ class EmbeddingService:
             use_cache: Whether to use cache
 
         Returns:
-            Embedding vector
+            Embedding vector (float16)
         """
         if not text or not text.strip():
             raise ValueError("Text cannot be empty")
 
         # Check cache
         if use_cache:
-            cache_key = self._get_cache_key(text)
-            if cache_key in self.embedding_cache:
-                self.cache_hits += 1
-                logger.debug(f"Cache hit for text: {text[:50]}...")
-                return self.embedding_cache[cache_key]
-            self.cache_misses += 1
+            cached = self._lookup_cached([text]).get(0)
+            if cached is not None:
+                logger.opt(lazy=True).debug("Cache hit for text: {}...", lambda: text[:50])
+                return cached
+
+        # Join a request for the same text that is already in flight
+        key = self._get_cache_key(text)
+        pending = self._inflight().get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        future = self._claim_inflight([key])[key]
 
         # Generate embedding
         try:
-            response = self.client.embeddings.create(
+            response = await self.client.embeddings.create(
                 model=self.model,
                 input=text
             )
 
-            embedding = response.data[0].embedding
+            embedding = np.asarray(response.data[0].embedding, dtype=EMBEDDING_DTYPE)
             self.total_tokens_used += response.usage.total_tokens
+            future.set_result(embedding)
 
             # Cache the result
             if use_cache:
-                self.embedding_cache[cache_key] = embedding
+                self._store_cached([text], [embedding])
 
-            logger.debug(
-                f"Generated embedding for text: {text[:50]}... "
-                f"(dimension: {len(embedding)})"
+            logger.opt(lazy=True).debug(
+                "Generated embedding for text: {}... (dimension: {})",
+                lambda: text[:50],
+                lambda: len(embedding)
             )
 
             return embedding
 
         except Exception as e:
+            future.set_exception(e)
             logger.error(f"Error generating embedding: {str(e)}")
             raise
 
+        finally:
+            # Release waiters if this call was cancelled mid-request
+            future.cancel()
+
     async def generate_embeddings_batch(
         self,
         texts: List[str],
         use_cache: bool = True,
         batch_size: int = None
-    ) -> List[List[float]]:
+    ) -> List[np.ndarray]:
         """
         Generate embeddings for multiple texts in batches.
 
+        Batches are packed by token count so each request stays under the
+        embedding token limit without wasting round-trips on short texts.
+
         Args:
             texts: List of texts to embed
             use_cache: Whether to use cache
-            batch_size: Batch size (default from settings)
+            batch_size: Maximum texts per batch (default from settings)
 
         Returns:
-            List of embedding vectors
+            List of embedding vectors (float16)
         """
         if not texts:
             return []
 
-        batch_size = batch_size or settings.EMBEDDING_BATCH_SIZE
-        embeddings = []
+        start_ns = time.perf_counter_ns()
 
-        logger.info(f"Generating embeddings for {len(texts)} texts in batches of {batch_size}")
+        # Check cache first
+        cached = self._lookup_cached(texts) if use_cache else {}
+        embeddings: List[Optional[np.ndarray]] = [cached.get(idx) for idx in range(len(texts))]
 
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
-            batch_start = time.time()
+        # Send each distinct uncached text once; duplicates share its result
+        positions: Dict[str, List[int]] = {}
+        for idx, text in enumerate(texts):
+            if idx not in cached:
+                positions.setdefault(text, []).append(idx)
 
-            # Check cache first
-            cached_embeddings = []
-            uncached_texts = []
-            uncached_indices = []
+        # Texts another caller is already fetching are awaited, not re-sent
+        keys = {text: self._get_cache_key(text) for text in positions}
+        inflight = self._inflight()
+        joined = {text: inflight[key] for text, key in keys.items() if key in inflight}
+        unique_texts = [text for text in positions if text not in joined]
+        futures = self._claim_inflight([keys[text] for text in unique_texts])
 
-            for idx, text in enumerate(batch):
-                if use_cache:
-                    cache_key = self._get_cache_key(text)
-                    if cache_key in self.embedding_cache:
-                        cached_embeddings.append((idx, self.embedding_cache[cache_key]))
-                        self.cache_hits += 1
-                        continue
+        batches = pack_embedding_batches(unique_texts, max_items=batch_size)
 
-                uncached_texts.append(text)
-                uncached_indices.append(idx)
-                if use_cache:
-                    self.cache_misses += 1
+        logger.info(
+            f"Generating embeddings for {len(unique_texts)} unique of {len(texts)} texts "
+            f"in {len(batches)} batches"
+        )
 
-            # Generate embeddings for uncached texts
-            new_embeddings = []
-            if uncached_texts:
+        # Embed uncached texts, several batches in flight at once
+        semaphore = asyncio.Semaphore(settings.EMBEDDING_CONCURRENCY)
+
+        async def embed_batch(batch: List[str]) -> None:
+            async with semaphore:
                 try:
-                    response = self.client.embeddings.create(
+                    response = await self.client.embeddings.create(
                         model=self.model,
-                        input=uncached_texts
+                        input=batch
                     )
-
-                    new_embeddings = [item.embedding for item in response.data]
-                    self.total_tokens_used += response.usage.total_tokens
-
-                    # Cache new embeddings
-                    if use_cache:
-                        for text, embedding in zip(uncached_texts, new_embeddings):
-                            cache_key = self._get_cache_key(text)
-                            self.embedding_cache[cache_key] = embedding
-
                 except Exception as e:
+                    for text in batch:
+                        if not futures[keys[text]].done():
+                            futures[keys[text]].set_exception(e)
                     logger.error(f"Error in batch embedding generation: {str(e)}")
                     raise
 
-            # Combine cached and new embeddings in correct order
-            batch_embeddings = [None] * len(batch)
-            for idx, embedding in cached_embeddings:
-                batch_embeddings[idx] = embedding
-            for idx, embedding in zip(uncached_indices, new_embeddings):
-                batch_embeddings[idx] = embedding
+            new_embeddings = list(np.asarray(
+                [item.embedding for item in response.data],
+                dtype=EMBEDDING_DTYPE
+            ))
+            self.total_tokens_used += response.usage.total_tokens
 
-            embeddings.extend(batch_embeddings)
+            # Cache new embeddings
+            if use_cache:
+                self._store_cached(batch, new_embeddings)
 
-            batch_time = time.time() - batch_start
-            logger.info(
-                f"Batch {i // batch_size + 1}: Generated {len(uncached_texts)} new, "
-                f"retrieved {len(cached_embeddings)} cached embeddings in {batch_time:.2f}s"
-            )
+            for text, embedding in zip(batch, new_embeddings):
+                if not futures[keys[text]].done():
+                    futures[keys[text]].set_result(embedding)
+                for idx in positions[text]:
+                    embeddings[idx] = embedding
 
-        logger.info(
-            f"Embedding generation complete. "
-            f"Cache hits: {self.cache_hits}, misses: {self.cache_misses}, "
-            f"total tokens: {self.total_tokens_used}"
+        try:
+            await asyncio.gather(*(embed_batch(batch) for batch in batches))
+        except Exception as e:
+            # Callers that joined texts of batches which never finished get
+            # the real API error, not a CancelledError they would mistake
+            # for their own cancellation
+            for future in futures.values():
+                if not future.done():
+                    future.set_exception(e)
+            raise
+        finally:
+            # Anything still unresolved means this call itself was cancelled
+            for future in futures.values():
+                future.cancel()
+
+        for text, pending in joined.items():
+            embedding = await asyncio.shield(pending)
+            for idx in positions[text]:
+                embeddings[idx] = embedding
+
+        elapsed_ns = time.perf_counter_ns() - start_ns
+        logger.opt(lazy=True).info(
+            "Generated {} new, retrieved {} cached embeddings in {:.2f}s "
+            "(cache hits: {}, misses: {}, total tokens: {})",
+            lambda: len(unique_texts),
+            lambda: len(cached),
+            lambda: elapsed_ns / 1e9,
+            lambda: self.cache_hits + self.near_duplicate_hits,
+            lambda: self.cache_misses,
+            lambda: self.total_tokens_used
         )
 
         return embeddings
 
     def get_cache_stats(self) -> Dict:
         """Get cache statistics."""
-        total = self.cache_hits + self.cache_misses
-        hit_rate = (self.cache_hits / total * 100) if total > 0 else 0
+        hits = self.cache_hits + self.near_duplicate_hits
+        total = hits + self.cache_misses
+        hit_rate = (hits / total * 100) if total > 0 else 0
 
         return {
             "cache_size": len(self.embedding_cache),
-            "cache_hits": self.cache_hits,
+            "cache_hits": hits,
+            "exact_hits": self.cache_hits,
+            "near_duplicate_hits": self.near_duplicate_hits,
             "cache_misses": self.cache_misses,
             "hit_rate_percent": round(hit_rate, 2),
             "total_tokens_used": self.total_tokens_used
         }
 
     def clear_cache(self):
-        """Clear the embedding cache."""
+        """Clear the in-memory embedding cache."""
         cache_size = len(self.embedding_cache)
         self.embedding_cache.clear()
         self.cache_hits = 0
+        self.near_duplicate_hits = 0
         self.cache_misses = 0
         logger.info(f"Cleared embedding cache ({cache_size} entries)")
 
@@ -0,0 +1,140 @@
+"""
+Persistent LLM Result Cache
+Content-addressed SQLite cache for transcription, entity extraction and
+summary results. Keys are SHA-256 digests of every input that shapes a
+result (audio bytes or text, model, prompt version), so reprocessing the
+same content skips the API call entirely.
+"""
+
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional, Union
+
+import orjson
+from loguru import logger
+
+
+class LLMResultCache:
+    """JSON results of model calls, stored on disk under content digests."""
+
+    def __init__(self, db_path: str):
+        """
+        Initialize the cache.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(*parts: Union[str, bytes]) -> bytes:
+        """
+        Build a cache key from the inputs a result depends on.
+
+        Each part is length-prefixed so different splits of the same bytes
+        (e.g. title + text) can never collide.
+        """
+        digest = hashlib.sha256()
+        for part in parts:
+            data = part.encode('utf-8') if isinstance(part, str) else part
+            digest.update(len(data).to_bytes(8, 'big'))
+            digest.update(data)
+        return digest.digest()
+
+    @staticmethod
+    def digest_files(paths: Iterable[str]) -> bytes:
+        """
+        Hash the contents of files in order.
+
+        Blocking; run it in a worker thread for large audio files.
+
+        Args:
+            paths: File paths
+
+        Returns:
+            SHA-256 digest of the length-prefixed file contents
+        """
+        digest = hashlib.sha256()
+        for path in paths:
+            with open(path, "rb") as f:
+                file_digest = hashlib.file_digest(f, "sha256").digest()
+            digest.update(len(file_digest).to_bytes(8, 'big'))
+            digest.update(file_digest)
+        return digest.digest()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the SQLite database on first use."""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            # Shared by every worker on the host; WAL lets readers proceed
+            # while one worker writes
+            self._conn = sqlite3.connect(str(self.db_path), timeout=5.0, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_results (key BLOB PRIMARY KEY, payload BLOB NOT NULL)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get(self, key: bytes, validate: Optional[Callable[[Any], bool]] = None) -> Optional[Any]:
+        """
+        Look up a cached result.
+
+        Args:
+            key: Cache key from make_key
+            validate: Optional check of the decoded payload; entries that fail
+                it (e.g. written by an older schema) are evicted
+
+        Returns:
+            Cached result or None on a miss
+        """
+        with self._lock:
+            try:
+                conn = self._connect()
+                row = conn.execute("SELECT payload FROM llm_results WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    self.misses += 1
+                    return None
+
+                value = orjson.loads(row[0])
+                if validate is not None and not validate(value):
+                    logger.warning("Evicting LLM cache entry with unexpected shape")
+                    conn.execute("DELETE FROM llm_results WHERE key = ?", (key,))
+                    conn.commit()
+                    self.misses += 1
+                    return None
+
+                self.hits += 1
+                return value
+
+            except (sqlite3.Error, orjson.JSONDecodeError) as e:
+                logger.warning(f"LLM cache read failed: {str(e)}")
+                self.misses += 1
+                return None
+
+    def set(self, key: bytes, value: Any) -> None:
+        """
+        Store a result.
+
+        Args:
+            key: Cache key from make_key
+            value: JSON-serializable result
+        """
+        with self._lock:
+            try:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_results (key, payload) VALUES (?, ?)",
+                    (key, orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY))
+                )
+                conn.commit()
+
+            except (sqlite3.Error, TypeError) as e:
+                logger.warning(f"LLM cache write failed: {str(e)}")
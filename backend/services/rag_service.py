@@ -7,37 +7,93 @@ Features:
 - Re-ranking and relevance scoring
 - Citation tracking with timestamps
 - Cross-session search
+- Semantic answer cache for paraphrased repeat questions
 """
 
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass
+from typing import AsyncIterator, List, Dict, Optional, Tuple
+from contextlib import aclosing
+from dataclasses import dataclass, field
 from loguru import logger
-from openai import AzureOpenAI
+import asyncio
+import io
+import numpy as np
+import orjson
+from openai import AsyncAzureOpenAI
 from config.settings import settings
+from backend.services.azure_openai_client import azure_openai_client
 from backend.services.embedding_service import embedding_service
+from backend.services.semantic_cache import SemanticCache
 from backend.services.vector_store import vector_store, VectorSegment
-import json
+from backend.utils.event_loops import LoopLocal
+from backend.utils.tokens import count_chat_tokens
+from backend.utils.ttl_cache import TTLCache
 import re
 
+# "[Source N]" citation markers in generated answers
+_SOURCE_CITATION_RE = re.compile(r'\[Source (\d+)\]')
 
-@dataclass
+_ANSWER_SYSTEM_PROMPT_PREFIX = """You are an expert analyst of UN session transcripts. Your role is to provide accurate, well-sourced answers to questions about UN sessions.
+
+Guidelines:
+1. Base your answer ONLY on the provided transcript excerpts
+2. Cite your sources using [Source X] notation
+3. If the information isn't in the provided excerpts, say so clearly
+4. Be objective and accurate - this is for diplomatic analysis
+5. Include relevant speaker names, countries, and context
+6. If speakers disagree, present both perspectives
+7. Quote directly when it adds value
+
+Context from UN session transcripts:
+"""
+_ANSWER_PREFIX_TOKENS = count_chat_tokens([_ANSWER_SYSTEM_PROMPT_PREFIX])[0]
+
+# Azure API versions older than this reject stream_options, so usage is not
+# reported on streamed answers and is counted locally instead
+_STREAM_USAGE_MIN_API_VERSION = "2024-09-01"
+_STREAM_OPTIONS = (
+    {"stream_options": {"include_usage": True}}
+    if settings.AZURE_OPENAI_API_VERSION[:10] >= _STREAM_USAGE_MIN_API_VERSION
+    else {}
+)
+
+_EXPANSION_PROMPT = """You are a query expansion and decomposition expert for UN session transcripts.
+Given a user question, return a JSON object with two lists:
+
+"queries": {num_queries} different search queries that would help find relevant information. Each query should:
+1. Rephrase the question differently
+2. Focus on different aspects of the question
+3. Use different keywords and terminology
+4. Be concise and specific
+
+"sub_questions": if the question is complex, 2-4 simpler sub-questions that, when answered together, fully address it. Each sub-question should be independently answerable, simple and focused, and together they should cover all aspects of the original question. Use an empty list for simple questions.
+
+Return ONLY the JSON object, e.g. {{"queries": ["..."], "sub_questions": ["..."]}}"""
+
+
+@dataclass(slots=True)
 class SearchResult:
     """Represents a search result with citation information."""
     segment: VectorSegment
     similarity_score: float
     rank: int
+    # Rank-independent part of the citation, formatted on first use
+    _citation_body: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def to_citation(self) -> str:
         """Format as a citation string."""
-        speaker = f"{self.segment.speaker_name}" if self.segment.speaker_name else "Unknown Speaker"
-        country = f" ({self.segment.country})" if self.segment.country else ""
-        time = f" at {self.segment.start_time}" if self.segment.start_time else ""
-
-        return (
-            f"[{self.rank}] {speaker}{country}, "
-            f"'{self.segment.session_title}'{time}: "
-            f'"{self.segment.text[:100]}..."'
-        )
+        if self._citation_body is None:
+            segment = self.segment
+            speaker = f"{segment.speaker_name}" if segment.speaker_name else "Unknown Speaker"
+            country = f" ({segment.country})" if segment.country else ""
+            time = f" at {segment.start_time}" if segment.start_time else ""
+
+            self._citation_body = (
+                f"{speaker}{country}, "
+                f"'{segment.session_title}'{time}: "
+                f'"{segment.text[:100]}..."'
+            )
+
+        return f"[{self.rank}] {self._citation_body}"
 
 
 class RAGService:
@@ -45,68 +101,133 @@ class RAGService:
 
     def __init__(self):
         """Initialize RAG service."""
-        self.client = AzureOpenAI(
-            api_key=settings.AZURE_OPENAI_API_KEY,
-            api_version=settings.AZURE_OPENAI_API_VERSION,
-            azure_endpoint=settings.AZURE_OPENAI_ENDPOINT
-        )
         self.chat_model = settings.CHAT_MODEL
 
-    async def generate_multi_queries(
-        self,
-        user_question: str,
-        num_queries: int = 3
-    ) -> List[str]:
+        # Answers keyed by question embedding; dropped whenever the vector
+        # store changes so newly ingested sessions are never hidden
+        self.answer_cache = SemanticCache(
+            threshold=settings.SEMANTIC_CACHE_THRESHOLD,
+            max_buckets=settings.SEMANTIC_CACHE_MAX_BUCKETS
+        )
+        self._answer_cache_generation = vector_store.generation
+        # Question expansions, reused across retrievals of the same question
+        self._expansion_cache = TTLCache(maxsize=256, ttl=3600.0)
+
+        # Bounds in-flight chat completions across concurrent retrievals
+        self._llm_semaphores: LoopLocal[asyncio.Semaphore] = LoopLocal(
+            lambda: asyncio.Semaphore(settings.MAX_CONCURRENT_LLM)
+        )
+
+    @property
+    def client(self) -> AsyncAzureOpenAI:
+        """The shared Azure OpenAI client for the running event loop."""
+        return azure_openai_client.client
+
+    def _llm_slots(self) -> asyncio.Semaphore:
+        """Get the LLM semaphore for the running event loop."""
+        return self._llm_semaphores.get()
+
+    async def _create_chat_completion(self, **kwargs):
+        """Run a chat completion within the concurrency and rate limits."""
+        async with self._llm_slots():
+            await azure_openai_client.chat_limiter.acquire()
+            return await self.client.chat.completions.create(**kwargs)
+
+    @staticmethod
+    def _source_payload(result: SearchResult) -> Dict:
+        """Build the response payload describing one cited source."""
+        seg = result.segment
+        return {
+            "rank": result.rank,
+            "session_id": seg.session_id,
+            "session_title": seg.session_title,
+            "speaker_name": seg.speaker_name,
+            "country": seg.country,
+            "text": seg.text,
+            "start_time": seg.start_time,
+            "end_time": seg.end_time,
+            "similarity_score": round(result.similarity_score, 3),
+            "citation": result.to_citation()
+        }
+
+    async def expand_question(self, question: str, num_queries: int = 3) -> Dict[str, List[str]]:
         """
-        Generate multiple search queries from a single user question.
+        Expand a question into search queries and sub-questions in one call.
 
-        This improves retrieval by exploring different phrasings and aspects
-        of the question.
+        Results are cached per question, so repeated expansions (e.g. the
+        per-session retrievals of a cross-session analysis) reuse one call.
 
         Args:
-            user_question: Original user question
-            num_queries: Number of queries to generate
+            question: Original user question
+            num_queries: Number of alternative search queries to generate
 
         Returns:
-            List of search queries
+            Dict with "queries" (rephrasings for retrieval) and
+            "sub_questions" (decomposition; empty for simple questions)
         """
-        system_prompt = """You are a query expansion expert for UN session transcripts.
-Given a user question, generate {num_queries} different search queries that would help find relevant information.
-
-Each query should:
-1. Rephrase the question differently
-2. Focus on different aspects of the question
-3. Use different keywords and terminology
-4. Be concise and specific
+        cache_key = (question, num_queries)
+        cached = self._expansion_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-Return ONLY the queries, one per line, without numbering or extra text.""".format(num_queries=num_queries)
+        system_prompt = _EXPANSION_PROMPT.format(num_queries=num_queries)
 
         try:
-            response = self.client.chat.completions.create(
+            response = await self._create_chat_completion(
                 model=self.chat_model,
                 messages=[
                     {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_question}
+                    {"role": "user", "content": question}
                 ],
-                temperature=0.7,
-                max_tokens=200
+                response_format={"type": "json_object"},
+                temperature=0.5,
+                max_tokens=500
             )
 
-            queries_text = response.choices[0].message.content
-            queries = [q.strip() for q in queries_text.strip().split('\n') if q.strip()]
-
-            # Always include the original question
-            if user_question not in queries:
-                queries.insert(0, user_question)
+            payload = orjson.loads(response.choices[0].message.content)
+            expansion = {
+                key: [q.strip() for q in payload.get(key, []) if isinstance(q, str) and q.strip()]
+                for key in ("queries", "sub_questions")
+            }
 
-            logger.info(f"Generated {len(queries)} search queries from: {user_question}")
-            logger.debug(f"Queries: {queries}")
+            logger.info(
+                f"Expanded question into {len(expansion['queries'])} queries and "
+                f"{len(expansion['sub_questions'])} sub-questions: {question}"
+            )
+            logger.debug(f"Expansion: {expansion}")
 
-            return queries[:num_queries + 1]  # +1 for original
+            self._expansion_cache.put(cache_key, expansion)
+            return expansion
 
         except Exception as e:
-            logger.error(f"Error generating multi-queries: {str(e)}")
-            return [user_question]  # Fallback to original question
+            logger.error(f"Error expanding question: {str(e)}")
+            return {"queries": [], "sub_questions": []}
+
+    async def generate_multi_queries(
+        self,
+        user_question: str,
+        num_queries: int = 3
+    ) -> List[str]:
+        """
+        Generate multiple search queries from a single user question.
+
+        This improves retrieval by exploring different phrasings and aspects
+        of the question.
+
+        Args:
+            user_question: Original user question
+            num_queries: Number of queries to generate
+
+        Returns:
+            List of search queries
+        """
+        queries = list((await self.expand_question(user_question, num_queries))["queries"])
+
+        # Always include the original question
+        if user_question not in queries:
+            queries.insert(0, user_question)
+
+        return queries[:num_queries + 1]  # +1 for original
 
     async def decompose_query(self, complex_question: str) -> List[str]:
         """
@@ -124,40 +245,8 @@ Return ONLY the queries, one per line, without numbering or extra text.""".forma
         Returns:
             List of simpler sub-questions
         """
-        system_prompt = """You are a question decomposition expert for UN session analysis.
-Given a complex question, break it down into simpler sub-questions that, when answered together, would fully address the original question.
-
-Rules:
-1. Each sub-question should be independently answerable
-2. Sub-questions should be simple and focused
-3. Together, they should cover all aspects of the original question
-4. Return 2-4 sub-questions maximum
-5. Return ONLY the sub-questions, one per line"""
-
-        try:
-            response = self.client.chat.completions.create(
-                model=self.chat_model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": complex_question}
-                ],
-                temperature=0.3,
-                max_tokens=300
-            )
-
-            questions_text = response.choices[0].message.content
-            sub_questions = [q.strip() for q in questions_text.strip().split('\n') if q.strip()]
-
-            if len(sub_questions) > 1:
-                logger.info(f"Decomposed into {len(sub_questions)} sub-questions")
-                logger.debug(f"Sub-questions: {sub_questions}")
-                return sub_questions
-            else:
-                return [complex_question]
-
-        except Exception as e:
-            logger.error(f"Error decomposing query: {str(e)}")
-            return [complex_question]
+        sub_questions = (await self.expand_question(complex_question))["sub_questions"]
+        return list(sub_questions) if len(sub_questions) > 1 else [complex_question]
 
     async def retrieve_relevant_segments(
         self,
@@ -165,6 +254,7 @@ Rules:
         top_k: int = 10,
         use_multi_query: bool = True,
         session_id: Optional[str] = None,
+        precomputed_queries: Optional[List[str]] = None,
         **filters
     ) -> List[SearchResult]:
         """
@@ -175,6 +265,8 @@ Rules:
             top_k: Number of segments to retrieve
             use_multi_query: Whether to use multi-query retrieval
             session_id: Optional session ID to limit search
+            precomputed_queries: Search queries already generated for this
+                question; skips query generation when given
             **filters: Additional filters (speaker_name, country, etc.)
 
         Returns:
@@ -182,18 +274,24 @@ Rules:
         """
         logger.info(f"Retrieving segments for question: {question}")
 
-        if use_multi_query:
+        if precomputed_queries:
+            queries = precomputed_queries
+        elif use_multi_query:
             # Generate multiple queries
             queries = await self.generate_multi_queries(question, num_queries=2)
         else:
             queries = [question]
 
+        # The model sometimes echoes the question back; embed and score each
+        # distinct query once (order preserved, the original stays first)
+        queries = list(dict.fromkeys(queries))
+
         # Generate embeddings for all queries
         query_embeddings = await embedding_service.generate_embeddings_batch(queries)
 
-        # Search with all query embeddings
-        results = vector_store.search_multi_query(
-            query_embeddings=query_embeddings,
+        # Score every query against the store in one pass
+        results = vector_store.batch_search(
+            np.asarray(query_embeddings, dtype=np.float32),
             top_k=top_k,
             session_id=session_id,
             **filters
@@ -209,17 +307,22 @@ Rules:
 
         return search_results
 
-    async def answer_question(
+    async def answer_question_stream(
         self,
         question: str,
         session_id: Optional[str] = None,
         chat_history: Optional[List[Dict]] = None,
         top_k: int = 10,
         use_multi_query: bool = True,
+        result: Optional[Dict] = None,
         **filters
-    ) -> Dict:
+    ) -> AsyncIterator[str]:
         """
-        Answer a question using RAG.
+        Answer a question using RAG, streaming the answer as it is generated.
+
+        Callers can render the first tokens while the rest of the answer is
+        still being generated; citations and source payloads are assembled
+        once the stream ends.
 
         Args:
             question: User question
@@ -227,13 +330,37 @@ Rules:
             chat_history: Previous chat messages for context
             top_k: Number of segments to retrieve
             use_multi_query: Use multi-query retrieval
+            result: Optional dict filled with answer, sources, and metadata
+                once the stream completes
             **filters: Additional filters
 
-        Returns:
-            Dict with answer, sources, and metadata
+        Yields:
+            Answer text fragments
         """
+        if result is None:
+            result = {}
+
         logger.info(f"Answering question: {question}")
 
+        # Follow-up questions depend on the conversation, so only standalone
+        # questions are served from the answer cache
+        use_answer_cache = settings.SEMANTIC_CACHE_ENABLED and not chat_history
+        if use_answer_cache:
+            if self._answer_cache_generation != vector_store.generation:
+                self.answer_cache.clear()
+                self._answer_cache_generation = vector_store.generation
+
+            cache_bucket = SemanticCache.make_bucket(
+                self.chat_model, session_id, top_k, use_multi_query, filters
+            )
+            question_embedding = (await embedding_service.generate_embeddings_batch([question]))[0]
+            cached = self.answer_cache.lookup(cache_bucket, question_embedding)
+            if cached is not None:
+                logger.info("Answer served from semantic cache")
+                result.update(cached, metadata={**cached["metadata"], "cached": True})
+                yield cached["answer"]
+                return
+
         # Retrieve relevant segments
         search_results = await self.retrieve_relevant_segments(
             question=question,
@@ -243,48 +370,93 @@ Rules:
             **filters
         )
 
+        # aclosing: if our consumer stops early, the inner stream (and its
+        # HTTP response) is closed with us rather than on garbage collection
+        async with aclosing(self._stream_answer_from_results(
+            question,
+            search_results,
+            chat_history=chat_history,
+            result=result,
+            use_multi_query=use_multi_query
+        )) as answer_stream:
+            async for text in answer_stream:
+                yield text
+
+        if use_answer_cache and result["metadata"]["query_success"]:
+            self.answer_cache.store(cache_bucket, question_embedding, dict(result))
+
+    async def _stream_answer_from_results(
+        self,
+        question: str,
+        search_results: List[SearchResult],
+        chat_history: Optional[List[Dict]] = None,
+        result: Optional[Dict] = None,
+        use_multi_query: bool = False
+    ) -> AsyncIterator[str]:
+        """
+        Stream an answer grounded in already-retrieved segments.
+
+        Args:
+            question: User question
+            search_results: Ranked segments to answer from
+            chat_history: Previous chat messages for context
+            result: Optional dict filled with answer, sources, and metadata
+                once the stream completes
+            use_multi_query: Whether multi-query retrieval produced the
+                results (reported in metadata)
+
+        Yields:
+            Answer text fragments
+        """
+        if result is None:
+            result = {}
+
         if not search_results:
-            return {
-                "answer": "I couldn't find any relevant information in the transcripts to answer this question.",
-                "sources": [],
-                "metadata": {
+            result.update(
+                answer="I couldn't find any relevant information in the transcripts to answer this question.",
+                sources=[],
+                metadata={
                     "segments_retrieved": 0,
                     "query_success": False
                 }
-            }
+            )
+            yield result["answer"]
+            return
 
-        # Build context from retrieved segments
-        context_parts = []
-        for result in search_results:
-            seg = result.segment
+        # Format each retrieved excerpt as a source block
+        source_blocks = []
+        for search_result in search_results:
+            seg = search_result.segment
             speaker = f"{seg.speaker_name}" if seg.speaker_name else "Unknown Speaker"
             country = f" ({seg.country})" if seg.country else ""
             time = f" [{seg.start_time}]" if seg.start_time else ""
 
-            context_parts.append(
-                f"[Source {result.rank}] {speaker}{country}{time}:\n{seg.text}"
-            )
-
-        context = "\n\n".join(context_parts)
-
-        # Build system prompt
-        system_prompt = """You are an expert analyst of UN session transcripts. Your role is to provide accurate, well-sourced answers to questions about UN sessions.
-
-Guidelines:
-1. Base your answer ONLY on the provided transcript excerpts
-2. Cite your sources using [Source X] notation
-3. If the information isn't in the provided excerpts, say so clearly
-4. Be objective and accurate - this is for diplomatic analysis
-5. Include relevant speaker names, countries, and context
-6. If speakers disagree, present both perspectives
-7. Quote directly when it adds value
-
-Context from UN session transcripts:
-{context}"""
+            source_blocks.append(f"[Source {search_result.rank}] {speaker}{country}{time}:\n{seg.text}")
+
+        # Keep the best-ranked sources that fit the prompt token budget
+        budget = settings.CHAT_CONTEXT_BUDGET - _ANSWER_PREFIX_TOKENS - count_chat_tokens([question])[0]
+        kept = 0
+        for block_tokens in count_chat_tokens(source_blocks):
+            budget -= block_tokens + 1  # +1 for the blank-line separator
+            if budget < 0 and kept:
+                break
+            kept += 1
+        if kept < len(search_results):
+            logger.info(f"Context budget fits {kept} of {len(search_results)} retrieved sources")
+            search_results = search_results[:kept]
+
+        # Build the system prompt: fixed instructions, then the excerpts
+        system_prompt = io.StringIO()
+        system_prompt.write(_ANSWER_SYSTEM_PROMPT_PREFIX)
+        separator = ""
+        for block in source_blocks[:kept]:
+            system_prompt.write(separator)
+            system_prompt.write(block)
+            separator = "\n\n"
 
         # Build chat messages
         messages = [
-            {"role": "system", "content": system_prompt.format(context=context)}
+            {"role": "system", "content": system_prompt.getvalue()}
         ]
 
         # Add chat history if provided
@@ -296,52 +468,125 @@ Context from UN session transcripts:
 
         # Generate answer
         try:
-            response = self.client.chat.completions.create(
-                model=self.chat_model,
-                messages=messages,
-                temperature=settings.CHAT_TEMPERATURE,
-                max_tokens=settings.CHAT_MAX_TOKENS
-            )
-
-            answer = response.choices[0].message.content
-            tokens_used = response.usage.total_tokens
+            answer_parts: List[str] = []
+            tokens_used = 0
+
+            # The slot covers starting the request only: it must not be held
+            # across yields, or a consumer that stops reading would keep it
+            # until the generator is garbage-collected
+            async with self._llm_slots():
+                await azure_openai_client.chat_limiter.acquire()
+                stream = await self.client.chat.completions.create(
+                    model=self.chat_model,
+                    messages=messages,
+                    temperature=settings.CHAT_TEMPERATURE,
+                    max_tokens=settings.CHAT_MAX_TOKENS,
+                    stream=True,
+                    **_STREAM_OPTIONS
+                )
+
+            # Closes the response even when the consumer stops early
+            async with stream:
+                async for chunk in stream:
+                    # The final chunk carries usage and no choices
+                    if chunk.usage is not None:
+                        tokens_used = chunk.usage.total_tokens
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        text = chunk.choices[0].delta.content
+                        answer_parts.append(text)
+                        yield text
+
+            answer = "".join(answer_parts)
+            if not _STREAM_OPTIONS:
+                tokens_used = sum(count_chat_tokens([m["content"] for m in messages] + [answer]))
 
             # Extract citations from answer
-            citations = re.findall(r'\[Source (\d+)\]', answer)
-            cited_sources = list(set(int(c) for c in citations))
+            cited_sources = {int(match.group(1)) for match in _SOURCE_CITATION_RE.finditer(answer)}
 
             logger.info(f"Generated answer with {len(cited_sources)} sources cited")
 
-            return {
-                "answer": answer,
-                "sources": [
-                    {
-                        "rank": result.rank,
-                        "session_id": result.segment.session_id,
-                        "session_title": result.segment.session_title,
-                        "speaker_name": result.segment.speaker_name,
-                        "country": result.segment.country,
-                        "text": result.segment.text,
-                        "start_time": result.segment.start_time,
-                        "end_time": result.segment.end_time,
-                        "similarity_score": round(result.similarity_score, 3),
-                        "citation": result.to_citation()
-                    }
-                    for result in search_results
-                ],
-                "metadata": {
+            result.update(
+                answer=answer,
+                sources=[self._source_payload(search_result) for search_result in search_results],
+                metadata={
                     "segments_retrieved": len(search_results),
                     "sources_cited": len(cited_sources),
                     "tokens_used": tokens_used,
                     "query_success": True,
                     "multi_query_used": use_multi_query
                 }
-            }
+            )
 
         except Exception as e:
             logger.error(f"Error generating answer: {str(e)}")
             raise
 
+    async def _generate_answer_from_results(
+        self,
+        question: str,
+        search_results: List[SearchResult],
+        chat_history: Optional[List[Dict]] = None,
+        use_multi_query: bool = False
+    ) -> Dict:
+        """
+        Answer a question from already-retrieved segments without re-searching.
+
+        Args:
+            question: User question
+            search_results: Ranked segments to answer from
+            chat_history: Previous chat messages for context
+            use_multi_query: Whether multi-query retrieval produced the results
+
+        Returns:
+            Dict with answer, sources, and metadata
+        """
+        result: Dict = {}
+        async for _ in self._stream_answer_from_results(
+            question,
+            search_results,
+            chat_history=chat_history,
+            result=result,
+            use_multi_query=use_multi_query
+        ):
+            pass
+        return result
+
+    async def answer_question(
+        self,
+        question: str,
+        session_id: Optional[str] = None,
+        chat_history: Optional[List[Dict]] = None,
+        top_k: int = 10,
+        use_multi_query: bool = True,
+        **filters
+    ) -> Dict:
+        """
+        Answer a question using RAG.
+
+        Args:
+            question: User question
+            session_id: Optional session ID to limit search
+            chat_history: Previous chat messages for context
+            top_k: Number of segments to retrieve
+            use_multi_query: Use multi-query retrieval
+            **filters: Additional filters
+
+        Returns:
+            Dict with answer, sources, and metadata
+        """
+        result: Dict = {}
+        async for _ in self.answer_question_stream(
+            question=question,
+            session_id=session_id,
+            chat_history=chat_history,
+            top_k=top_k,
+            use_multi_query=use_multi_query,
+            result=result,
+            **filters
+        ):
+            pass
+        return result
+
     async def cross_session_analysis(
         self,
         question: str,
@@ -363,16 +608,20 @@ Context from UN session transcripts:
         """
         logger.info(f"Cross-session analysis across {len(session_ids)} sessions")
 
-        # Get results for each session
-        all_results = []
-        for session_id in session_ids:
-            results = await self.retrieve_relevant_segments(
+        # Expand the question once and share the queries across sessions
+        queries = await self.generate_multi_queries(question, num_queries=2)
+
+        # Retrieve from all sessions concurrently
+        per_session_results = await asyncio.gather(*(
+            self.retrieve_relevant_segments(
                 question=question,
                 top_k=top_k_per_session,
                 session_id=session_id,
-                use_multi_query=True
+                precomputed_queries=queries
             )
-            all_results.extend(results)
+            for session_id in session_ids
+        ))
+        all_results = [result for results in per_session_results for result in results]
 
         # Re-rank all results together
         all_results.sort(key=lambda x: x.similarity_score, reverse=True)
@@ -381,12 +630,11 @@ Context from UN session transcripts:
         for idx, result in enumerate(all_results):
             result.rank = idx + 1
 
-        # Generate comparative answer
-        return await self.answer_question(
-            question=f"{question}\n\nProvide a comparative analysis across the sessions, noting any changes or evolution in positions.",
-            session_id=None,  # Already filtered
-            top_k=len(all_results),  # Use all retrieved results
-            use_multi_query=False  # Already done
+        # Generate comparative answer from the merged results
+        return await self._generate_answer_from_results(
+            f"{question}\n\nProvide a comparative analysis across the sessions, noting any changes or evolution in positions.",
+            all_results,
+            use_multi_query=True
         )
 
 
@@ -0,0 +1,55 @@
+"""
+Async Runtime
+Runs service coroutines from synchronous code such as Streamlit pages.
+"""
+
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+from loguru import logger
+
+from backend.services.azure_openai_client import azure_openai_client
+from backend.services.database import db_service
+from backend.services.session_discovery import session_discovery
+
+T = TypeVar("T")
+
+
+async def aclose_clients() -> None:
+    """
+    Close the running loop's service clients (Azure OpenAI, Cosmos DB, UN WebTV).
+
+    Clients of other loops, such as other Streamlit sessions', are left alone.
+    Each is rebuilt on demand by the next call that needs it.
+    """
+    results = await asyncio.gather(
+        azure_openai_client.aclose(),
+        db_service.close(),
+        session_discovery.aclose(),
+        return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            logger.warning(f"Failed to close client: {str(result)}")
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine on a fresh event loop and shut its clients down after.
+
+    Streamlit pages start a new loop for every action; closing the clients
+    before that loop ends keeps their connections from outliving it.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    async def main() -> T:
+        try:
+            return await coro
+        finally:
+            await aclose_clients()
+
+    return asyncio.run(main())
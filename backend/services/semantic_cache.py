@@ -0,0 +1,125 @@
+"""
+Semantic Response Cache
+Caches LLM responses by query embedding so paraphrased repeats of a question
+can be answered without another completion call.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+import orjson
+from loguru import logger
+
+
+class SemanticCache:
+    """
+    Nearest-neighbour cache of LLM responses.
+
+    Entries are grouped into buckets (e.g. model + temperature + context hash)
+    so a hit is only possible between requests that share the same context;
+    within a bucket, a stored response is returned when the cosine similarity
+    of the query embeddings reaches the threshold.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.95,
+        max_entries_per_bucket: int = 1000,
+        max_buckets: int = 256
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a cache hit
+            max_entries_per_bucket: Oldest entries are evicted past this size
+            max_buckets: Least recently used buckets are evicted past this count
+        """
+        self.threshold = threshold
+        self.max_entries_per_bucket = max_entries_per_bucket
+        self.max_buckets = max_buckets
+        # bucket -> (normalized query embeddings, responses), in LRU order
+        self._buckets: "OrderedDict[str, Tuple[np.ndarray, List[Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_bucket(*parts: Any) -> str:
+        """Build a bucket key from the parameters a cached response depends on."""
+        payload = orjson.dumps(
+            parts,
+            default=str,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+        return hashlib.sha256(payload).hexdigest()
+
+    @staticmethod
+    def _normalize(embedding: Sequence[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def lookup(self, bucket: str, embedding: Sequence[float]) -> Optional[Any]:
+        """
+        Find a cached response for a semantically similar query.
+
+        Args:
+            bucket: Bucket key from make_bucket
+            embedding: Query embedding
+
+        Returns:
+            Cached response or None on a miss
+        """
+        with self._lock:
+            entry = self._buckets.get(bucket)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._buckets.move_to_end(bucket)
+            matrix, responses = entry
+            similarities = matrix @ self._normalize(embedding)
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.threshold:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            logger.debug(f"Semantic cache hit (similarity {similarities[best]:.3f})")
+            return responses[best]
+
+    def store(self, bucket: str, embedding: Sequence[float], response: Any) -> None:
+        """
+        Store a response for a query embedding.
+
+        Args:
+            bucket: Bucket key from make_bucket
+            embedding: Query embedding
+            response: Response to return on future hits
+        """
+        vector = self._normalize(embedding)[np.newaxis, :]
+
+        with self._lock:
+            entry = self._buckets.get(bucket)
+            if entry is None:
+                self._buckets[bucket] = (vector, [response])
+                if len(self._buckets) > self.max_buckets:
+                    self._buckets.popitem(last=False)
+                return
+
+            matrix, responses = entry
+            responses.append(response)
+            del responses[:-self.max_entries_per_bucket]
+            self._buckets[bucket] = (np.vstack([matrix, vector])[-self.max_entries_per_bucket:], responses)
+            self._buckets.move_to_end(bucket)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._buckets.clear()
+            self.hits = 0
+            self.misses = 0
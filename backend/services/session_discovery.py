@@ -5,9 +5,17 @@ Discovers and lists UN WebTV sessions by date, category, and other filters.
 import httpx
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any
 from loguru import logger
 import asyncio
+import re
+
+from backend.utils.event_loops import LoopLocal
+
+# Session ID from asset URLs like /en/asset/k1y/k1y7kgo2oc
+_ASSET_RE = re.compile(r'/asset/[^/]+/([a-z0-9]+)')
+# Anchors that point at a video asset
+_ASSET_LINK_SELECTOR = 'a[href*="/asset/"]'
 
 
 class SessionDiscovery:
@@ -18,6 +26,32 @@ class SessionDiscovery:
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
         }
+        # Streamlit sessions each run their own event loops, and a pooled
+        # client belongs to the loop it was created on
+        self._clients: LoopLocal[httpx.AsyncClient] = LoopLocal(self._build_client)
+
+    def _build_client(self) -> httpx.AsyncClient:
+        """Create a pooled HTTP/2 client."""
+        return httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            headers=self.headers,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40)
+        )
+
+    def _http(self) -> httpx.AsyncClient:
+        """
+        Get the pooled HTTP/2 client for the running event loop.
+
+        Connections are reused across calls on the same loop.
+        """
+        return self._clients.get()
+
+    async def aclose(self) -> None:
+        """Close the running loop's pooled HTTP client."""
+        client = self._clients.pop()
+        if client is not None:
+            await client.aclose()
 
     async def discover_sessions_by_date(
         self,
@@ -45,16 +79,15 @@ class SessionDiscovery:
             # In reality, you would need to inspect the UN WebTV website to find their listing pages
             search_url = f"{self.base_url}/en/search"
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                # Try different approaches to discover sessions
+            # Try different approaches to discover sessions
 
-                # Approach 1: Browse recent uploads
-                recent_sessions = await self._scrape_recent_sessions(client, limit)
-                sessions.extend(recent_sessions)
+            # Approach 1: Browse recent uploads
+            recent_sessions = await self._scrape_recent_sessions(limit)
+            sessions.extend(recent_sessions)
 
-                # Approach 2: Search by date (if supported by website)
-                # date_sessions = await self._search_by_date(client, start_date, end_date)
-                # sessions.extend(date_sessions)
+            # Approach 2: Search by date (if supported by website)
+            # date_sessions = await self._search_by_date(start_date, end_date)
+            # sessions.extend(date_sessions)
 
             # Filter by date range
             filtered_sessions = [
@@ -71,7 +104,6 @@ class SessionDiscovery:
 
     async def _scrape_recent_sessions(
         self,
-        client: httpx.AsyncClient,
         limit: int = 50
     ) -> List[Dict[str, Any]]:
         """
@@ -90,18 +122,27 @@ class SessionDiscovery:
                 'ecosoc',
             ]
 
-            for category in categories:
-                category_url = f"{self.base_url}/en/{category}"
+            # Fetch all category pages at once over the shared connection pool
+            client = self._http()
+            responses = await asyncio.gather(
+                *(client.get(f"{self.base_url}/en/{category}") for category in categories),
+                return_exceptions=True
+            )
+
+            discovered_at = datetime.now()
 
+            for category, response in zip(categories, responses):
+                category_name = category.replace('-', ' ').title()
                 try:
-                    response = await client.get(category_url, headers=self.headers)
+                    if isinstance(response, Exception):
+                        raise response
                     if response.status_code == 200:
-                        soup = BeautifulSoup(response.text, 'html.parser')
+                        soup = BeautifulSoup(response.text, 'lxml')
 
                         # Look for video links (adjust selectors based on actual HTML)
-                        video_links = soup.find_all('a', href=lambda x: x and '/asset/' in x)
+                        video_links = soup.select(_ASSET_LINK_SELECTOR, limit=limit)
 
-                        for link in video_links[:limit]:
+                        for link in video_links:
                             href = link.get('href')
                             if href:
                                 full_url = href if href.startswith('http') else f"{self.base_url}{href}"
@@ -109,13 +150,12 @@ class SessionDiscovery:
                                 session_data = {
                                     'url': full_url,
                                     'title': link.get_text(strip=True) or 'Unknown Session',
-                                    'category': category.replace('-', ' ').title(),
-                                    'discovered_at': datetime.now(),
+                                    'category': category_name,
+                                    'discovered_at': discovered_at,
                                 }
 
                                 # Extract session ID from URL
-                                import re
-                                match = re.search(r'/asset/[^/]+/([a-z0-9]+)', full_url)
+                                match = _ASSET_RE.search(full_url)
                                 if match:
                                     session_data['session_id'] = match.group(1)
                                     sessions.append(session_data)
@@ -150,15 +190,13 @@ class SessionDiscovery:
         logger.info(f"Getting sessions for body: {body}")
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                return await self._scrape_body_sessions(client, body, limit)
+            return await self._scrape_body_sessions(body, limit)
         except Exception as e:
             logger.error(f"Failed to get sessions for {body}: {e}")
             return []
 
     async def _scrape_body_sessions(
         self,
-        client: httpx.AsyncClient,
         body: str,
         limit: int
     ) -> List[Dict[str, Any]]:
@@ -168,16 +206,18 @@ class SessionDiscovery:
         body_url = f"{self.base_url}/en/{body}"
 
         try:
-            response = await client.get(body_url, headers=self.headers)
+            response = await self._http().get(body_url)
             if response.status_code != 200:
                 return sessions
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.text, 'lxml')
 
             # Find all video/session links
-            links = soup.find_all('a', href=lambda x: x and '/asset/' in x)
+            links = soup.select(_ASSET_LINK_SELECTOR, limit=limit)
+            body_name = body.replace('-', ' ').title()
+            discovered_at = datetime.now()
 
-            for link in links[:limit]:
+            for link in links:
                 href = link.get('href')
                 if not href:
                     continue
@@ -185,8 +225,7 @@ class SessionDiscovery:
                 full_url = href if href.startswith('http') else f"{self.base_url}{href}"
 
                 # Extract metadata from link
-                import re
-                match = re.search(r'/asset/[^/]+/([a-z0-9]+)', full_url)
+                match = _ASSET_RE.search(full_url)
                 if not match:
                     continue
 
@@ -197,8 +236,8 @@ class SessionDiscovery:
                     'session_id': session_id,
                     'url': full_url,
                     'title': title,
-                    'body': body.replace('-', ' ').title(),
-                    'discovered_at': datetime.now(),
+                    'body': body_name,
+                    'discovered_at': discovered_at,
                 })
 
         except Exception as e:
@@ -3,9 +3,10 @@ Session Processing Orchestrator
 Coordinates the entire workflow of processing a UN WebTV session.
 """
 
+import asyncio
 import uuid
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from loguru import logger
 
 from backend.models.session import (
@@ -19,11 +20,25 @@ from backend.services.untv_scraper import scraper
 from backend.services.audio_processor import audio_processor
 from backend.services.azure_openai_client import azure_openai_client
 from backend.services.database import db_service
+from backend.utils.event_loops import LoopLocal
+from config import settings
 
 
 class SessionProcessor:
     """Orchestrates the processing of UN WebTV sessions."""
 
+    def __init__(self):
+        """Initialize the session processor."""
+        # Bounds concurrent downloads and ffmpeg extraction across sessions;
+        # API calls are throttled separately by the client's rate limiters
+        self._download_semaphores: LoopLocal[asyncio.Semaphore] = LoopLocal(
+            lambda: asyncio.Semaphore(settings.MAX_CONCURRENT_PROCESSING)
+        )
+
+    def _download_slots(self) -> asyncio.Semaphore:
+        """Get the download semaphore for the running event loop."""
+        return self._download_semaphores.get()
+
     async def process_session(
         self,
         url: str,
@@ -41,6 +56,9 @@ class SessionProcessor:
         """
         session_id = None
         audio_path = None
+        chunk_paths = None
+        download_task: Optional[asyncio.Task] = None
+        download_consumed = False
 
         try:
             # Step 1: Extract session ID and check if already processed
@@ -57,7 +75,8 @@ class SessionProcessor:
                 logger.info(f"Session already processed: {session_id}")
                 return existing_session
 
-            # Step 2: Scrape session metadata
+            # Step 2: Scrape session metadata; the audio download only needs
+            # the session ID, so it starts alongside
             await self._update_progress(
                 session_id,
                 "downloading",
@@ -65,9 +84,13 @@ class SessionProcessor:
                 "Extracting session metadata"
             )
 
+            download_task = asyncio.create_task(self._download_audio(url, session_id))
+
             metadata = await scraper.scrape_session_metadata(url)
             if not metadata:
                 logger.error(f"Failed to scrape metadata: {url}")
+                await self._discard_download(download_task)
+                download_consumed = True
                 return None
 
             # Create session record
@@ -86,19 +109,18 @@ class SessionProcessor:
                 "Downloading audio from UN WebTV"
             )
 
-            audio_path = await audio_processor.download_and_extract_audio(
-                url,
-                session_id
-            )
+            download_consumed = True
+            chunk_paths, audio_path = await download_task
 
-            if not audio_path:
-                await self._mark_failed(session_id, "Failed to download audio")
-                return None
+            if not chunk_paths:
+                if not audio_path:
+                    await self._mark_failed(session_id, "Failed to download audio")
+                    return None
 
-            # Validate audio
-            if not await audio_processor.validate_audio_file(audio_path):
-                await self._mark_failed(session_id, "Audio file validation failed")
-                return None
+                # Validate audio
+                if not await audio_processor.validate_audio_file(audio_path):
+                    await self._mark_failed(session_id, "Audio file validation failed")
+                    return None
 
             # Step 4: Transcribe with speaker diarization
             await self._update_progress(
@@ -108,10 +130,17 @@ class SessionProcessor:
                 "Transcribing audio with speaker identification"
             )
 
-            transcription_result = await azure_openai_client.transcribe_audio_with_diarization(
-                audio_path,
-                language=metadata.get("languages", ["en"])[0]
-            )
+            language = metadata.get("languages", ["en"])[0]
+            if chunk_paths:
+                transcription_result = await azure_openai_client.transcribe_audio_chunks(
+                    chunk_paths,
+                    language=language
+                )
+            else:
+                transcription_result = await azure_openai_client.transcribe_audio_with_diarization(
+                    audio_path,
+                    language=language
+                )
 
             if not transcription_result:
                 await self._mark_failed(session_id, "Transcription failed")
@@ -136,47 +165,56 @@ class SessionProcessor:
 
             await db_service.create_transcript(transcript)
 
-            # Step 5: Extract entities
-            await self._update_progress(
-                session_id,
-                "extracting",
-                60,
-                "Extracting entities (speakers, countries, SDGs, topics)"
-            )
-
-            entities_raw = await azure_openai_client.extract_entities(
-                transcription_result["full_text"],
-                session.title
-            )
-
+            # Steps 5-7: The summary builds on the extracted entities, while
+            # embeddings only need the transcript, so the two branches run
+            # concurrently; a failure in either cancels the other
+            async def entities_and_summary():
+                await self._update_progress(
+                    session_id,
+                    "extracting",
+                    60,
+                    "Extracting entities (speakers, countries, SDGs, topics)"
+                )
+
+                entities_raw = await azure_openai_client.extract_entities(
+                    transcription_result["full_text"],
+                    session.title
+                )
+
+                await self._update_progress(
+                    session_id,
+                    "extracting",
+                    75,
+                    "Generating executive summary"
+                )
+
+                summary = await azure_openai_client.generate_summary(
+                    transcription_result["full_text"],
+                    session.title,
+                    entities_raw
+                )
+                return entities_raw, summary
+
+            async def segment_embeddings():
+                await self._update_progress(
+                    session_id,
+                    "embedding",
+                    85,
+                    "Generating embeddings for semantic search"
+                )
+
+                # Create text chunks for embedding
+                segment_texts = [seg.text for seg in transcript.segments]
+                return await azure_openai_client.generate_embeddings(segment_texts)
+
+            async with asyncio.TaskGroup() as tg:
+                analysis_task = tg.create_task(entities_and_summary())
+                embeddings_task = tg.create_task(segment_embeddings())
+
+            entities_raw, summary = analysis_task.result()
+            embeddings = embeddings_task.result()
             entities = self._parse_entities(entities_raw)
 
-            # Step 6: Generate summary
-            await self._update_progress(
-                session_id,
-                "extracting",
-                75,
-                "Generating executive summary"
-            )
-
-            summary = await azure_openai_client.generate_summary(
-                transcription_result["full_text"],
-                session.title,
-                entities_raw
-            )
-
-            # Step 7: Generate embeddings (for future vector search)
-            await self._update_progress(
-                session_id,
-                "embedding",
-                85,
-                "Generating embeddings for semantic search"
-            )
-
-            # Create text chunks for embedding
-            segment_texts = [seg.text for seg in transcript.segments]
-            embeddings = await azure_openai_client.generate_embeddings(segment_texts)
-
             logger.info(f"Generated {len(embeddings)} embeddings")
 
             # TODO: Store embeddings in vector database (Azure AI Search)
@@ -212,16 +250,71 @@ class SessionProcessor:
             return session
 
         except Exception as e:
-            logger.error(f"Session processing failed: {str(e)}")
+            # Report the underlying failure rather than the TaskGroup wrapper
+            error = e.exceptions[0] if isinstance(e, ExceptionGroup) else e
+            logger.error(f"Session processing failed: {str(error)}")
             if session_id:
-                await self._mark_failed(session_id, str(e))
+                await self._mark_failed(session_id, str(error))
 
-            # Cleanup on error
+            # Cleanup on error; a download nobody awaited, whether still
+            # running or finished, may hold files or an unretrieved exception
+            if download_task is not None and not download_consumed:
+                await self._discard_download(download_task)
             if audio_path:
                 await audio_processor.cleanup_audio_file(audio_path)
+            if chunk_paths:
+                await audio_processor.cleanup_chunks(chunk_paths)
 
             return None
 
+    async def _download_audio(
+        self,
+        url: str,
+        session_id: str
+    ) -> Tuple[Optional[List[str]], Optional[str]]:
+        """
+        Download session audio, as transcription-ready chunks when enabled.
+
+        Args:
+            url: UN WebTV session URL
+            session_id: Session identifier
+
+        Returns:
+            Tuple of (chunk paths, audio path); at most one is set
+        """
+        async with self._download_slots():
+            if settings.AUDIO_STREAM_SEGMENTING:
+                chunk_paths = await audio_processor.download_and_segment_audio(
+                    url,
+                    session_id
+                )
+                if chunk_paths:
+                    return chunk_paths, None
+
+            audio_path = await audio_processor.download_and_extract_audio(
+                url,
+                session_id
+            )
+            return None, audio_path
+
+    async def _discard_download(self, download_task: asyncio.Task) -> None:
+        """
+        Cancel a background audio download and delete anything it produced.
+
+        Args:
+            download_task: Task running _download_audio
+        """
+        download_task.cancel()
+        try:
+            chunk_paths, audio_path = await download_task
+        except (asyncio.CancelledError, Exception):
+            return
+
+        if audio_path:
+            await audio_processor.cleanup_audio_file(audio_path)
+        if chunk_paths:
+            await audio_processor.cleanup_chunks(chunk_paths)
+
     def _parse_entities(self, raw_entities: Dict[str, Any]) -> EntityExtraction:
         """
         Parse raw entity extraction results into structured format.
@@ -10,6 +10,54 @@ from datetime import datetime
 from typing import Optional, Dict, Any
 from loguru import logger
 
+# Entry ID from asset URLs like /en/asset/k1b/k1baa85czq
+_ENTRY_ID_RE = re.compile(r'/asset/[^/]+/([a-z0-9]+)')
+# Kaltura player configuration, in either of the two forms pages use
+_KALTURA_ID_RES = (
+    re.compile(r"'entryId':\s*'([^']+)'"),
+    re.compile(r'"entry_id":\s*"([^"]+)"'),
+)
+# Date patterns with the strptime formats they may match
+_DATE_RES = (
+    re.compile(r'(\d{1,2}\s+[A-Za-z]+\s+\d{4})'),  # "21 October 2025"
+    re.compile(r'(\d{4}-\d{2}-\d{2})'),  # "2025-10-21"
+)
+# Duration in HH:MM:SS
+_DURATION_RE = re.compile(r'(\d{1,2}):(\d{2}):(\d{2})')
+_ROOM_RE = re.compile(r'Room\s+([IVX]+|\d+)')
+
+# Keywords that map page text to metadata values, in output priority order.
+# Entity keywords are case-sensitive; the others match any case
+_ENTITY_KEYWORDS = {'Geneva': 'UNOG', 'UNOG': 'UNOG', 'New York': 'UNHQ', 'UNHQ': 'UNHQ'}
+_LANGUAGE_KEYWORDS = {
+    'arabic': 'ar',
+    'chinese': 'zh',
+    'english': 'en',
+    'french': 'fr',
+    'russian': 'ru',
+    'spanish': 'es'
+}
+_CATEGORY_KEYWORDS = {
+    'human rights': 'Human Rights',
+    'business': 'Business',
+    'development': 'Development',
+    'peace': 'Peace & Security',
+    'climate': 'Climate',
+    'health': 'Health',
+}
+# One alternation over every keyword, so the page text is scanned once
+_KEYWORD_RE = re.compile(
+    '|'.join(
+        re.escape(keyword)
+        for keyword in sorted(
+            [*_ENTITY_KEYWORDS, *_LANGUAGE_KEYWORDS, *_CATEGORY_KEYWORDS],
+            key=len,
+            reverse=True
+        )
+    ),
+    re.IGNORECASE
+)
+
 
 class UNTVScraper:
     """Scraper for UN WebTV sessions."""
@@ -31,8 +79,7 @@ class UNTVScraper:
             Entry ID (e.g., k1baa85czq) or None if invalid
         """
         # Pattern: /asset/{category}/{entry_id}
-        pattern = r'/asset/[^/]+/([a-z0-9]+)'
-        match = re.search(pattern, url)
+        match = _ENTRY_ID_RE.search(url)
 
         if match:
             return match.group(1)
@@ -59,20 +106,25 @@ class UNTVScraper:
                 response = await client.get(url, headers=self.headers)
                 response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            # lxml builds the tree in C; the page text is extracted once and
+            # shared by every text-based extractor
+            soup = BeautifulSoup(response.text, 'lxml')
+            text = soup.get_text()
+            title = self._extract_title(soup)
+            keyword_fields = self._extract_keyword_fields(text)
 
             metadata = {
                 "id": entry_id,
                 "url": url,
-                "kaltura_entry_id": self._extract_kaltura_id(soup, response.text),
-                "title": self._extract_title(soup),
-                "date": self._extract_date(soup),
-                "duration_seconds": self._extract_duration(soup),
-                "session_type": self._extract_session_type(soup),
-                "broadcasting_entity": self._extract_entity(soup),
-                "location": self._extract_location(soup),
-                "languages": self._extract_languages(soup),
-                "categories": self._extract_categories(soup),
+                "kaltura_entry_id": self._extract_kaltura_id(response.text),
+                "title": title,
+                "date": self._extract_date(text),
+                "duration_seconds": self._extract_duration(text),
+                "session_type": self._extract_session_type(title),
+                "broadcasting_entity": keyword_fields["broadcasting_entity"],
+                "location": self._extract_location(text),
+                "languages": keyword_fields["languages"],
+                "categories": keyword_fields["categories"],
                 "description": self._extract_description(soup),
             }
 
@@ -83,18 +135,14 @@ class UNTVScraper:
             logger.error(f"Failed to scrape session {url}: {str(e)}")
             return None
 
-    def _extract_kaltura_id(self, soup: BeautifulSoup, html: str) -> Optional[str]:
+    def _extract_kaltura_id(self, html: str) -> Optional[str]:
         """Extract Kaltura media ID from page source."""
         # Look for Kaltura player configuration
-        pattern = r"'entryId':\s*'([^']+)'"
-        match = re.search(pattern, html)
-        if match:
-            return match.group(1)
-
-        # Alternative pattern
-        pattern = r'"entry_id":\s*"([^"]+)"'
-        match = re.search(pattern, html)
-        return match.group(1) if match else None
+        for pattern in _KALTURA_ID_RES:
+            match = pattern.search(html)
+            if match:
+                return match.group(1)
+        return None
 
     def _extract_title(self, soup: BeautifulSoup) -> str:
         """Extract session title."""
@@ -115,17 +163,11 @@ class UNTVScraper:
 
         return "Unknown Session"
 
-    def _extract_date(self, soup: BeautifulSoup) -> Optional[datetime]:
+    def _extract_date(self, text: str) -> Optional[datetime]:
         """Extract session date."""
         # Look for date in various formats
-        date_patterns = [
-            r'(\d{1,2}\s+[A-Za-z]+\s+\d{4})',  # "21 October 2025"
-            r'(\d{4}-\d{2}-\d{2})',  # "2025-10-21"
-        ]
-
-        text = soup.get_text()
-        for pattern in date_patterns:
-            match = re.search(pattern, text)
+        for pattern in _DATE_RES:
+            match = pattern.search(text)
             if match:
                 date_str = match.group(1)
                 try:
@@ -140,12 +182,10 @@ class UNTVScraper:
 
         return None
 
-    def _extract_duration(self, soup: BeautifulSoup) -> int:
+    def _extract_duration(self, text: str) -> int:
         """Extract session duration in seconds."""
-        # Look for duration in format HH:MM:SS or MM:SS
-        duration_pattern = r'(\d{1,2}):(\d{2}):(\d{2})'
-        text = soup.get_text()
-        match = re.search(duration_pattern, text)
+        # Look for duration in format HH:MM:SS
+        match = _DURATION_RE.search(text)
 
         if match:
             hours = int(match.group(1))
@@ -155,9 +195,8 @@ class UNTVScraper:
 
         return 0
 
-    def _extract_session_type(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_session_type(self, title: str) -> Optional[str]:
         """Extract session type (e.g., 'Intergovernmental Working Group')."""
-        title = self._extract_title(soup)
         # Extract from title pattern
         if 'Working Group' in title:
             return 'Intergovernmental Working Group'
@@ -169,67 +208,45 @@ class UNTVScraper:
             return 'Human Rights Council'
         return None
 
-    def _extract_entity(self, soup: BeautifulSoup) -> Optional[str]:
-        """Extract broadcasting entity (UNOG, UNHQ, etc.)."""
-        text = soup.get_text()
-        if 'Geneva' in text or 'UNOG' in text:
-            return 'UNOG'
-        elif 'New York' in text or 'UNHQ' in text:
-            return 'UNHQ'
-        return None
-
-    def _extract_location(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_location(self, text: str) -> Optional[str]:
         """Extract meeting location."""
         # Look for room information
-        room_pattern = r'Room\s+([IVX]+|\d+)'
-        text = soup.get_text()
-        match = re.search(room_pattern, text)
+        match = _ROOM_RE.search(text)
         if match:
             return f"Room {match.group(1)}"
         return None
 
-    def _extract_languages(self, soup: BeautifulSoup) -> list:
-        """Extract available languages."""
-        # Common UN languages
-        languages = []
-        text = soup.get_text().lower()
-        lang_keywords = {
-            'arabic': 'ar',
-            'chinese': 'zh',
-            'english': 'en',
-            'french': 'fr',
-            'russian': 'ru',
-            'spanish': 'es'
-        }
-
-        for keyword, code in lang_keywords.items():
-            if keyword in text:
-                languages.append(code)
-
-        return languages if languages else ['en']
+    def _extract_keyword_fields(self, text: str) -> Dict[str, Any]:
+        """
+        Extract broadcasting entity, languages and categories in one text scan.
 
-    def _extract_categories(self, soup: BeautifulSoup) -> list:
-        """Extract session categories/tags."""
-        categories = []
+        Args:
+            text: Page text
 
-        # Look for keywords in title and description
-        text = soup.get_text().lower()
+        Returns:
+            Dictionary with broadcasting_entity, languages and categories
+        """
+        found = set()
+        for match in _KEYWORD_RE.finditer(text):
+            keyword = match.group(0)
+            if keyword in _ENTITY_KEYWORDS:
+                found.add(_ENTITY_KEYWORDS[keyword])
+            found.add(keyword.lower())
+
+        # Geneva (UNOG) takes precedence over New York (UNHQ)
+        entity = next((e for e in ('UNOG', 'UNHQ') if e in found), None)
+        languages = [code for keyword, code in _LANGUAGE_KEYWORDS.items() if keyword in found]
+        categories = [
+            category for keyword, category in _CATEGORY_KEYWORDS.items() if keyword in found
+        ]
 
-        keywords_map = {
-            'human rights': 'Human Rights',
-            'business': 'Business',
-            'development': 'Development',
-            'peace': 'Peace & Security',
-            'climate': 'Climate',
-            'health': 'Health',
+        return {
+            "broadcasting_entity": entity,
+            # Common UN languages; English when none are mentioned
+            "languages": languages if languages else ['en'],
+            "categories": categories,
         }
 
-        for keyword, category in keywords_map.items():
-            if keyword in text:
-                categories.append(category)
-
-        return categories
-
     def _extract_description(self, soup: BeautifulSoup) -> Optional[str]:
         """Extract session description."""
         # Try meta description
@@ -8,17 +8,33 @@ Features:
 - Persistent storage in Cosmos DB
 """
 
+import asyncio
 import numpy as np
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass, asdict
+import orjson
+from typing import List, Dict, Optional, Sequence, Tuple
+from dataclasses import dataclass, asdict, fields
 from loguru import logger
 from datetime import datetime
 import json
 
 
+# Metadata columns kept as arrays for vectorized filtering in batch_search
+_FILTER_FIELDS = ("session_id", "speaker_name", "country")
+
+# Cosmos DB transactional batch limits (operations and request payload size)
+MAX_BATCH_OPERATIONS = 100
+MAX_BATCH_BYTES = 1_800_000  # Below the 2 MB request limit, leaving room for batch framing
+COSMOS_WRITE_CONCURRENCY = 16
+
+
 @dataclass
 class VectorSegment:
-    """Represents a transcript segment with its vector embedding."""
+    """
+    Represents a transcript segment stored in the vector store.
+
+    The embedding itself lives in the store's contiguous matrix, in the row
+    matching the segment's position in VectorStore.segments.
+    """
     id: str  # Unique ID: {session_id}_seg_{index}
     session_id: str
     session_title: str
@@ -30,13 +46,32 @@ class VectorSegment:
     text: str
     start_time: Optional[str]
     end_time: Optional[str]
-    embedding: List[float]
     metadata: Dict  # Additional metadata (topics, SDGs, etc.)
 
     def to_dict(self) -> Dict:
         """Convert to dictionary."""
         return asdict(self)
 
+    def to_json_bytes(self, embedding: np.ndarray) -> bytes:
+        """
+        Serialize the segment with its embedding to JSON.
+
+        Skips asdict's recursive deep copy and writes the embedding straight
+        from its float32 row rather than via a list of Python floats.
+
+        Args:
+            embedding: The segment's embedding row
+
+        Returns:
+            JSON document bytes
+        """
+        document = {field.name: getattr(self, field.name) for field in _SEGMENT_FIELDS}
+        document["embedding"] = embedding
+        return orjson.dumps(document, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+_SEGMENT_FIELDS = fields(VectorSegment)
+
 
 class VectorStore:
     """In-memory vector store with similarity search capabilities."""
@@ -44,20 +79,88 @@ class VectorStore:
     def __init__(self):
         """Initialize empty vector store."""
         self.segments: List[VectorSegment] = []
-        self.embeddings_matrix: Optional[np.ndarray] = None
-        self._index_dirty = True
+        # Unit-normalized embeddings, one row per segment, in a buffer that
+        # grows geometrically so appends do not copy the whole store
+        self._embeddings = np.empty((0, 0), dtype=np.float32)
+        # Filter fields dictionary-encoded as int32 codes, so a filter is one
+        # vectorized integer comparison instead of per-row string compares
+        self._filter_columns: Dict[str, np.ndarray] = {
+            name: np.empty(0, dtype=np.int32) for name in _FILTER_FIELDS
+        }
+        self._filter_codes: Dict[str, Dict[Optional[str], int]] = {
+            name: {} for name in _FILTER_FIELDS
+        }
+        # Bumped whenever the searchable contents change, so callers caching
+        # search-derived results can tell when they went stale
+        self.generation = 0
+
+    @property
+    def embeddings_matrix(self) -> np.ndarray:
+        """Unit-normalized float32 embeddings, shape (N, d); a view, not a copy."""
+        return self._embeddings[:len(self.segments)]
+
+    def _reserve(self, size: int, dim: int) -> None:
+        """Grow the row buffers to hold at least `size` segments."""
+        capacity = len(self._embeddings)
+        if size <= capacity and self._embeddings.shape[1] == dim:
+            return
+        if capacity and self._embeddings.shape[1] != dim:
+            raise ValueError(
+                f"Embedding dimension {dim} does not match store dimension {self._embeddings.shape[1]}"
+            )
 
-    def add_segments(self, segments: List[VectorSegment]):
+        count = len(self.segments)
+        capacity = max(size, 2 * capacity, 1024)
+        embeddings = np.empty((capacity, dim), dtype=np.float32)
+        if count:
+            embeddings[:count] = self._embeddings[:count]
+        self._embeddings = embeddings
+        for name, column in self._filter_columns.items():
+            grown = np.empty(capacity, dtype=np.int32)
+            grown[:count] = column[:count]
+            self._filter_columns[name] = grown
+
+    def add_segments(self, segments: List[VectorSegment], embeddings: Sequence[Sequence[float]]):
         """
         Add segments to the vector store.
 
         Args:
             segments: List of vector segments to add
+            embeddings: Embedding vectors, aligned with segments
         """
+        if len(segments) != len(embeddings):
+            raise ValueError("Number of segments must match number of embeddings")
+        if not segments:
+            return
+
+        # float32 keeps the dot products on BLAS even for float16 embeddings.
+        # Rows are stored unit-length so a dot product is the cosine similarity.
+        rows = np.asarray(embeddings, dtype=np.float32)
+        start, end = len(self.segments), len(self.segments) + len(segments)
+        self._reserve(end, rows.shape[1])
+
+        block = self._embeddings[start:end]
+        block[:] = rows
+        norms = np.linalg.norm(block, axis=1, keepdims=True)
+        np.divide(block, norms, out=block, where=norms > 0)
+        for name, column in self._filter_columns.items():
+            codes = self._filter_codes[name]
+            column[start:end] = [
+                codes.setdefault(getattr(segment, name), len(codes)) for segment in segments
+            ]
+
         self.segments.extend(segments)
-        self._index_dirty = True
+        self.generation += 1
         logger.info(f"Added {len(segments)} segments to vector store")
 
+    def _column_mask(self, name: str, value: str) -> np.ndarray:
+        """Boolean mask over stored segments whose `name` field equals `value`."""
+        column = self._filter_columns[name][:len(self.segments)]
+        code = self._filter_codes[name].get(value)
+        if code is None:
+            return np.zeros(len(column), dtype=bool)
+        return column == code
+
     def add_session_segments(
         self,
         session_id: str,
@@ -80,7 +183,7 @@ class VectorStore:
             raise ValueError("Number of segments must match number of embeddings")
 
         segments = []
-        for idx, (segment, embedding) in enumerate(zip(segment_data, embeddings)):
+        for idx, segment in enumerate(segment_data):
             vector_segment = VectorSegment(
                 id=f"{session_id}_seg_{idx}",
                 session_id=session_id,
@@ -93,64 +196,48 @@ class VectorStore:
                 text=segment.get('text', ''),
                 start_time=segment.get('start_time'),
                 end_time=segment.get('end_time'),
-                embedding=embedding,
                 metadata=segment.get('metadata', {})
             )
             segments.append(vector_segment)
 
-        self.add_segments(segments)
+        self.add_segments(segments, embeddings)
         logger.info(f"Added {len(segments)} segments from session {session_id}")
 
-    def _build_embeddings_matrix(self):
-        """Build numpy matrix of all embeddings for efficient search."""
-        if not self.segments:
-            self.embeddings_matrix = None
-            return
-
-        self.embeddings_matrix = np.array([s.embedding for s in self.segments])
-        self._index_dirty = False
-        logger.debug(f"Built embeddings matrix: shape {self.embeddings_matrix.shape}")
-
-    def _cosine_similarity(
+    def search(
         self,
         query_embedding: List[float],
-        top_k: int
-    ) -> List[Tuple[int, float]]:
+        top_k: int = 10,
+        session_id: Optional[str] = None,
+        speaker_name: Optional[str] = None,
+        country: Optional[str] = None,
+        min_similarity: float = 0.0
+    ) -> List[Tuple[VectorSegment, float]]:
         """
-        Compute cosine similarity between query and all segments.
+        Search for similar segments.
 
         Args:
-            query_embedding: Query vector
+            query_embedding: Query embedding vector
             top_k: Number of results to return
+            session_id: Optional filter by session ID
+            speaker_name: Optional filter by speaker name
+            country: Optional filter by country
+            min_similarity: Minimum similarity score threshold
 
         Returns:
-            List of (index, similarity_score) tuples
+            List of (segment, similarity_score) tuples
         """
-        if self._index_dirty:
-            self._build_embeddings_matrix()
-
-        if self.embeddings_matrix is None:
-            return []
-
-        # Convert query to numpy array
-        query_vec = np.array(query_embedding)
-
-        # Compute cosine similarity
-        # cosine_sim = (A · B) / (||A|| * ||B||)
-        dot_products = np.dot(self.embeddings_matrix, query_vec)
-        query_norm = np.linalg.norm(query_vec)
-        segment_norms = np.linalg.norm(self.embeddings_matrix, axis=1)
-        similarities = dot_products / (segment_norms * query_norm)
-
-        # Get top-k indices
-        top_indices = np.argsort(similarities)[::-1][:top_k]
-        top_scores = similarities[top_indices]
-
-        return list(zip(top_indices.tolist(), top_scores.tolist()))
+        return self.batch_search(
+            [query_embedding],
+            top_k=top_k,
+            session_id=session_id,
+            speaker_name=speaker_name,
+            country=country,
+            min_similarity=min_similarity
+        )
 
-    def search(
+    def batch_search(
         self,
-        query_embedding: List[float],
+        query_embeddings: Sequence[Sequence[float]],
         top_k: int = 10,
         session_id: Optional[str] = None,
         speaker_name: Optional[str] = None,
@@ -158,10 +245,13 @@ class VectorStore:
         min_similarity: float = 0.0
     ) -> List[Tuple[VectorSegment, float]]:
         """
-        Search for similar segments.
+        Search with several query embeddings at once and merge the results.
+
+        All queries are scored in a single matrix product; each segment keeps
+        its best score across the queries before filtering and top-k.
 
         Args:
-            query_embedding: Query embedding vector
+            query_embeddings: Query embedding vectors, shape (Q, d)
             top_k: Number of results to return
             session_id: Optional filter by session ID
             speaker_name: Optional filter by speaker name
@@ -169,42 +259,55 @@ class VectorStore:
             min_similarity: Minimum similarity score threshold
 
         Returns:
-            List of (segment, similarity_score) tuples
+            List of (segment, similarity_score) tuples, best first
         """
         if not self.segments:
             logger.warning("Vector store is empty")
             return []
 
-        # Get similarity scores
-        results = self._cosine_similarity(query_embedding, top_k * 3)  # Get more for filtering
-
-        # Apply filters and threshold
-        filtered_results = []
-        for idx, score in results:
-            if score < min_similarity:
-                continue
-
-            segment = self.segments[idx]
-
-            # Apply filters
-            if session_id and segment.session_id != session_id:
-                continue
-            if speaker_name and segment.speaker_name != speaker_name:
-                continue
-            if country and segment.country != country:
-                continue
-
-            filtered_results.append((segment, score))
-
-            if len(filtered_results) >= top_k:
-                break
+        queries = np.atleast_2d(np.asarray(query_embeddings, dtype=np.float32))
+        if not queries.size or top_k <= 0:
+            return []
+        query_norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        queries = queries / np.where(query_norms > 0, query_norms, 1.0)
+
+        # Restrict scoring to rows passing the metadata filters, so selective
+        # filters shrink the matrix product instead of discarding its output
+        mask = None
+        for column, value in (("session_id", session_id), ("speaker_name", speaker_name), ("country", country)):
+            if value:
+                matches = self._column_mask(column, value)
+                mask = matches if mask is None else mask & matches
+        rows = None if mask is None else np.flatnonzero(mask)
+        matrix = self.embeddings_matrix if rows is None else self.embeddings_matrix[rows]
+
+        # (Q, rows) cosine similarities, reduced to the best score per segment;
+        # a single query is a plain matrix-vector product (BLAS sgemv) with
+        # no reduction pass
+        if not len(matrix):
+            similarities = np.empty(0, dtype=np.float32)
+        elif len(queries) == 1:
+            similarities = matrix @ queries[0]
+        else:
+            similarities = (queries @ matrix.T).max(axis=0)
+
+        candidates = np.flatnonzero(similarities >= min_similarity)
+        if len(candidates) > top_k:
+            candidates = candidates[np.argpartition(similarities[candidates], -top_k)[-top_k:]]
+        candidates = candidates[np.argsort(similarities[candidates])[::-1]]
+
+        indices = candidates if rows is None else rows[candidates]
+        results = [
+            (self.segments[idx], score)
+            for idx, score in zip(indices.tolist(), similarities[candidates].tolist())
+        ]
 
         logger.info(
-            f"Vector search returned {len(filtered_results)} results "
+            f"Batch search over {len(queries)} queries returned {len(results)} results "
             f"(filters: session_id={session_id}, speaker={speaker_name}, country={country})"
         )
 
-        return filtered_results
+        return results
 
     def search_multi_query(
         self,
@@ -215,8 +318,7 @@ class VectorStore:
         """
         Search with multiple query embeddings and merge results.
 
-        This is useful for multi-query retrieval where we generate multiple
-        search queries from a single user question.
+        Kept for existing callers; delegates to batch_search.
 
         Args:
             query_embeddings: List of query embedding vectors
@@ -226,45 +328,27 @@ class VectorStore:
         Returns:
             List of (segment, similarity_score) tuples
         """
-        # Collect results from all queries
-        all_results: Dict[str, Tuple[VectorSegment, float]] = {}
-
-        for query_emb in query_embeddings:
-            results = self.search(
-                query_embedding=query_emb,
-                top_k=top_k,
-                **filters
-            )
-
-            # Merge results, keeping highest score for each segment
-            for segment, score in results:
-                if segment.id not in all_results or all_results[segment.id][1] < score:
-                    all_results[segment.id] = (segment, score)
-
-        # Sort by score and return top-k
-        sorted_results = sorted(
-            all_results.values(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:top_k]
-
-        logger.info(f"Multi-query search returned {len(sorted_results)} unique results")
-
-        return sorted_results
+        return self.batch_search(query_embeddings, top_k=top_k, **filters)
 
     def get_session_segments(self, session_id: str) -> List[VectorSegment]:
         """Get all segments for a session."""
-        return [s for s in self.segments if s.session_id == session_id]
+        rows = np.flatnonzero(self._column_mask("session_id", session_id))
+        return [self.segments[idx] for idx in rows.tolist()]
 
     def delete_session_segments(self, session_id: str):
         """Delete all segments for a session."""
         count_before = len(self.segments)
-        self.segments = [s for s in self.segments if s.session_id != session_id]
-        count_after = len(self.segments)
+        keep = ~self._column_mask("session_id", session_id)
+        count_after = int(keep.sum())
         deleted = count_before - count_after
 
         if deleted > 0:
-            self._index_dirty = True
+            # Compact the surviving rows to the front of every buffer
+            self._embeddings[:count_after] = self._embeddings[:count_before][keep]
+            for column in self._filter_columns.values():
+                column[:count_after] = column[:count_before][keep]
+            self.segments = [s for s, kept in zip(self.segments, keep.tolist()) if kept]
+            self.generation += 1
 
         logger.info(f"Deleted {deleted} segments for session {session_id}")
 
@@ -277,55 +361,94 @@ class VectorStore:
                 "embedding_dimension": 0
             }
 
-        unique_sessions = len(set(s.session_id for s in self.segments))
-        embedding_dim = len(self.segments[0].embedding) if self.segments else 0
+        unique_sessions = len(np.unique(self._filter_columns["session_id"][:len(self.segments)]))
 
         return {
             "total_segments": len(self.segments),
             "unique_sessions": unique_sessions,
-            "embedding_dimension": embedding_dim,
-            "index_status": "dirty" if self._index_dirty else "current"
+            "embedding_dimension": self._embeddings.shape[1]
         }
 
-    def save_to_cosmos(self, container) -> int:
+    async def save_to_cosmos(self, container) -> int:
         """
         Save all segments to Cosmos DB.
 
+        Segments of a session share a partition (/session_id) and are written
+        in transactional batches; batches run concurrently.
+
         Args:
-            container: Cosmos DB container
+            container: Async Cosmos DB container partitioned on /session_id
 
         Returns:
             Number of segments saved
         """
-        count = 0
-        for segment in self.segments:
-            try:
-                container.upsert_item(body=segment.to_dict())
-                count += 1
-            except Exception as e:
-                logger.error(f"Error saving segment {segment.id}: {str(e)}")
-
-        logger.info(f"Saved {count} segments to Cosmos DB")
+        # Group upsert bodies by partition, packed under the batch limits
+        batches: List[Tuple[str, List[Dict]]] = []
+        batch_bytes: List[int] = []
+        open_batch: Dict[str, int] = {}  # session_id -> index of its batch being filled
+        for segment, embedding in zip(self.segments, self.embeddings_matrix):
+            # The SDK takes dicts; the serialized document also gives the
+            # exact size counted against the batch limit
+            document = segment.to_json_bytes(embedding)
+            body = orjson.loads(document)
+            size = len(document)
+            idx = open_batch.get(segment.session_id)
+            if (
+                idx is None
+                or len(batches[idx][1]) >= MAX_BATCH_OPERATIONS
+                or batch_bytes[idx] + size > MAX_BATCH_BYTES
+            ):
+                idx = open_batch[segment.session_id] = len(batches)
+                batches.append((segment.session_id, []))
+                batch_bytes.append(0)
+            batches[idx][1].append(body)
+            batch_bytes[idx] += size
+
+        semaphore = asyncio.Semaphore(COSMOS_WRITE_CONCURRENCY)
+
+        async def write_batch(session_id: str, bodies: List[Dict]) -> int:
+            async with semaphore:
+                try:
+                    await container.execute_item_batch(
+                        batch_operations=[("upsert", (body,)) for body in bodies],
+                        partition_key=session_id
+                    )
+                    return len(bodies)
+                except Exception as e:
+                    logger.error(f"Error saving {len(bodies)} segments for session {session_id}: {str(e)}")
+                    return 0
+
+        count = sum(await asyncio.gather(*(
+            write_batch(session_id, bodies) for session_id, bodies in batches
+        )))
+
+        logger.info(f"Saved {count} segments to Cosmos DB in {len(batches)} batches")
         return count
 
-    def load_from_cosmos(self, container):
+    async def load_from_cosmos(self, container):
         """
         Load all segments from Cosmos DB.
 
         Args:
-            container: Cosmos DB container
+            container: Async Cosmos DB container
         """
         try:
             query = "SELECT * FROM c"
-            items = list(container.query_items(query=query, enable_cross_partition_query=True))
-
+            # Cosmos adds system properties (_rid, _etag, ...) to every item
+            field_names = [f.name for f in _SEGMENT_FIELDS]
             segments = []
-            for item in items:
-                segment = VectorSegment(**item)
-                segments.append(segment)
-
-            self.segments = segments
-            self._index_dirty = True
+            embeddings = []
+            async for item in container.query_items(query=query):
+                segments.append(VectorSegment(**{name: item.get(name) for name in field_names}))
+                embeddings.append(item["embedding"])
+
+            self.segments = []
+            self._embeddings = np.empty((0, 0), dtype=np.float32)
+            for column in self._filter_columns:
+                self._filter_columns[column] = np.empty(0, dtype=np.int32)
+                self._filter_codes[column] = {}
+            self.generation += 1
+            self.add_segments(segments, embeddings)
 
             logger.info(f"Loaded {len(segments)} segments from Cosmos DB")
 
@@ -0,0 +1,57 @@
+"""
+Event loop helpers for loop-bound clients.
+"""
+
+import asyncio
+import threading
+from typing import Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class LoopLocal(Generic[T]):
+    """
+    A lazily built value per event loop, such as an async client or semaphore.
+
+    Streamlit runs each browser session in its own thread and each action in
+    its own asyncio.run(), so one process-wide service sees many loops at
+    once. Values are kept per thread, and rebuilt when that thread starts a
+    new loop; a thread runs one loop at a time, so a value left over from its
+    previous loop is never in use and is simply dropped. Values belonging to
+    other threads are never touched.
+    """
+
+    def __init__(self, factory: Callable[[], T]):
+        """
+        Initialize the holder.
+
+        Args:
+            factory: Builds the value for the running loop
+        """
+        self._factory = factory
+        self._local = threading.local()
+
+    def get(self) -> T:
+        """Get the value for the running event loop, building it on first use."""
+        loop = asyncio.get_running_loop()
+        local = self._local
+        if getattr(local, "loop", None) is not loop:
+            local.value = self._factory()
+            local.loop = loop
+        return local.value
+
+    def pop(self) -> Optional[T]:
+        """
+        Detach the running loop's value, so the next get() builds a new one.
+
+        Returns:
+            The value, or None if none was built on this loop
+        """
+        loop = asyncio.get_running_loop()
+        local = self._local
+        if getattr(local, "loop", None) is not loop:
+            return None
+        value = local.value
+        del local.value, local.loop
+        return value
+
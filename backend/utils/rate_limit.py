@@ -0,0 +1,43 @@
+"""
+Async rate limiting helpers.
+"""
+
+import asyncio
+import time
+
+
+class AsyncRateLimiter:
+    """Token bucket allowing `rate` acquisitions per `period` seconds."""
+
+    def __init__(self, rate: float, period: float = 60.0):
+        """
+        Initialize the limiter with a full bucket.
+
+        Args:
+            rate: Number of acquisitions allowed per period (also the burst size)
+            period: Refill period in seconds
+        """
+        self.capacity = float(rate)
+        self._tokens = float(rate)
+        self._fill_rate = rate / period
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self._fill_rate)
+        self._updated = now
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """
+        Wait until `tokens` are available and consume them.
+
+        Args:
+            tokens: Number of tokens to consume
+        """
+        tokens = min(tokens, self.capacity)
+        while True:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return
+            await asyncio.sleep((tokens - self._tokens) / self._fill_rate)
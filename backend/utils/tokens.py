@@ -0,0 +1,66 @@
+"""
+Token counting helpers.
+"""
+
+from typing import List, Optional
+
+import tiktoken
+
+from config import settings
+
+# Tokenizer used by the text-embedding-3 models, loaded once
+_EMBEDDING_ENCODING = tiktoken.get_encoding("cl100k_base")
+
+# Tokenizer of the chat model; Azure deployment names that tiktoken does not
+# recognise fall back to the GPT-4o encoding
+try:
+    _CHAT_ENCODING = tiktoken.encoding_for_model(settings.CHAT_MODEL)
+except KeyError:
+    _CHAT_ENCODING = tiktoken.get_encoding("o200k_base")
+
+
+def count_chat_tokens(texts: List[str]) -> List[int]:
+    """
+    Count chat-model tokens for each text.
+
+    Args:
+        texts: Texts to measure
+
+    Returns:
+        Token count per text, aligned with the input
+    """
+    return list(map(len, _CHAT_ENCODING.encode_batch(texts)))
+
+
+def pack_embedding_batches(
+    texts: List[str],
+    max_tokens: Optional[int] = None,
+    max_items: Optional[int] = None
+) -> List[List[str]]:
+    """
+    Greedily pack texts into request batches bounded by token count and size.
+
+    Args:
+        texts: Texts to embed, in order
+        max_tokens: Maximum total tokens per batch (default from settings)
+        max_items: Maximum number of inputs per batch (default from settings)
+
+    Returns:
+        Ordered list of batches
+    """
+    max_tokens = max_tokens or settings.EMBEDDING_MAX_BATCH_TOKENS
+    max_items = max_items or settings.EMBEDDING_MAX_BATCH_ITEMS
+    batches: List[List[str]] = []
+    batch: List[str] = []
+    batch_tokens = 0
+
+    for text, tokens in zip(texts, map(len, _EMBEDDING_ENCODING.encode_batch(texts))):
+        if batch and (batch_tokens + tokens > max_tokens or len(batch) >= max_items):
+            batches.append(batch)
+            batch, batch_tokens = [], 0
+        batch.append(text)
+        batch_tokens += tokens
+
+    if batch:
+        batches.append(batch)
+    return batches
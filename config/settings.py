@@ -4,7 +4,7 @@ Uses Pydantic for validation and environment variable management.
 """
 
 from pydantic_settings import BaseSettings
-from pydantic import Field
+from pydantic import AliasChoices, Field
 from typing import Optional
 
 
@@ -60,11 +60,36 @@ class Settings(BaseSettings):
 
     # Processing Limits
     MAX_AUDIO_DURATION_HOURS: int = 6  # Maximum session duration
-    MAX_CONCURRENT_PROCESSING: int = 3  # Concurrent session processing
-    EMBEDDING_BATCH_SIZE: int = 100  # Batch size for embeddings
+    MAX_CONCURRENT_PROCESSING: int = 3  # Sessions downloading and extracting audio at once
+    EMBEDDING_MAX_BATCH_TOKENS: int = 7000  # Token budget per embedding request (API limit 8191)
+    EMBEDDING_MAX_BATCH_ITEMS: int = Field(  # Inputs per embedding request (API limit)
+        2048,
+        # EMBEDDING_BATCH_SIZE is the setting's former name, still honoured
+        validation_alias=AliasChoices("EMBEDDING_MAX_BATCH_ITEMS", "EMBEDDING_BATCH_SIZE")
+    )
+    EMBEDDING_CONCURRENCY: int = 4  # Concurrent embedding batch requests
+    EMBEDDING_CACHE_PATH: str = "data/embedding_cache.sqlite3"  # Persistent embedding cache
+    EMBEDDING_CACHE_MAX: int = 10000  # Embedding vectors kept in memory
+    EMBEDDING_NEAR_DUPLICATE_CACHE: bool = True  # Reuse vectors across spacing/punctuation variants
+    LLM_CACHE_ENABLED: bool = True  # Reuse transcripts, entities and summaries for identical inputs
+    LLM_CACHE_PATH: str = "data/llm_cache.sqlite3"  # Persistent LLM result cache
+    WHISPER_CONCURRENCY: int = 4  # Concurrent chunk transcription requests
+    MAX_CONCURRENT_LLM: int = 8  # Concurrent RAG chat completion requests
+
+    # Audio Download
+    YTDLP_CONCURRENT_FRAGMENTS: int = 8  # Parallel HLS/DASH fragment downloads
+    YTDLP_HTTP_CHUNK_SIZE_MB: int = 10  # Range-request size for single-file streams
+    YTDLP_USE_ARIA2C: bool = False  # Use aria2c as external downloader if installed
+    AUDIO_IO_WORKERS: int = 8  # Threads for downloads and ffprobe calls
+    AUDIO_STREAM_SEGMENTING: bool = False  # Pipe yt-dlp straight into the ffmpeg segmenter
+    YTDLP_INFO_CACHE_TTL_SECONDS: int = 1800  # Reuse extracted stream info per URL
+    YTDLP_INFO_CACHE_MAX: int = 32  # Extracted stream infos kept in memory
+    YTDLP_CACHE_DIR: str = "data/ytdlp_cache"  # Persistent yt-dlp cache directory
 
     # Temporary Storage
     TEMP_AUDIO_DIR: str = "data/audio_temp"
+    # Keep temp audio in /dev/shm (RAM); budget at least 2x the largest session's audio size
+    USE_TMPFS: bool = False
     TEMP_DOWNLOAD_DIR: str = "data/downloads"
 
     # Vector Search Configuration
@@ -75,9 +100,15 @@ class Settings(BaseSettings):
     CHAT_MAX_HISTORY: int = 20  # Maximum chat history to keep
     CHAT_TEMPERATURE: float = 0.7
     CHAT_MAX_TOKENS: int = 2000
+    CHAT_CONTEXT_BUDGET: int = 12000  # Prompt tokens for RAG instructions, question and sources
+    SEMANTIC_CACHE_ENABLED: bool = True  # Reuse responses for paraphrased repeat questions
+    SEMANTIC_CACHE_THRESHOLD: float = 0.95  # Minimum cosine similarity for a cache hit
+    SEMANTIC_CACHE_MAX_BUCKETS: int = 256  # Distinct contexts kept; least recently used are dropped
 
     # API Rate Limiting
-    RATE_LIMIT_PER_MINUTE: int = 60
+    TRANSCRIBE_RATE_LIMIT_PER_MINUTE: int = 60  # Transcription deployment requests/minute
+    EMBEDDING_RATE_LIMIT_PER_MINUTE: int = 300  # Embedding deployment requests/minute
+    CHAT_RATE_LIMIT_PER_MINUTE: int = 60  # Chat/summary/entity requests/minute
 
     # Logging
     LOG_LEVEL: str = "INFO"
@@ -2,7 +2,7 @@
 Streamlit page for batch processing multiple UN WebTV videos in parallel.
 """
 import streamlit as st
-import asyncio
+from backend.services.runtime import run_async
 from backend.services.batch_processor import batch_processor
 
 
@@ -51,19 +51,7 @@ def main():
             for i, url in enumerate(urls, 1):
                 st.text(f"{i}. {url}")
 
-    # Concurrency settings
-    col1, col2 = st.columns(2)
-    with col1:
-        max_concurrent = st.number_input(
-            "Max concurrent videos",
-            min_value=1,
-            max_value=10,
-            value=3,
-            help="How many videos to process simultaneously (recommended: 3-5)"
-        )
-
-    with col2:
-        st.metric("Total Videos", len(urls))
+    st.metric("Total Videos", len(urls))
 
     # Start processing button
     if st.button("🚀 Start Batch Processing", disabled=len(urls) == 0, type="primary"):
@@ -84,13 +72,9 @@ def main():
             # Run batch processing
             status_text.text("🔌 Initializing...")
 
-            # Update batch processor concurrency
-            batch_processor.max_concurrent = max_concurrent
-            batch_processor.semaphore = asyncio.Semaphore(max_concurrent)
-
             try:
                 # Run async batch processing
-                results = asyncio.run(
+                results = run_async(
                     batch_processor.process_batch(
                         urls=urls,
                         progress_callback=update_progress
@@ -165,7 +149,7 @@ def main():
     with col1:
         st.markdown("""
         **Optimal Settings:**
-        - **3-5 concurrent** for best performance
+        - **All videos run together**, paced by per-API rate limits
         - **Azure rate limits** apply per subscription
         - **Large videos** take 30-60 minutes each
         - **Small videos** take 3-5 minutes each
@@ -3,7 +3,7 @@ Session Discovery Page
 Browse, discover, and capture UN WebTV sessions directly from the portal.
 """
 import streamlit as st
-import asyncio
+from backend.services.runtime import run_async
 from datetime import datetime, timedelta
 from backend.services.session_discovery import session_discovery
 from backend.services.session_processor import session_processor
@@ -49,7 +49,7 @@ def main():
                 end_dt = datetime.combine(end_date, datetime.max.time())
 
                 # Discover sessions
-                sessions = asyncio.run(
+                sessions = run_async(
                     session_discovery.discover_sessions_by_date(start_dt, end_dt, limit=50)
                 )
 
@@ -84,7 +84,7 @@ def main():
         if st.button("🔍 Browse Sessions", key="search_by_body"):
             with st.spinner(f"Loading {selected_body} sessions..."):
                 body_slug = bodies[selected_body]
-                sessions = asyncio.run(
+                sessions = run_async(
                     session_discovery.get_sessions_by_body(body_slug, limit=20)
                 )
 
@@ -169,7 +169,7 @@ def display_session_card(session, idx):
 
         if session_id:
             try:
-                existing = asyncio.run(check_if_captured(session_id))
+                existing = run_async(check_if_captured(session_id))
                 already_captured = existing is not None
             except:
                 pass
@@ -228,7 +228,7 @@ def capture_session(session):
                 # Process immediately
                 with st.spinner("Processing session... This may take a while."):
                     try:
-                        result = asyncio.run(session_processor.process_session(url))
+                        result = run_async(session_processor.process_session(url))
 
                         if result and result.get('status') == 'completed':
                             st.success(f"✅ Session captured and processed!")
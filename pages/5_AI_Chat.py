@@ -10,7 +10,7 @@ Features:
 """
 
 import streamlit as st
-import asyncio
+from backend.services.runtime import run_async
 from backend.services.rag_service import rag_service
 from backend.services.vector_store import vector_store
 from backend.services.embedding_service import embedding_service
@@ -185,7 +185,7 @@ if prompt := st.chat_input("Ask a question about the UN sessions..."):
                     filters["country"] = filter_country.strip()
 
                 # Get answer from RAG
-                result = asyncio.run(
+                result = run_async(
                     rag_service.answer_question(
                         question=prompt,
                         chat_history=st.session_state.chat_history,
@@ -4,7 +4,7 @@ Browse and search previously processed sessions.
 """
 
 import streamlit as st
-import asyncio
+from backend.services.runtime import run_async
 from datetime import datetime
 from loguru import logger
 
@@ -23,7 +23,7 @@ def show():
     from backend.services.database import db_service
 
     try:
-        asyncio.run(db_service.initialize())
+        run_async(db_service.initialize())
     except Exception as e:
         st.error(f"❌ Failed to connect to database: {str(e)}")
         return
@@ -48,7 +48,7 @@ def show():
     # Fetch sessions
     with st.spinner("Loading sessions..."):
         try:
-            sessions = asyncio.run(db_service.list_sessions(limit=50))
+            sessions = run_async(db_service.list_sessions(limit=50))
 
             if not sessions:
                 st.info("📭 No sessions found. Process your first session using the '➕ New Analysis' page!")
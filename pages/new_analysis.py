@@ -4,7 +4,7 @@ Allows users to submit UN WebTV URLs for processing.
 """
 
 import streamlit as st
-import asyncio
+from backend.services.runtime import run_async
 from loguru import logger
 
 
@@ -64,7 +64,7 @@ def process_session(url: str):
         with st.spinner("Initializing database connection..."):
             try:
                 # Run async initialization
-                asyncio.run(db_service.initialize())
+                run_async(db_service.initialize())
                 st.success("✅ Database connected")
             except Exception as e:
                 st.error(f"❌ Failed to initialize database: {str(e)}")
@@ -97,7 +97,7 @@ def process_session(url: str):
 
             # Process session
             status_text.text("⚙️ Processing session...")
-            session = asyncio.run(session_processor.process_session(url))
+            session = run_async(session_processor.process_session(url))
 
             if session:
                 progress_bar.progress(100)
@@ -26,11 +26,8 @@ async def get_all_sessions():
         await db_service.initialize()
         sessions = []
         query = "SELECT * FROM c WHERE c.type = 'session' ORDER BY c.date DESC"
-        items = db_service.sessions_container.query_items(
-            query=query,
-            enable_cross_partition_query=True
-        )
-        for item in items:
+        items = db_service.sessions_container.query_items(query=query)
+        async for item in items:
             sessions.append(item)
         return sessions
     except Exception as e:
@@ -49,7 +46,7 @@ async def get_session_details(session_id: str):
         # Get transcript
         transcript = None
         try:
-            transcript = db_service.transcripts_container.read_item(
+            transcript = await db_service.transcripts_container.read_item(
                 item=session_id,
                 partition_key=session_id
             )
@@ -531,8 +528,8 @@ def show():
     st.markdown('<div class="sub-header">Interactive visual analytics for UN session data</div>', unsafe_allow_html=True)
 
     # Fetch sessions
-    import asyncio
-    sessions = asyncio.run(get_all_sessions())
+    from backend.services.runtime import run_async
+    sessions = run_async(get_all_sessions())
 
     if not sessions:
         st.warning("No sessions available for visualization. Please process a session first.")
@@ -555,7 +552,7 @@ def show():
 
     # Fetch session details
     with st.spinner("Loading session data..."):
-        session_data, transcript_data = asyncio.run(get_session_details(selected_session_id))
+        session_data, transcript_data = run_async(get_session_details(selected_session_id))
 
     if not session_data:
         st.error("Failed to load session data.")
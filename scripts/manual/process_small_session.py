@@ -24,7 +24,7 @@ async def test_small_session():
 
     # Delete session if it exists
     try:
-        db_service.sessions_container.delete_item(
+        await db_service.sessions_container.delete_item(
             item=session_id,
             partition_key=session_id
         )
@@ -47,7 +47,7 @@ async def test_small_session():
         print("-" * 80)
 
         # Get session data
-        session = db_service.sessions_container.read_item(
+        session = await db_service.sessions_container.read_item(
             item=session_id,
             partition_key=session_id
         )
@@ -60,7 +60,7 @@ async def test_small_session():
 
         # Get transcript data
         try:
-            transcript = db_service.transcripts_container.read_item(
+            transcript = await db_service.transcripts_container.read_item(
                 item=session_id,
                 partition_key=session_id
             )
@@ -24,7 +24,7 @@ async def verify_workflow():
     # 1. Verify Session Data
     print("\n1. VERIFYING SESSION DATA")
     print("-" * 80)
-    session = db_service.sessions_container.read_item(
+    session = await db_service.sessions_container.read_item(
         item=session_id,
         partition_key=session_id
     )
@@ -41,7 +41,7 @@ async def verify_workflow():
     print("-" * 80)
 
     try:
-        transcript = db_service.transcripts_container.read_item(
+        transcript = await db_service.transcripts_container.read_item(
             item=session_id,
             partition_key=session_id
         )
@@ -113,7 +113,7 @@ async def verify_workflow():
 
     # Get transcript text for context
     try:
-        transcript = db_service.transcripts_container.read_item(
+        transcript = await db_service.transcripts_container.read_item(
             item=session_id,
             partition_key=session_id
         )
@@ -167,18 +167,16 @@ Answer questions based on this information."""
 
     # Count all sessions
     query = "SELECT VALUE COUNT(1) FROM c"
-    session_count = list(db_service.sessions_container.query_items(
-        query=query,
-        enable_cross_partition_query=True
-    ))[0]
+    session_count = [
+        count async for count in db_service.sessions_container.query_items(query=query)
+    ][0]
 
     print(f"📊 Total sessions in database: {session_count}")
 
     # Count transcripts
-    transcript_count = list(db_service.transcripts_container.query_items(
-        query=query,
-        enable_cross_partition_query=True
-    ))[0]
+    transcript_count = [
+        count async for count in db_service.transcripts_container.query_items(query=query)
+    ][0]
 
     print(f"📄 Total transcripts in database: {transcript_count}")
 
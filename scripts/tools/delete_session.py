@@ -9,7 +9,7 @@ async def main():
     session_id = "k1y7kgo2oc"
 
     try:
-        db_service.sessions_container.delete_item(
+        await db_service.sessions_container.delete_item(
             item=session_id,
             partition_key=session_id
         )
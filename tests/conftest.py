@@ -0,0 +1,14 @@
+import os
+import tempfile
+
+# Settings are read when the services are first imported; give the required
+# credentials placeholder values and keep the persistent caches out of data/
+_CACHE_DIR = tempfile.mkdtemp(prefix="un-webcast-tests-")
+
+os.environ.setdefault("AZURE_OPENAI_API_KEY", "test-key")
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://example.openai.azure.com/")
+os.environ.setdefault("AZURE_SPEECH_KEY", "test-key")
+os.environ["EMBEDDING_CACHE_PATH"] = os.path.join(_CACHE_DIR, "embedding_cache.sqlite3")
+os.environ["LLM_CACHE_PATH"] = os.path.join(_CACHE_DIR, "llm_cache.sqlite3")
+os.environ["YTDLP_CACHE_DIR"] = os.path.join(_CACHE_DIR, "ytdlp_cache")
+os.environ["TEMP_AUDIO_DIR"] = os.path.join(_CACHE_DIR, "audio_temp")
@@ -0,0 +1,55 @@
+import numpy as np
+
+from backend.services.embedding_cache import EMBEDDING_DTYPE, EmbeddingCache
+
+
+def test_vectors_round_trip_through_disk(tmp_path):
+    path = str(tmp_path / "embeddings.sqlite3")
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(3, 1536)).astype(np.float32)
+    keys = [EmbeddingCache.make_key("model", f"text {idx}") for idx in range(3)]
+    EmbeddingCache(path).put_many(keys, vectors)
+
+    # A fresh instance has an empty memory tier, so this reads from SQLite
+    found = EmbeddingCache(path).get_many(keys)
+
+    assert set(found) == set(keys)
+    for key, vector in zip(keys, vectors):
+        assert found[key].dtype == EMBEDDING_DTYPE
+        np.testing.assert_allclose(found[key], vector, rtol=1e-3, atol=1e-3)
+
+
+def test_float16_storage_preserves_cosine_similarity(tmp_path):
+    cache = EmbeddingCache(str(tmp_path / "embeddings.sqlite3"))
+    rng = np.random.default_rng(1)
+    vector = rng.normal(size=1536).astype(np.float32)
+    key = EmbeddingCache.make_key("model", "text")
+    cache.put_many([key], [vector])
+
+    cached = cache.get_many([key])[key].astype(np.float32)
+    cosine = cached @ vector / (np.linalg.norm(cached) * np.linalg.norm(vector))
+    assert cosine > 0.9999
+
+
+def test_memory_tier_evicts_least_recently_used(tmp_path):
+    cache = EmbeddingCache(str(tmp_path / "embeddings.sqlite3"), max_memory_items=2)
+    a, b, c = (EmbeddingCache.make_key("model", text) for text in "abc")
+    cache.put_many([a, b], [[1.0, 0.0], [0.0, 1.0]])
+    cache.get_many([a])
+    cache.put_many([c], [[1.0, 1.0]])
+
+    assert len(cache) == 2
+    assert b not in cache._memory
+    # Evicted from memory only; the disk tier still has it
+    np.testing.assert_array_equal(cache.get_many([b])[b], [0.0, 1.0])
+
+
+def test_missing_keys_are_left_out(tmp_path):
+    cache = EmbeddingCache(str(tmp_path / "embeddings.sqlite3"))
+    assert cache.get_many([EmbeddingCache.make_key("model", "never stored")]) == {}
+
+
+def test_keys_depend_on_model_and_text():
+    assert EmbeddingCache.make_key("model", "text") == EmbeddingCache.make_key("model", "text")
+    assert EmbeddingCache.make_key("model-a", "text") != EmbeddingCache.make_key("model-b", "text")
+    assert EmbeddingCache.make_key("ab", "c") != EmbeddingCache.make_key("a", "bc")
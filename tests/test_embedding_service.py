@@ -0,0 +1,132 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from backend.services.embedding_cache import EmbeddingCache
+from backend.services.embedding_service import EmbeddingService, _normalize_text
+
+
+class FakeEmbeddings:
+    def __init__(self, delay=0.05, error=None):
+        self.calls = []
+        self.delay = delay
+        self.error = error
+
+    async def create(self, model, input):
+        self.calls.append(input)
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        texts = [input] if isinstance(input, str) else input
+        return SimpleNamespace(
+            data=[SimpleNamespace(embedding=[float(len(text)), 1.0, 0.0]) for text in texts],
+            usage=SimpleNamespace(total_tokens=len(texts)),
+        )
+
+
+@pytest.fixture
+def service(monkeypatch, tmp_path):
+    embeddings = FakeEmbeddings()
+    monkeypatch.setattr(
+        EmbeddingService, "client", property(lambda self: SimpleNamespace(embeddings=embeddings))
+    )
+    service = EmbeddingService()
+    service.embedding_cache = EmbeddingCache(str(tmp_path / "embedding_cache.sqlite3"))
+    service.fake = embeddings
+    return service
+
+
+def test_normalize_text_collapses_spacing_and_end_punctuation():
+    assert _normalize_text("  explain\n session   X. ") == "explain session X"
+    assert _normalize_text("Is it adopted?!") == "Is it adopted"
+    assert _normalize_text("a.b, c") == "a.b, c"
+
+
+def test_normalize_text_keeps_case():
+    for upper, lower in (("US", "us"), ("WHO", "who"), ("IS", "is")):
+        assert _normalize_text(upper) != _normalize_text(lower)
+
+
+def test_near_duplicate_text_reuses_cached_vector(service):
+    first = asyncio.run(service.generate_embedding("explain session X"))
+    second = asyncio.run(service.generate_embedding("explain  session X."))
+
+    assert service.fake.calls == ["explain session X"]
+    np.testing.assert_array_equal(first, second)
+    assert service.get_cache_stats()["near_duplicate_hits"] == 1
+
+
+def test_case_variants_are_not_near_duplicates(service):
+    asyncio.run(service.generate_embedding("WHO"))
+    asyncio.run(service.generate_embedding("who"))
+
+    assert service.fake.calls == ["WHO", "who"]
+    assert service.get_cache_stats()["near_duplicate_hits"] == 0
+
+
+def test_concurrent_requests_for_same_text_share_one_call(service):
+    async def main():
+        return await asyncio.gather(
+            service.generate_embedding("coalesced text", use_cache=False),
+            service.generate_embedding("coalesced text", use_cache=False),
+        )
+
+    first, second = asyncio.run(main())
+
+    assert service.fake.calls == ["coalesced text"]
+    np.testing.assert_array_equal(first, second)
+
+
+def test_batch_joins_text_already_in_flight(service):
+    async def main():
+        single = asyncio.create_task(service.generate_embedding("shared text", use_cache=False))
+        await asyncio.sleep(0)
+        batch = await service.generate_embeddings_batch(
+            ["shared text", "other text"], use_cache=False
+        )
+        return await single, batch
+
+    single, batch = asyncio.run(main())
+
+    assert service.fake.calls == ["shared text", ["other text"]]
+    np.testing.assert_array_equal(batch[0], single)
+
+
+def test_joined_caller_gets_the_api_error(service):
+    service.fake.error = RuntimeError("quota exceeded")
+
+    async def main():
+        return await asyncio.gather(
+            service.generate_embedding("failing text", use_cache=False),
+            service.generate_embeddings_batch(["failing text"], use_cache=False),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(main())
+
+    assert len(service.fake.calls) == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_requests_on_separate_loops_do_not_join(service):
+    service.fake.delay = 0.2
+    results, errors = [], []
+
+    def worker():
+        try:
+            results.append(asyncio.run(service.generate_embedding("per loop", use_cache=False)))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(results) == 2
+    assert service.fake.calls == ["per loop", "per loop"]
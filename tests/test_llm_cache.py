@@ -0,0 +1,46 @@
+import asyncio
+
+from backend.services import azure_openai_client as client_module
+from backend.services.azure_openai_client import AzureOpenAIClient
+from backend.services.llm_cache import LLMResultCache
+
+
+def test_results_round_trip_through_disk(tmp_path):
+    path = str(tmp_path / "llm_cache.sqlite3")
+    key = LLMResultCache.make_key("summary", "2", "gpt-4o", "transcript text")
+    result = {"summary": "text", "key_points": ["a", "b"], "duration": 600.0}
+    LLMResultCache(path).set(key, result)
+
+    cache = LLMResultCache(path)
+    assert cache.get(key) == result
+    assert cache.get(LLMResultCache.make_key("summary", "2", "gpt-4o", "other text")) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_entries_failing_validation_are_evicted(tmp_path):
+    cache = LLMResultCache(str(tmp_path / "llm_cache.sqlite3"))
+    key = LLMResultCache.make_key("transcription", "1")
+    cache.set(key, {"text": "old schema"})
+
+    assert cache.get(key, validate=lambda value: "segments" in value) is None
+    # Evicted, so even an accepting validator misses now
+    assert cache.get(key, validate=lambda value: True) is None
+
+
+def test_keys_are_length_prefixed():
+    assert LLMResultCache.make_key("ab", "c") != LLMResultCache.make_key("a", "bc")
+    assert LLMResultCache.make_key("text") == LLMResultCache.make_key(b"text")
+
+
+def test_transcription_key_changes_with_cache_version(tmp_path, monkeypatch):
+    audio = tmp_path / "chunk_000.ogg"
+    audio.write_bytes(b"audio bytes")
+    client = AzureOpenAIClient()
+
+    def key():
+        return asyncio.run(client._transcription_cache_key([str(audio)], "en"))
+
+    original = key()
+    assert key() == original
+    monkeypatch.setattr(client_module, "_TRANSCRIPTION_CACHE_VERSION", "test-next")
+    assert key() != original
@@ -0,0 +1,52 @@
+import asyncio
+import time
+
+from backend.utils.rate_limit import AsyncRateLimiter
+
+
+def elapsed(coro_factory):
+    async def main():
+        start = time.monotonic()
+        await coro_factory()
+        return time.monotonic() - start
+
+    return asyncio.run(main())
+
+
+def test_full_bucket_allows_a_burst():
+    limiter = AsyncRateLimiter(20, period=1.0)
+
+    async def burst():
+        for _ in range(20):
+            await limiter.acquire()
+
+    assert elapsed(burst) < 0.1
+
+
+def test_acquisitions_past_the_burst_are_paced():
+    limiter = AsyncRateLimiter(20, period=1.0)
+
+    async def drain():
+        await asyncio.gather(*(limiter.acquire() for _ in range(30)))
+
+    # 10 acquisitions beyond the burst at 20 per second
+    assert 0.45 <= elapsed(drain) < 1.0
+
+
+def test_weighted_acquire_waits_for_enough_tokens():
+    limiter = AsyncRateLimiter(10, period=1.0)
+
+    async def weighted():
+        await limiter.acquire(10)
+        await limiter.acquire(5)
+
+    assert 0.45 <= elapsed(weighted) < 1.0
+
+
+def test_requests_above_capacity_are_clamped():
+    limiter = AsyncRateLimiter(5, period=1.0)
+
+    async def oversized():
+        await limiter.acquire(50)
+
+    assert elapsed(oversized) < 0.1
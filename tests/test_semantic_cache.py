@@ -0,0 +1,64 @@
+import numpy as np
+
+from backend.services.semantic_cache import SemanticCache
+
+
+def test_lookup_hits_at_or_above_threshold():
+    cache = SemanticCache(threshold=0.95)
+    bucket = SemanticCache.make_bucket("gpt-4o", 0.3, "context")
+    cache.store(bucket, [1.0, 0.0, 0.0], "cached answer")
+
+    # cosine ~0.999 and exactly 1.0 (scale does not matter)
+    assert cache.lookup(bucket, [1.0, 0.05, 0.0]) == "cached answer"
+    assert cache.lookup(bucket, [2.0, 0.0, 0.0]) == "cached answer"
+    assert (cache.hits, cache.misses) == (2, 0)
+
+
+def test_lookup_misses_below_threshold():
+    cache = SemanticCache(threshold=0.95)
+    bucket = SemanticCache.make_bucket("gpt-4o", 0.3, "context")
+    cache.store(bucket, [1.0, 0.0, 0.0], "cached answer")
+
+    # cosine ~0.707
+    assert cache.lookup(bucket, [1.0, 1.0, 0.0]) is None
+    assert (cache.hits, cache.misses) == (0, 1)
+
+
+def test_lookup_returns_the_most_similar_entry():
+    cache = SemanticCache(threshold=0.9)
+    bucket = SemanticCache.make_bucket("bucket")
+    cache.store(bucket, [1.0, 0.0], "first")
+    cache.store(bucket, [0.0, 1.0], "second")
+
+    assert cache.lookup(bucket, np.array([0.1, 1.0])) == "second"
+
+
+def test_buckets_never_share_entries():
+    cache = SemanticCache(threshold=0.95)
+    cache.store(SemanticCache.make_bucket("gpt-4o", 0.3, "context a"), [1.0, 0.0], "answer a")
+
+    assert cache.lookup(SemanticCache.make_bucket("gpt-4o", 0.3, "context b"), [1.0, 0.0]) is None
+
+
+def test_least_recently_used_bucket_is_evicted():
+    cache = SemanticCache(threshold=0.95, max_buckets=2)
+    cache.store("a", [1.0, 0.0], "answer a")
+    cache.store("b", [1.0, 0.0], "answer b")
+    # Using "a" makes "b" the least recently used bucket
+    assert cache.lookup("a", [1.0, 0.0]) == "answer a"
+    cache.store("c", [1.0, 0.0], "answer c")
+
+    assert cache.lookup("b", [1.0, 0.0]) is None
+    assert cache.lookup("a", [1.0, 0.0]) == "answer a"
+    assert cache.lookup("c", [1.0, 0.0]) == "answer c"
+
+
+def test_oldest_entries_are_evicted_past_bucket_size():
+    cache = SemanticCache(threshold=0.99, max_entries_per_bucket=2)
+    cache.store("bucket", [1.0, 0.0, 0.0], "first")
+    cache.store("bucket", [0.0, 1.0, 0.0], "second")
+    cache.store("bucket", [0.0, 0.0, 1.0], "third")
+
+    assert cache.lookup("bucket", [1.0, 0.0, 0.0]) is None
+    assert cache.lookup("bucket", [0.0, 1.0, 0.0]) == "second"
+    assert cache.lookup("bucket", [0.0, 0.0, 1.0]) == "third"
@@ -0,0 +1,60 @@
+import asyncio
+import shutil
+import subprocess
+
+import pytest
+
+from backend.services.audio_processor import WHISPER_CODEC_ARGS
+from backend.services.azure_openai_client import AzureOpenAIClient
+from backend.services.llm_cache import LLMResultCache
+
+needs_ffmpeg = pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+
+
+def segment_tone(out_dir):
+    out_dir.mkdir()
+    subprocess.run(
+        [
+            "ffmpeg", "-hide_banner", "-loglevel", "error",
+            "-f", "lavfi", "-i", "sine=frequency=440:duration=6",
+            *WHISPER_CODEC_ARGS,
+            "-f", "segment",
+            "-segment_time", "2",
+            "-reset_timestamps", "1",
+            "-y",
+            str(out_dir / "chunk_%03d.ogg"),
+        ],
+        check=True,
+    )
+    return [str(path) for path in sorted(out_dir.glob("chunk_*.ogg"))]
+
+
+@needs_ffmpeg
+def test_resegmented_chunks_are_byte_identical(tmp_path):
+    first = segment_tone(tmp_path / "first")
+    second = segment_tone(tmp_path / "second")
+
+    assert len(first) == len(second) > 1
+    assert LLMResultCache.digest_files(first) == LLMResultCache.digest_files(second)
+
+
+@needs_ffmpeg
+def test_second_chunked_transcription_hits_result_cache(tmp_path, monkeypatch):
+    client = AzureOpenAIClient()
+    client.result_cache = LLMResultCache(str(tmp_path / "llm_cache.sqlite3"))
+    calls = []
+
+    async def fake_transcribe(audio_file_path, language="en", time_offset=0.0):
+        calls.append(audio_file_path)
+        return {"full_text": "hello", "segments": [{"text": "hello"}]}
+
+    monkeypatch.setattr(client, "_transcribe_single_file", fake_transcribe)
+
+    first = asyncio.run(client.transcribe_audio_chunks(segment_tone(tmp_path / "first")))
+    transcribed = len(calls)
+    second = asyncio.run(client.transcribe_audio_chunks(segment_tone(tmp_path / "second")))
+
+    assert transcribed == 3
+    assert len(calls) == transcribed
+    assert second == first
+    assert client.result_cache.hits == 1
@@ -0,0 +1,51 @@
+from types import SimpleNamespace
+
+from backend.utils import ttl_cache
+from backend.utils.ttl_cache import TTLCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(ttl_cache, "time", SimpleNamespace(monotonic=clock.monotonic))
+    cache = TTLCache(maxsize=4, ttl=30.0)
+    cache.put("session", {"id": "session"})
+
+    clock.now += 29.0
+    assert cache.get("session") == {"id": "session"}
+    clock.now += 2.0
+    assert cache.get("session") is None
+    assert "session" not in cache._data
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(maxsize=2, ttl=60.0)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    # Reading "a" makes "b" the least recently used entry
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_pop_and_clear():
+    cache = TTLCache(maxsize=4, ttl=60.0)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.pop("a")
+    cache.pop("missing")
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+    cache.clear()
+    assert cache.get("b") is None
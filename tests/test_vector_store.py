@@ -0,0 +1,224 @@
+import asyncio
+
+import numpy as np
+import orjson
+import pytest
+
+from backend.services.vector_store import (
+    MAX_BATCH_BYTES,
+    MAX_BATCH_OPERATIONS,
+    VectorSegment,
+    VectorStore,
+)
+
+DIM = 16
+
+
+def make_segment(session_id, index, speaker_name=None, country=None, text=""):
+    return VectorSegment(
+        id=f"{session_id}_seg_{index}",
+        session_id=session_id,
+        session_title=f"Session {session_id}",
+        session_date="2025-01-01",
+        segment_index=index,
+        speaker_id=None,
+        speaker_name=speaker_name,
+        country=country,
+        text=text or f"{session_id} segment {index}",
+        start_time=None,
+        end_time=None,
+        metadata={},
+    )
+
+
+def make_session(session_id, count, **fields):
+    return [make_segment(session_id, idx, **fields) for idx in range(count)]
+
+
+def one_hot(position):
+    # Distinct unit vectors, so a segment's own embedding scores 1.0 against
+    # itself and 0.0 against every other segment
+    vector = np.zeros(DIM, dtype=np.float32)
+    vector[position] = 1.0
+    return vector
+
+
+def assert_rows_aligned(store, embedding_of):
+    assert len(store.embeddings_matrix) == len(store.segments)
+    for segment, row in zip(store.segments, store.embeddings_matrix):
+        np.testing.assert_allclose(row, embedding_of[segment.id])
+
+
+def test_add_delete_add_keeps_rows_aligned_with_segments():
+    store = VectorStore()
+    embedding_of = {}
+    position = 0
+    for session_id, count in (("a", 3), ("b", 2)):
+        segments = make_session(session_id, count)
+        embeddings = []
+        for segment in segments:
+            embedding_of[segment.id] = one_hot(position)
+            embeddings.append(embedding_of[segment.id])
+            position += 1
+        store.add_segments(segments, embeddings)
+
+    store.delete_session_segments("a")
+    assert [s.session_id for s in store.segments] == ["b", "b"]
+
+    segments = make_session("c", 3)
+    embeddings = []
+    for segment in segments:
+        embedding_of[segment.id] = one_hot(position)
+        embeddings.append(embedding_of[segment.id])
+        position += 1
+    store.add_segments(segments, embeddings)
+
+    assert_rows_aligned(store, embedding_of)
+    for segment in store.segments:
+        results = store.search(embedding_of[segment.id], top_k=1, session_id=segment.session_id)
+        assert len(results) == 1
+        found, score = results[0]
+        assert found.id == segment.id
+        assert score == pytest.approx(1.0)
+
+
+def test_add_segments_normalizes_rows_and_survives_buffer_growth():
+    store = VectorStore()
+    rng = np.random.default_rng(0)
+    first = rng.normal(size=(1000, DIM)).astype(np.float32)
+    store.add_segments(make_session("a", 1000), first)
+    # Past the initial capacity, so the buffer is reallocated
+    second = rng.normal(size=(100, DIM)).astype(np.float32)
+    store.add_segments(make_session("b", 100), second)
+
+    expected = np.vstack([first, second])
+    expected /= np.linalg.norm(expected, axis=1, keepdims=True)
+    np.testing.assert_allclose(store.embeddings_matrix, expected, rtol=1e-6)
+    assert store.get_stats()["embedding_dimension"] == DIM
+
+
+def test_add_segments_rejects_mismatched_inputs():
+    store = VectorStore()
+    with pytest.raises(ValueError):
+        store.add_segments(make_session("a", 2), [one_hot(0)])
+
+
+def test_get_stats_counts_sessions_after_delete():
+    store = VectorStore()
+    store.add_segments(make_session("a", 2), [one_hot(0), one_hot(1)])
+    store.add_segments(make_session("b", 2), [one_hot(2), one_hot(3)])
+    assert store.get_stats()["unique_sessions"] == 2
+
+    store.delete_session_segments("a")
+    stats = store.get_stats()
+    assert stats["total_segments"] == 2
+    assert stats["unique_sessions"] == 1
+
+    store.delete_session_segments("b")
+    assert store.get_stats()["unique_sessions"] == 0
+
+
+def filtered_store():
+    store = VectorStore()
+    store.add_segments(
+        [
+            make_segment("a", 0, speaker_name="Alice", country="Kenya"),
+            make_segment("a", 1, speaker_name="Bob", country="Chile"),
+            make_segment("b", 0, speaker_name="Alice", country="Chile"),
+            make_segment("b", 1, speaker_name=None, country=None),
+        ],
+        [one_hot(0), one_hot(1), one_hot(2), one_hot(3)],
+    )
+    return store
+
+
+def test_filter_on_value_never_stored_returns_nothing():
+    store = filtered_store()
+    query = np.ones(DIM, dtype=np.float32)
+    assert store.search(query, session_id="missing") == []
+    assert store.search(query, speaker_name="Nobody") == []
+    assert store.search(query, country="Atlantis", session_id="a") == []
+    assert store.get_session_segments("missing") == []
+    store.delete_session_segments("missing")
+    assert len(store.segments) == 4
+
+
+def ids(results):
+    return sorted(segment.id for segment, _ in results)
+
+
+def test_filters_combine_on_encoded_columns():
+    store = filtered_store()
+    query = np.ones(DIM, dtype=np.float32)
+
+    assert ids(store.search(query, speaker_name="Alice")) == ["a_seg_0", "b_seg_0"]
+    assert ids(store.search(query, country="Chile")) == ["a_seg_1", "b_seg_0"]
+    assert ids(store.search(query, speaker_name="Alice", country="Chile")) == ["b_seg_0"]
+    assert ids(store.search(query, session_id="b", country="Kenya")) == []
+    assert [s.id for s in store.get_session_segments("b")] == ["b_seg_0", "b_seg_1"]
+
+
+def test_filters_still_match_after_delete_and_readd():
+    store = filtered_store()
+    store.delete_session_segments("a")
+    # A value whose code outlived its rows is encoded again on re-add
+    store.add_segments(
+        [make_segment("a", 0, speaker_name="Bob", country="Kenya")],
+        [one_hot(4)],
+    )
+
+    results = store.search(one_hot(4), speaker_name="Bob")
+    assert [(segment.id, segment.session_id) for segment, _ in results] == [("a_seg_0", "a")]
+    assert [s.id for s in store.get_session_segments("a")] == ["a_seg_0"]
+
+
+class RecordingContainer:
+    def __init__(self):
+        self.batches = []
+
+    async def execute_item_batch(self, batch_operations, partition_key):
+        self.batches.append((partition_key, batch_operations))
+
+
+def test_save_to_cosmos_packs_batches_under_limits():
+    store = VectorStore()
+    rng = np.random.default_rng(0)
+    small = make_session("a", 250)
+    # About 400 KB each, so only four fit under the batch byte limit
+    large = make_session("b", 10, text="x" * 400_000)
+    store.add_segments(small, rng.normal(size=(250, DIM)))
+    store.add_segments(large, rng.normal(size=(10, DIM)))
+
+    container = RecordingContainer()
+    saved = asyncio.run(store.save_to_cosmos(container))
+
+    assert saved == 260
+    sizes = {"a": [], "b": []}
+    saved_ids = []
+    for partition_key, operations in container.batches:
+        bodies = [body for op, (body,) in operations if op == "upsert"]
+        assert len(bodies) == len(operations)
+        assert len(bodies) <= MAX_BATCH_OPERATIONS
+        assert sum(len(orjson.dumps(body)) for body in bodies) <= MAX_BATCH_BYTES
+        assert {body["session_id"] for body in bodies} == {partition_key}
+        assert all(len(body["embedding"]) == DIM for body in bodies)
+        sizes[partition_key].append(len(bodies))
+        saved_ids.extend(body["id"] for body in bodies)
+
+    assert sorted(sizes["a"]) == [50, 100, 100]
+    assert sorted(sizes["b"]) == [2, 4, 4]
+    assert sorted(saved_ids) == sorted(segment.id for segment in store.segments)
+
+
+def test_save_to_cosmos_counts_only_successful_batches():
+    class FailingContainer(RecordingContainer):
+        async def execute_item_batch(self, batch_operations, partition_key):
+            if partition_key == "b":
+                raise RuntimeError("batch rejected")
+            await super().execute_item_batch(batch_operations, partition_key)
+
+    store = VectorStore()
+    store.add_segments(make_session("a", 3), [one_hot(0), one_hot(1), one_hot(2)])
+    store.add_segments(make_session("b", 2), [one_hot(3), one_hot(4)])
+
+    assert asyncio.run(store.save_to_cosmos(FailingContainer())) == 3